@@ -0,0 +1,30 @@
+"""Record tick timestamps of price anchors
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Time the anchoring price was observed; NULL for rows created before
+    op.add_column('comments', sa.Column('price_tick_at', sa.DateTime(), nullable=True))
+    op.add_column('predictions', sa.Column('price_tick_at', sa.DateTime(), nullable=True))
+    op.add_column('votes', sa.Column('price_tick_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('votes', 'price_tick_at')
+    op.drop_column('predictions', 'price_tick_at')
+    op.drop_column('comments', 'price_tick_at')
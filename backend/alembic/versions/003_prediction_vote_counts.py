@@ -0,0 +1,39 @@
+"""Materialized per-option vote counters
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'prediction_vote_counts',
+        sa.Column('prediction_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('predictions.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('option_key', sa.String(1), primary_key=True),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    # Backfill counters from existing votes
+    op.execute("""
+        INSERT INTO prediction_vote_counts (prediction_id, option_key, count)
+        SELECT prediction_id, selected_option, COUNT(*)
+        FROM votes
+        GROUP BY prediction_id, selected_option
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('prediction_vote_counts')
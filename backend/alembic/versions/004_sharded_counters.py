@@ -0,0 +1,70 @@
+"""Sharded counters for vote counts and comment likes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing per-option counters become shard 0
+    op.add_column('prediction_vote_counts', sa.Column('shard', sa.SmallInteger(), nullable=False, server_default='0'))
+    op.add_column('prediction_vote_counts', sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()))
+    op.drop_constraint('prediction_vote_counts_pkey', 'prediction_vote_counts', type_='primary')
+    op.create_primary_key('prediction_vote_counts_pkey', 'prediction_vote_counts', ['prediction_id', 'option_key', 'shard'])
+    # The counter rollup looks up recently changed shards
+    op.create_index('idx_prediction_vote_counts_updated', 'prediction_vote_counts', ['updated_at'])
+
+    op.create_table(
+        'counter_shards',
+        sa.Column('name', sa.String(50), primary_key=True),
+        sa.Column('entity_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('shard', sa.SmallInteger(), primary_key=True),
+        sa.Column('value', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index('idx_counter_shards_updated', 'counter_shards', ['name', 'updated_at'])
+
+    # Backfill like counters from the existing likes
+    op.execute("""
+        INSERT INTO counter_shards (name, entity_id, shard, value)
+        SELECT 'comment_likes', comment_id, 0, COUNT(*)
+        FROM comment_likes
+        GROUP BY comment_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_counter_shards_updated', table_name='counter_shards')
+    op.drop_table('counter_shards')
+
+    # Fold shards back into shard 0
+    op.execute("""
+        CREATE TEMP TABLE vote_count_totals AS
+        SELECT prediction_id, option_key, SUM(count) AS count
+        FROM prediction_vote_counts
+        GROUP BY prediction_id, option_key
+    """)
+    op.execute("DELETE FROM prediction_vote_counts")
+    op.execute("""
+        INSERT INTO prediction_vote_counts (prediction_id, option_key, shard, count)
+        SELECT prediction_id, option_key, 0, count FROM vote_count_totals
+    """)
+    op.execute("DROP TABLE vote_count_totals")
+    op.drop_constraint('prediction_vote_counts_pkey', 'prediction_vote_counts', type_='primary')
+    op.create_primary_key('prediction_vote_counts_pkey', 'prediction_vote_counts', ['prediction_id', 'option_key'])
+    op.drop_index('idx_prediction_vote_counts_updated', table_name='prediction_vote_counts')
+    op.drop_column('prediction_vote_counts', 'updated_at')
+    op.drop_column('prediction_vote_counts', 'shard')
@@ -0,0 +1,75 @@
+"""Full-text search vectors for comments and news
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.text_search import TS_CONFIG, search_document
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows segmented per backfill batch
+BATCH_SIZE = 1000
+
+
+def _weighted(column: str, weight: str):
+    return sa.func.setweight(
+        postgresql.to_tsvector(TS_CONFIG, sa.bindparam(f'{column}_doc')), sa.literal_column(f"'{weight}'")
+    )
+
+
+def _backfill(table, columns, vector) -> None:
+    """Segment existing rows in Python (the tokenizer is not in SQL) in keyset batches"""
+    bind = op.get_bind()
+    stmt = sa.update(table).where(table.c.id == sa.bindparam('row_id')).values(search_vector=vector)
+
+    last_id = None
+    while True:
+        query = sa.select(table.c.id, *[table.c[c] for c in columns]).order_by(table.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        bind.execute(stmt, [
+            {'row_id': row.id, **{f'{c}_doc': search_document(getattr(row, c)) for c in columns}}
+            for row in rows
+        ])
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    op.add_column('comments', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.add_column('news', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    comments = sa.table('comments', sa.column('id', postgresql.UUID(as_uuid=True)), sa.column('content'), sa.column('search_vector'))
+    news = sa.table('news', sa.column('id', postgresql.UUID(as_uuid=True)), sa.column('title'), sa.column('summary'), sa.column('content'), sa.column('search_vector'))
+
+    _backfill(comments, ['content'], _weighted('content', 'D'))
+    _backfill(
+        news,
+        ['title', 'summary', 'content'],
+        _weighted('title', 'A').op('||')(_weighted('summary', 'B')).op('||')(_weighted('content', 'D')),
+    )
+
+    # GIN indexes are built after the backfill, once
+    op.create_index('idx_comments_search', 'comments', ['search_vector'], postgresql_using='gin')
+    op.create_index('idx_news_search', 'news', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_news_search', table_name='news')
+    op.drop_index('idx_comments_search', table_name='comments')
+    op.drop_column('news', 'search_vector')
+    op.drop_column('comments', 'search_vector')
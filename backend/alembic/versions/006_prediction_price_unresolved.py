@@ -0,0 +1,27 @@
+"""Flag predictions whose deadline price could not be found
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Set by the verifier when no price exists for the deadline; the
+    # prediction keeps its verify_rule and waits for a moderator
+    op.add_column('predictions', sa.Column('price_unresolved_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('predictions', 'price_unresolved_at')
@@ -1,7 +1,7 @@
 """API v1 router"""
 from fastapi import APIRouter
 
-from app.api.v1 import auth, users, quotes, comments, predictions
+from app.api.v1 import auth, users, quotes, comments, predictions, leaderboard, admin, search
 
 api_router = APIRouter()
 
@@ -11,5 +11,8 @@ api_router.include_router(users.router)
 api_router.include_router(quotes.router)
 api_router.include_router(comments.router)
 api_router.include_router(predictions.router)
+api_router.include_router(leaderboard.router)
+api_router.include_router(admin.router)
+api_router.include_router(search.router)
 
 __all__ = ["api_router"]
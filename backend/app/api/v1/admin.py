@@ -0,0 +1,167 @@
+"""Moderator API endpoints"""
+from collections import defaultdict
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+import redis.asyncio as redis
+
+from app.core.database import AsyncSessionLocal, get_db
+from app.core.deps import get_admin_user
+from app.core.config import settings
+from app.models.prediction import Prediction
+from app.models.user import User
+from app.repositories.quote_repository import QuoteRepository
+from app.repositories.settlement_repository import SettlementRepository
+from app.schemas.backtest import (
+    PredictionBacktestRequest,
+    PredictionBacktestResponse,
+    PredictionResolution,
+    TemplateBacktestRequest,
+    TemplateBacktestResponse,
+)
+from app.services import prediction_cache
+from app.services.backtest import backtest_template, load_candles, resolve_predictions
+from app.services.market_data_client import market_data_client
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+async def get_redis_client():
+    """Get Redis client"""
+    client = redis.from_url(settings.REDIS_URL, decode_responses=False)
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+def get_settlement_repository() -> SettlementRepository:
+    """Get settlement repository"""
+    return SettlementRepository(AsyncSessionLocal)
+
+
+def get_quote_repository() -> QuoteRepository:
+    """Get quote repository"""
+    return QuoteRepository(AsyncSessionLocal)
+
+
+@router.post("/backtest/templates", response_model=TemplateBacktestResponse)
+async def backtest_templates(
+    request: TemplateBacktestRequest,
+    admin: User = Depends(get_admin_user)
+):
+    """
+    Preview how condition templates would have resolved in the past.
+
+    Every template is evaluated for a prediction created at each candle of
+    the symbol's history, vectorized over all windows.
+    """
+    candles = await load_candles(
+        market_data_client, request.symbol_code, request.interval, request.outputsize
+    )
+    if not len(candles):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Unable to fetch historical data"
+        )
+
+    results = [
+        backtest_template(
+            candles,
+            {key: c.condition for key, c in template.conditions.items()},
+            template.horizon_minutes * 60,
+            request.step,
+        )
+        for template in request.templates
+    ]
+
+    return TemplateBacktestResponse(candles=len(candles), results=results)
+
+
+@router.post("/backtest/predictions", response_model=PredictionBacktestResponse)
+async def backtest_predictions(
+    request: PredictionBacktestRequest,
+    admin: User = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client),
+    settlement_repository: SettlementRepository = Depends(get_settlement_repository),
+    quote_repository: QuoteRepository = Depends(get_quote_repository)
+):
+    """
+    Re-resolve predictions against historical prices.
+
+    Deadlines are priced the way the verifier prices them: the stored tick
+    at the deadline, otherwise the last 1min candle closed before it.
+    Deadlines outside the returned candles stay unresolved and are never
+    re-settled.
+
+    With ``apply`` ended predictions whose outcome differs are re-settled:
+    the prediction and its votes are corrected and the voters' statistics
+    are repaired by the next stats recompute. The day buckets of the
+    daily/weekly/monthly leaderboards follow at the next LeaderboardRebuildJob
+    run, which rebuilds them from the votes.
+    """
+    # Coarser candles would write a close up to one interval old as the price
+    if request.apply and request.interval != "1min":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Re-settlement requires 1min candles"
+        )
+
+    stmt = select(
+        Prediction.id,
+        Prediction.symbol_code,
+        Prediction.price_at_create,
+        Prediction.verify_time,
+        Prediction.auto_verify_conditions,
+        Prediction.correct_option,
+        Prediction.status,
+    ).where(
+        Prediction.id.in_(request.prediction_ids),
+        Prediction.auto_verify_conditions.is_not(None)
+    )
+    result = await db.execute(stmt)
+
+    by_symbol = defaultdict(list)
+    for row in result.mappings().all():
+        by_symbol[row["symbol_code"]].append(dict(row))
+
+    # One provider call per symbol
+    resolutions = []
+    statuses = {}
+    for symbol_code, predictions in by_symbol.items():
+        candles = await load_candles(
+            market_data_client, symbol_code, request.interval, request.outputsize
+        )
+        stored_prices = await quote_repository.prices_at(
+            symbol_code,
+            [p["verify_time"] for p in predictions],
+            settings.PRICE_AT_VERIFY_MAX_GAP_SECONDS,
+        )
+        resolutions.extend(resolve_predictions(candles, predictions, stored_prices))
+        statuses.update({p["id"]: p["status"] for p in predictions})
+
+    resettled = 0
+    results = []
+    for resolution in resolutions:
+        applied = False
+        if (
+            request.apply
+            and resolution["differs"]
+            and resolution["price_at_verify"] is not None
+            and statuses[resolution["prediction_id"]] == "ended"
+        ):
+            applied = await settlement_repository.resettle(
+                resolution["prediction_id"],
+                resolution["price_at_verify"],
+                resolution["correct_option"],
+            ) is not None
+            resettled += applied
+        results.append(PredictionResolution(**resolution, resettled=applied))
+
+    if resettled:
+        await prediction_cache.invalidate_documents(
+            redis_client, [r.prediction_id for r in results if r.resettled]
+        )
+
+    return PredictionBacktestResponse(results=results, resettled=resettled)
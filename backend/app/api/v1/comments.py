@@ -1,14 +1,17 @@
 """Comment API endpoints"""
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import delete, select, and_, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import joinedload
 import redis.asyncio as redis
 
 from app.core.database import get_db
 from app.core.deps import get_current_user, get_optional_current_user
 from app.core.config import settings
+from app.core.pagination import cached_total, keyset_page, split_page
 from app.models.user import User
 from app.models.comment import Comment, CommentLike
 from app.schemas.comment import (
@@ -18,10 +21,17 @@ from app.schemas.comment import (
     CommentLikeResponse,
     CommentListResponse
 )
-from app.services.market_data_service import MarketDataService
+from app.services.comment_likes import comment_likes
+from app.services.feed_cache import ALL_SYMBOLS, comment_feed
+from app.services.hot_comments import TOP_K, hot_comments
+from app.services.sharded_counter import comment_likes_counter
+from app.services.tick_store import tick_store
 
 router = APIRouter(prefix="/comments", tags=["Comments"])
 
+# Replies embedded under each top-level comment in list responses
+PREVIEW_REPLIES = 5
+
 
 async def get_redis_client():
     """Get Redis client"""
@@ -32,6 +42,129 @@ async def get_redis_client():
         await client.close()
 
 
+async def _get_reply_previews(
+    db: AsyncSession, parent_ids: List[UUID]
+) -> Dict[UUID, List[CommentResponse]]:
+    """Get the first replies (with authors) of several comments in one windowed query"""
+    if not parent_ids:
+        return {}
+
+    ranked = select(
+        Comment.id,
+        func.row_number().over(
+            partition_by=Comment.parent_id,
+            order_by=(Comment.created_at.asc(), Comment.id.asc())
+        ).label("position")
+    ).where(
+        and_(
+            Comment.parent_id.in_(parent_ids),
+            Comment.is_deleted == False
+        )
+    ).subquery()
+
+    stmt = select(Comment).join(
+        ranked, ranked.c.id == Comment.id
+    ).where(
+        ranked.c.position <= PREVIEW_REPLIES
+    ).order_by(
+        Comment.parent_id, ranked.c.position
+    ).options(joinedload(Comment.user))
+    result = await db.execute(stmt)
+
+    previews: Dict[UUID, List[CommentResponse]] = {}
+    for reply in result.scalars().all():
+        previews.setdefault(reply.parent_id, []).append(CommentResponse.model_validate(reply))
+    return previews
+
+
+async def _apply_like_counts(
+    db: AsyncSession,
+    redis_client: Optional[redis.Redis],
+    comments: List[CommentResponse],
+    user_id: Optional[UUID] = None,
+) -> None:
+    """
+    Set likes_count (and user_liked for a signed-in viewer) on comments and their replies.
+
+    Loaded like sets answer in one pipeline; other comments fall back to
+    the (cached) sharded totals and the viewer's rows in ``comment_likes``.
+    """
+    all_comments = list(comments)
+    for comment in comments:
+        all_comments.extend(getattr(comment, "replies", []))
+    comment_ids = list({c.id for c in all_comments})
+    if not comment_ids:
+        return
+
+    counts: Dict[UUID, int] = {}
+    liked: Dict[UUID, bool] = {}
+    if redis_client:
+        try:
+            counts, liked = await comment_likes.counts(redis_client, comment_ids, user_id)
+        except Exception as e:
+            print(f"Redis like read error: {e}")
+
+    totals = await comment_likes_counter.totals(
+        db, [i for i in comment_ids if i not in counts], redis_client
+    )
+    counts.update(totals)
+
+    if user_id:
+        unloaded = [i for i in comment_ids if i not in liked]
+        if unloaded:
+            result = await db.execute(
+                select(CommentLike.comment_id).where(
+                    and_(
+                        CommentLike.user_id == user_id,
+                        CommentLike.comment_id.in_(unloaded)
+                    )
+                )
+            )
+            liked.update({i: False for i in unloaded})
+            liked.update({i: True for i in result.scalars().all()})
+
+    for comment in all_comments:
+        comment.likes_count = counts.get(comment.id, 0)
+        if user_id:
+            comment.user_liked = liked[comment.id]
+
+
+async def _get_comment_page(
+    db: AsyncSession,
+    stmt,
+    limit: int,
+    cursor: Optional[str],
+    page: int,
+) -> Tuple[List[CommentWithReplies], Optional[str]]:
+    """Query a page of top-level comments with their authors and reply previews"""
+    # Newest first, starting after the cursor
+    try:
+        page_stmt = keyset_page(stmt, Comment.created_at, Comment.id, limit, cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    # Legacy page numbers fall back to OFFSET
+    if page > 1 and not cursor:
+        page_stmt = page_stmt.offset((page - 1) * limit)
+
+    result = await db.execute(page_stmt.options(joinedload(Comment.user)))
+    comments, next_cursor = split_page(result.scalars().all(), limit)
+
+    previews = await _get_reply_previews(db, [c.id for c in comments])
+
+    responses = [
+        CommentWithReplies(
+            **CommentResponse.model_validate(c).model_dump(),
+            replies=previews.get(c.id, [])
+        )
+        for c in comments
+    ]
+    return responses, next_cursor
+
+
 @router.post("/", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
 async def create_comment(
     comment_data: CommentCreate,
@@ -40,11 +173,10 @@ async def create_comment(
     redis_client: redis.Redis = Depends(get_redis_client)
 ):
     """Create a new comment (price-anchored)"""
-    # Get current price for the symbol
-    market_service = MarketDataService(db, redis_client)
-    quote = await market_service.get_quote(comment_data.symbol_code)
+    # Anchor to the latest tick; never call the provider on the write path
+    tick = await tick_store.get_anchor(comment_data.symbol_code, redis_client)
 
-    if not quote:
+    if not tick:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Unable to fetch current price"
@@ -55,7 +187,8 @@ async def create_comment(
         user_id=current_user.id,
         symbol_code=comment_data.symbol_code,
         content=comment_data.content,
-        price_at_comment=quote["price"],
+        price_at_comment=tick.price,
+        price_tick_at=tick.timestamp,
         parent_id=comment_data.parent_id
     )
 
@@ -72,6 +205,11 @@ async def create_comment(
     await db.commit()
     await db.refresh(comment)
 
+    # New comments and reply previews change the symbol's first page
+    await comment_feed.invalidate(redis_client, [comment.symbol_code])
+    if comment_data.parent_id:
+        await hot_comments.mark_dirty(redis_client, [comment_data.parent_id])
+
     # Load user relationship
     await db.refresh(comment, ["user"])
 
@@ -82,12 +220,22 @@ async def create_comment(
 async def get_comments(
     symbol: Optional[str] = Query(None, description="Filter by symbol"),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    page: int = Query(1, ge=1, deprecated=True, description="Use cursor instead"),
     limit: int = Query(20, ge=1, le=100),
+    include_total: bool = Query(False, description="Include a (cached) total count"),
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client)
 ):
-    """Get comments with pagination"""
+    """
+    Get top-level comments, newest first, with cursor pagination.
+
+    Authors are joined into the page query and the first replies of all
+    comments on the page come from one windowed query, so a page costs a
+    fixed number of queries. The first page per symbol is cached until a
+    new comment or reply invalidates it.
+    """
     # Build query
     stmt = select(Comment).where(Comment.is_deleted == False)
 
@@ -107,100 +255,185 @@ async def get_comments(
     # Only get top-level comments (not replies)
     stmt = stmt.where(Comment.parent_id == None)
 
-    # Order by creation time (newest first)
-    stmt = stmt.order_by(Comment.created_at.desc())
-
-    # Count total
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar()
-
-    # Apply pagination
-    offset = (page - 1) * limit
-    stmt = stmt.offset(offset).limit(limit)
-
-    result = await db.execute(stmt)
-    comments = result.scalars().all()
-
-    # Load relationships
-    for comment in comments:
-        await db.refresh(comment, ["user"])
-
-        # Load replies
-        replies_stmt = select(Comment).where(
-            and_(
-                Comment.parent_id == comment.id,
-                Comment.is_deleted == False
-            )
-        ).order_by(Comment.created_at.asc()).limit(5)
-
-        replies_result = await db.execute(replies_stmt)
-        replies = replies_result.scalars().all()
+    # Totals are optional and cached; infinite scroll never counts
+    total = None
+    if include_total:
+        total = await cached_total(
+            db,
+            redis_client,
+            f"comments:{symbol or '*'}:{user_id or '*'}",
+            stmt,
+        )
 
-        for reply in replies:
-            await db.refresh(reply, ["user"])
+    # The first page of a symbol is the hottest read: serve it from the feed cache
+    first_page = cursor is None and page == 1 and not user_id
+    scope, variant = symbol or ALL_SYMBOLS, str(limit)
+    cached = await comment_feed.get(redis_client, scope, variant) if first_page else None
 
-        comment.replies = replies
+    if cached:
+        cached_page = CommentListResponse.model_validate_json(cached)
+        responses, next_cursor = cached_page.comments, cached_page.pagination["next_cursor"]
+    else:
+        responses, next_cursor = await _get_comment_page(db, stmt, limit, cursor, page)
+        if first_page:
+            await comment_feed.set(redis_client, scope, variant, CommentListResponse(
+                comments=responses, pagination={"next_cursor": next_cursor}
+            ).model_dump_json())
+
+    # Like counts change on every tap and are never part of the cached page
+    await _apply_like_counts(
+        db, redis_client, responses, current_user.id if current_user else None
+    )
 
     return CommentListResponse(
-        comments=[CommentWithReplies.model_validate(c) for c in comments],
+        comments=responses,
         pagination={
-            "page": page,
             "limit": limit,
-            "total": total,
-            "has_more": (page * limit) < total
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+            "total": total
         }
     )
 
 
-@router.post("/{comment_id}/like", response_model=CommentLikeResponse)
-async def like_comment(
-    comment_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+@router.get("/hot", response_model=list[CommentResponse])
+async def get_hot_comments(
+    symbol_code: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=TOP_K),
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client)
 ):
-    """Like or unlike a comment"""
-    # Check if comment exists
-    stmt = select(Comment).where(Comment.id == comment_id)
+    """
+    Get top-level comments ranked by hotness, for a symbol or overall.
+
+    Likes and replies are scored with the Wilson lower bound and decayed by
+    age; the ranking is a precomputed sorted set, so this is one range read
+    plus a primary key lookup.
+    """
+    try:
+        comment_ids = await hot_comments.top(redis_client, symbol_code, limit)
+    except Exception as e:
+        print(f"Redis hot comments error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Hot comments temporarily unavailable"
+        )
+
+    if not comment_ids:
+        return []
+
+    stmt = select(Comment).where(
+        and_(
+            Comment.id.in_(comment_ids),
+            Comment.is_deleted == False
+        )
+    ).options(joinedload(Comment.user))
     result = await db.execute(stmt)
-    comment = result.scalar_one_or_none()
+    by_id = {c.id: c for c in result.scalars().all()}
+
+    # Comments deleted since the last rescore are left out
+    responses = [
+        CommentResponse.model_validate(by_id[comment_id])
+        for comment_id in comment_ids
+        if comment_id in by_id
+    ]
+    await _apply_like_counts(
+        db, redis_client, responses, current_user.id if current_user else None
+    )
+    return responses
 
-    if not comment:
+
+async def _ensure_comment(db: AsyncSession, comment_id: UUID) -> None:
+    """Raise 404 if the comment does not exist"""
+    result = await db.execute(select(Comment.id).where(Comment.id == comment_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comment not found"
         )
 
-    # Check if already liked
-    like_stmt = select(CommentLike).where(
-        and_(
-            CommentLike.comment_id == comment_id,
-            CommentLike.user_id == current_user.id
+
+@router.post("/{comment_id}/like", response_model=CommentLikeResponse)
+async def like_comment(
+    comment_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client)
+):
+    """
+    Like or unlike a comment.
+
+    Taps toggle the comment's Redis like set and are written to PostgreSQL
+    in batches by CommentLikeFlushJob; the database is only read the first
+    time a comment is liked after its set expired.
+    """
+    user_liked = likes_count = None
+    try:
+        user_liked = await comment_likes.toggle(redis_client, comment_id, current_user.id)
+        if user_liked is None:
+            await _ensure_comment(db, comment_id)
+            await comment_likes.load(db, redis_client, comment_id)
+            user_liked = await comment_likes.toggle(redis_client, comment_id, current_user.id)
+        likes_count = await comment_likes.count(redis_client, comment_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Redis like error: {e}")
+
+    if user_liked is not None:
+        if likes_count is None:
+            # Toggled, but the set could not be counted: flushed likes only
+            totals = await comment_likes_counter.totals(db, [comment_id], redis_client)
+            likes_count = totals[comment_id]
+        return CommentLikeResponse(
+            comment_id=comment_id,
+            likes_count=likes_count,
+            user_liked=user_liked
         )
-    )
-    like_result = await db.execute(like_stmt)
-    existing_like = like_result.scalar_one_or_none()
 
-    if existing_like:
-        # Unlike
-        await db.delete(existing_like)
-        comment.likes_count = max(0, comment.likes_count - 1)
+    # The set may hold this tap or miss the write below: drop it to reload later
+    try:
+        await comment_likes.invalidate(redis_client, comment_id)
+    except Exception as e:
+        print(f"Redis like error: {e}")
+
+    # Without Redis, write through to PostgreSQL
+    await _ensure_comment(db, comment_id)
+
+    unliked = await db.execute(
+        delete(CommentLike).where(
+            and_(
+                CommentLike.comment_id == comment_id,
+                CommentLike.user_id == current_user.id
+            )
+        ).returning(CommentLike.id)
+    )
+    if unliked.first() is not None:
+        await db.execute(comment_likes_counter.increment(comment_id, -1))
         user_liked = False
     else:
-        # Like
-        new_like = CommentLike(
-            comment_id=comment_id,
-            user_id=current_user.id
+        # A concurrent double tap inserts nothing
+        liked = await db.execute(
+            insert(CommentLike).values(
+                comment_id=comment_id,
+                user_id=current_user.id
+            ).on_conflict_do_nothing(
+                index_elements=[CommentLike.comment_id, CommentLike.user_id]
+            ).returning(CommentLike.id)
         )
-        db.add(new_like)
-        comment.likes_count += 1
+        if liked.first() is not None:
+            await db.execute(comment_likes_counter.increment(comment_id, 1))
         user_liked = True
 
     await db.commit()
 
+    # Read our own write past the cache
+    totals = await comment_likes_counter.totals(db, [comment_id], redis_client, fresh=True)
+
     return CommentLikeResponse(
         comment_id=comment_id,
-        likes_count=comment.likes_count,
+        likes_count=totals[comment_id],
         user_liked=user_liked
     )
 
@@ -208,7 +441,9 @@ async def like_comment(
 @router.get("/{comment_id}/replies", response_model=list[CommentResponse])
 async def get_comment_replies(
     comment_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client)
 ):
     """Get all replies for a comment"""
     stmt = select(Comment).where(
@@ -216,13 +451,13 @@ async def get_comment_replies(
             Comment.parent_id == comment_id,
             Comment.is_deleted == False
         )
-    ).order_by(Comment.created_at.asc())
+    ).order_by(Comment.created_at.asc()).options(joinedload(Comment.user))
 
     result = await db.execute(stmt)
     replies = result.scalars().all()
 
-    # Load user relationships
-    for reply in replies:
-        await db.refresh(reply, ["user"])
-
-    return [CommentResponse.model_validate(r) for r in replies]
+    responses = [CommentResponse.model_validate(r) for r in replies]
+    await _apply_like_counts(
+        db, redis_client, responses, current_user.id if current_user else None
+    )
+    return responses
@@ -0,0 +1,113 @@
+"""Leaderboard API endpoints"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+import redis.asyncio as redis
+
+from app.core.database import get_db
+from app.core.deps import get_optional_current_user
+from app.core.config import settings
+from app.models.user import User
+from app.models.user_stats import UserPredictionStats
+from app.schemas.community import LeaderboardEntry, LeaderboardResponse
+from app.schemas.user import UserResponse
+from app.services.leaderboard import leaderboard
+
+router = APIRouter(prefix="/leaderboard", tags=["Leaderboard"])
+
+
+async def get_redis_client():
+    """Get Redis client"""
+    client = redis.from_url(settings.REDIS_URL, decode_responses=False)
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+@router.get("/{board}", response_model=LeaderboardResponse)
+async def get_leaderboard(
+    board: str = Path(..., pattern="^(accuracy|score|streak)$"),
+    limit: int = Query(50, ge=1, le=100),
+    window: str = Query("all", pattern="^(all|daily|weekly|monthly)$"),
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client)
+):
+    """
+    Get the top users of a board and the caller's rank.
+
+    The accuracy board only lists users with at least 10 settled
+    participations. Ranking comes from Redis sorted sets; one query loads
+    the listed users' statistics.
+
+    With a daily, weekly or monthly window (rolling, UTC days) accuracy and
+    score only count predictions due within the window.
+    """
+    if window != "all" and board == "streak":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Streaks have no time window"
+        )
+
+    window_stats = {}
+    try:
+        if window == "all":
+            top = await leaderboard.top(redis_client, board, limit)
+            user_rank = (
+                await leaderboard.rank(redis_client, board, current_user.id)
+                if current_user else None
+            )
+        else:
+            today = datetime.utcnow().date()
+            top = await leaderboard.window_top(redis_client, board, window, limit, today)
+            user_rank = (
+                await leaderboard.window_rank(redis_client, board, window, current_user.id, today)
+                if current_user else None
+            )
+            window_stats = await leaderboard.window_stats(
+                redis_client, window, [user_id for user_id, _ in top], today
+            )
+    except Exception as e:
+        print(f"Redis leaderboard error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Leaderboard temporarily unavailable"
+        )
+
+    user_ids = [user_id for user_id, _ in top]
+    stats = {}
+    if user_ids:
+        stmt = select(UserPredictionStats).where(
+            UserPredictionStats.user_id.in_(user_ids)
+        ).options(joinedload(UserPredictionStats.user))
+        result = await db.execute(stmt)
+        stats = {s.user_id: s for s in result.scalars().all()}
+
+    entries = []
+    for position, user_id in enumerate(user_ids, start=1):
+        user_stats = stats.get(user_id)
+        if user_stats is None:
+            continue  # Removed since the board was written
+        accuracy_rate = user_stats.accuracy_rate
+        participations = user_stats.total_participations
+        if user_id in window_stats:
+            participations, correct = window_stats[user_id]
+            accuracy_rate = (
+                Decimal(correct * 100 / participations).quantize(Decimal("0.01"))
+                if participations else Decimal("0")
+            )
+        entries.append(LeaderboardEntry(
+            rank=position,
+            user=UserResponse.model_validate(user_stats.user),
+            accuracy_rate=accuracy_rate,
+            total_participations=participations,
+            current_streak=user_stats.current_streak,
+            rank_title=user_stats.rank_title,
+        ))
+
+    return LeaderboardResponse(leaderboard=entries, user_rank=user_rank)
@@ -1,27 +1,39 @@
 """Prediction API endpoints"""
-from typing import Optional
-from uuid import UUID
+import json
+import random
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import DateTime, Numeric, SmallInteger, exists, func, literal, select, and_, union_all
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import joinedload
 import redis.asyncio as redis
 
 from app.core.database import get_db
 from app.core.deps import get_current_user, get_optional_current_user
 from app.core.config import settings
+from app.core.pagination import cached_total, keyset_page, split_page
 from app.models.user import User
-from app.models.prediction import Prediction
+from app.models.prediction import Prediction, PredictionVoteCount
 from app.models.vote import Vote
 from app.schemas.prediction import (
     PredictionCreate,
+    PredictionDocument,
     PredictionResponse,
     PredictionWithVotes,
     PredictionListResponse,
     VoteDistribution
 )
 from app.schemas.vote import VoteCreate, VoteResultResponse
-from app.services.market_data_service import MarketDataService
+from app.services import prediction_cache
+from app.services.conditions import compile_conditions
+from app.services.feed_cache import ALL_SYMBOLS, prediction_feed
+from app.services.hot_predictions import hot_predictions
+from app.services.prediction_events import publish_deadline
+from app.services.tick_store import tick_store
 
 router = APIRouter(prefix="/predictions", tags=["Predictions"])
 
@@ -35,6 +47,229 @@ async def get_redis_client():
         await client.close()
 
 
+async def _get_vote_counts(
+    db: AsyncSession, prediction_ids: List[UUID]
+) -> Dict[UUID, Dict[str, int]]:
+    """Get vote counts per option (summed over shards) for several predictions in one query"""
+    if not prediction_ids:
+        return {}
+
+    stmt = select(
+        PredictionVoteCount.prediction_id,
+        PredictionVoteCount.option_key,
+        func.sum(PredictionVoteCount.count).label("count")
+    ).where(
+        PredictionVoteCount.prediction_id.in_(prediction_ids)
+    ).group_by(PredictionVoteCount.prediction_id, PredictionVoteCount.option_key)
+    result = await db.execute(stmt)
+
+    vote_counts: Dict[UUID, Dict[str, int]] = {}
+    for prediction_id, option, count in result.all():
+        vote_counts.setdefault(prediction_id, {})[option] = int(count)
+    return vote_counts
+
+
+async def _get_user_votes(
+    db: AsyncSession, user_id: UUID, prediction_ids: List[UUID]
+) -> Dict[UUID, str]:
+    """Get the options a user voted for on several predictions in one query"""
+    if not prediction_ids:
+        return {}
+
+    stmt = select(Vote.prediction_id, Vote.selected_option).where(
+        and_(
+            Vote.prediction_id.in_(prediction_ids),
+            Vote.user_id == user_id
+        )
+    )
+    result = await db.execute(stmt)
+    return {prediction_id: option for prediction_id, option in result.all()}
+
+
+def _cast_vote(
+    prediction_id: UUID,
+    user_id: UUID,
+    option_key: str,
+    price_at_vote,
+    price_tick_at: Optional[datetime],
+    now: datetime,
+):
+    """
+    Build the single statement that casts a vote.
+
+    Data-modifying CTEs insert the vote (``ON CONFLICT DO NOTHING`` on
+    ``uq_votes_prediction_user``, only while the prediction is open) and
+    increment a random shard of the option counter for an inserted vote.
+    The statement returns the resulting distribution, one
+    ``(option_key, count, voted)`` row per option with votes; ``voted`` is
+    false when no vote was inserted. The prediction row itself is not
+    written, so concurrent votes only contend on counter shards.
+    """
+    vote_values = select(
+        literal(uuid4(), PG_UUID(as_uuid=True)),
+        Prediction.id,
+        literal(user_id, PG_UUID(as_uuid=True)),
+        literal(option_key),
+        literal(price_at_vote, Numeric(20, 8)),
+        literal(price_tick_at, DateTime),
+        literal(now, DateTime),
+    ).where(
+        Prediction.id == prediction_id,
+        Prediction.status == "active",
+        Prediction.verify_time > now,
+    )
+    new_vote = (
+        insert(Vote)
+        .from_select(
+            ["id", "prediction_id", "user_id", "selected_option",
+             "price_at_vote", "price_tick_at", "voted_at"],
+            vote_values,
+            include_defaults=False,
+        )
+        .on_conflict_do_nothing(index_elements=[Vote.prediction_id, Vote.user_id])
+        .returning(Vote.prediction_id, Vote.selected_option)
+        .cte("new_vote")
+    )
+
+    increment = insert(PredictionVoteCount).from_select(
+        ["prediction_id", "option_key", "shard", "count", "updated_at"],
+        select(
+            new_vote.c.prediction_id,
+            new_vote.c.selected_option,
+            literal(random.randrange(settings.COUNTER_SHARDS), SmallInteger),
+            literal(1),
+            literal(now, DateTime),
+        ),
+        include_defaults=False,
+    )
+    counted = increment.on_conflict_do_update(
+        index_elements=[
+            PredictionVoteCount.prediction_id,
+            PredictionVoteCount.option_key,
+            PredictionVoteCount.shard,
+        ],
+        set_={
+            "count": PredictionVoteCount.count + increment.excluded.count,
+            "updated_at": increment.excluded.updated_at,
+        }
+    ).cte("counted")
+
+    # CTEs see the snapshot before the statement: add the new vote to the
+    # stored shards instead of reading the upsert's result
+    counts = union_all(
+        select(PredictionVoteCount.option_key, PredictionVoteCount.count).where(
+            PredictionVoteCount.prediction_id == prediction_id
+        ),
+        select(new_vote.c.selected_option, literal(1)),
+    ).subquery()
+
+    return select(
+        counts.c.option_key,
+        func.sum(counts.c.count).label("count"),
+        exists(select(new_vote.c.prediction_id)).label("voted"),
+    ).group_by(counts.c.option_key).add_cte(counted)
+
+
+def _build_vote_distribution(
+    options: List[dict], vote_counts: Dict[str, int]
+) -> Dict[str, VoteDistribution]:
+    """Build the per-option vote distribution of a prediction"""
+    total_votes = sum(vote_counts.values())
+    vote_distribution = {}
+
+    for option in options:
+        count = vote_counts.get(option["key"], 0)
+        percentage = (count / total_votes * 100) if total_votes > 0 else 0
+        vote_distribution[option["key"]] = VoteDistribution(
+            count=count,
+            percentage=round(percentage, 2)
+        )
+
+    return vote_distribution
+
+
+def _build_document(
+    prediction: Prediction, vote_counts: Dict[str, int]
+) -> PredictionDocument:
+    """Combine a prediction with its vote statistics into the shared document"""
+    # Counters are sharded; the participants_count column is only rolled up periodically
+    fields = {**prediction.__dict__, "participants_count": sum(vote_counts.values())}
+
+    return PredictionDocument(
+        **fields,
+        vote_distribution=_build_vote_distribution(prediction.options, vote_counts)
+    )
+
+
+def _personalize(
+    document: PredictionDocument, user_vote: Optional[str]
+) -> PredictionWithVotes:
+    """Merge the caller's vote and the time remaining into a shared document"""
+    # Calculate time remaining
+    time_remaining = None
+    if document.status == "active":
+        delta = document.verify_time - datetime.utcnow()
+        time_remaining = max(0, int(delta.total_seconds()))
+
+    return PredictionWithVotes(
+        **document.__dict__,
+        user_voted=user_vote is not None,
+        user_vote=user_vote,
+        time_remaining=time_remaining
+    )
+
+
+async def _get_documents(
+    db: AsyncSession,
+    redis_client: Optional[redis.Redis],
+    prediction_ids: List[UUID],
+) -> Dict[UUID, PredictionDocument]:
+    """Get shared documents from the cache, loading and caching the misses in two queries"""
+    documents = await prediction_cache.get_documents(redis_client, prediction_ids)
+
+    missing = [i for i in prediction_ids if i not in documents]
+    if not missing:
+        return documents
+
+    stmt = select(Prediction).where(Prediction.id.in_(missing)).options(
+        joinedload(Prediction.user)
+    )
+    result = await db.execute(stmt)
+    predictions = result.scalars().all()
+    vote_counts = await _get_vote_counts(db, missing)
+
+    loaded = [
+        _build_document(prediction, vote_counts.get(prediction.id, {}))
+        for prediction in predictions
+    ]
+    await prediction_cache.set_documents(redis_client, loaded)
+
+    documents.update({document.id: document for document in loaded})
+    return documents
+
+
+async def _get_overlay(
+    db: AsyncSession,
+    redis_client: Optional[redis.Redis],
+    current_user: Optional[User],
+    prediction_ids: List[UUID],
+) -> Dict[UUID, Optional[str]]:
+    """Get the caller's votes from the cache, loading and caching the misses in one query"""
+    if not current_user or not prediction_ids:
+        return {}
+
+    votes = await prediction_cache.get_user_votes(redis_client, current_user.id, prediction_ids)
+
+    missing = [i for i in prediction_ids if i not in votes]
+    if missing:
+        found = await _get_user_votes(db, current_user.id, missing)
+        loaded = {i: found.get(i) for i in missing}
+        await prediction_cache.set_user_votes(redis_client, current_user.id, loaded)
+        votes.update(loaded)
+
+    return votes
+
+
 @router.post("/", response_model=PredictionResponse, status_code=status.HTTP_201_CREATED)
 async def create_prediction(
     prediction_data: PredictionCreate,
@@ -43,11 +278,10 @@ async def create_prediction(
     redis_client: redis.Redis = Depends(get_redis_client)
 ):
     """Create a new prediction"""
-    # Get current price for the symbol
-    market_service = MarketDataService(db, redis_client)
-    quote = await market_service.get_quote(prediction_data.symbol_code)
+    # Anchor to the latest tick; never call the provider on the write path
+    tick = await tick_store.get_anchor(prediction_data.symbol_code, redis_client)
 
-    if not quote:
+    if not tick:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Unable to fetch current price"
@@ -66,16 +300,23 @@ async def create_prediction(
         symbol_code=prediction_data.symbol_code,
         question=prediction_data.question,
         options=[opt.dict() for opt in prediction_data.options],
-        price_at_create=quote["price"],
+        price_at_create=tick.price,
+        price_tick_at=tick.timestamp,
         verify_time=prediction_data.verify_time,
         verify_rule=prediction_data.verify_rule,
-        auto_verify_conditions=prediction_data.auto_verify_conditions.dict() if prediction_data.auto_verify_conditions else None
+        auto_verify_conditions=compile_conditions(
+            {key: c.condition for key, c in prediction_data.auto_verify_conditions.items()}
+        ) if prediction_data.auto_verify_conditions else None
     )
 
     db.add(prediction)
     await db.commit()
     await db.refresh(prediction)
 
+    # Let the verifier arm its timer for the exact deadline
+    await publish_deadline(redis_client, prediction.id, prediction.verify_time)
+    await prediction_feed.invalidate(redis_client, [prediction.symbol_code])
+
     # Load user relationship
     await db.refresh(prediction, ["user"])
 
@@ -86,14 +327,25 @@ async def create_prediction(
 async def get_predictions(
     status_filter: Optional[str] = Query(None, alias="status", regex="^(active|ended|cancelled)$"),
     symbol: Optional[str] = Query(None, description="Filter by symbol"),
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    page: int = Query(1, ge=1, deprecated=True, description="Use cursor instead"),
     limit: int = Query(20, ge=1, le=100),
+    include_total: bool = Query(False, description="Include a (cached) total count"),
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client)
 ):
-    """Get predictions with pagination"""
+    """
+    Get predictions, newest first, with cursor pagination.
+
+    Pages are keyed on (created_at, id) so every page costs O(limit)
+    regardless of depth. The page query selects IDs only (cached for the
+    first page of each symbol until a prediction is created or settled);
+    the shared documents and the caller's votes come from Redis, and the
+    misses of a page are loaded with a constant number of queries.
+    """
     # Build query
-    stmt = select(Prediction)
+    stmt = select(Prediction.id, Prediction.created_at)
 
     if status_filter:
         stmt = stmt.where(Prediction.status == status_filter)
@@ -103,83 +355,112 @@ async def get_predictions(
     if symbol:
         stmt = stmt.where(Prediction.symbol_code == symbol)
 
-    # Order by creation time (newest first)
-    stmt = stmt.order_by(Prediction.created_at.desc())
+    # Totals are optional and cached; infinite scroll never counts
+    total = None
+    if include_total:
+        total = await cached_total(
+            db,
+            redis_client,
+            f"predictions:{status_filter or 'active'}:{symbol or '*'}",
+            stmt,
+        )
 
-    # Count total
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar()
+    # The first page of a symbol is the hottest read: its IDs come from the
+    # feed cache; documents and votes are cached and invalidated on their own
+    first_page = cursor is None and page == 1
+    scope, variant = symbol or ALL_SYMBOLS, f"{status_filter or 'active'}:{limit}"
+    cached = await prediction_feed.get(redis_client, scope, variant) if first_page else None
 
-    # Apply pagination
-    offset = (page - 1) * limit
-    stmt = stmt.offset(offset).limit(limit)
+    if cached:
+        cached_page = json.loads(cached)
+        prediction_ids = [UUID(i) for i in cached_page["ids"]]
+        next_cursor = cached_page["next_cursor"]
+    else:
+        # Newest first, starting after the cursor
+        try:
+            page_stmt = keyset_page(stmt, Prediction.created_at, Prediction.id, limit, cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
 
-    result = await db.execute(stmt)
-    predictions = result.scalars().all()
+        # Legacy page numbers fall back to OFFSET
+        if page > 1 and not cursor:
+            page_stmt = page_stmt.offset((page - 1) * limit)
 
-    # Enrich with vote data
-    enriched_predictions = []
-    for prediction in predictions:
-        await db.refresh(prediction, ["user"])
-
-        # Get vote distribution
-        vote_stmt = select(
-            Vote.selected_option,
-            func.count(Vote.id).label("count")
-        ).where(Vote.prediction_id == prediction.id).group_by(Vote.selected_option)
-
-        vote_result = await db.execute(vote_stmt)
-        vote_counts = {row[0]: row[1] for row in vote_result.all()}
-
-        total_votes = sum(vote_counts.values())
-        vote_distribution = {}
-
-        for option in prediction.options:
-            count = vote_counts.get(option["key"], 0)
-            percentage = (count / total_votes * 100) if total_votes > 0 else 0
-            vote_distribution[option["key"]] = VoteDistribution(
-                count=count,
-                percentage=round(percentage, 2)
-            )
+        result = await db.execute(page_stmt)
+        rows, next_cursor = split_page(result.all(), limit)
+        prediction_ids = [row.id for row in rows]
 
-        # Check if current user voted
-        user_voted = False
-        user_vote = None
-        if current_user:
-            user_vote_stmt = select(Vote).where(
-                and_(
-                    Vote.prediction_id == prediction.id,
-                    Vote.user_id == current_user.id
-                )
-            )
-            user_vote_result = await db.execute(user_vote_stmt)
-            user_vote_obj = user_vote_result.scalar_one_or_none()
-            if user_vote_obj:
-                user_voted = True
-                user_vote = user_vote_obj.selected_option
-
-        # Calculate time remaining
-        time_remaining = None
-        if prediction.status == "active":
-            delta = prediction.verify_time - datetime.utcnow()
-            time_remaining = max(0, int(delta.total_seconds()))
-
-        enriched_predictions.append(PredictionWithVotes(
-            **prediction.__dict__,
-            user_voted=user_voted,
-            user_vote=user_vote,
-            vote_distribution=vote_distribution,
-            time_remaining=time_remaining
-        ))
+        if first_page:
+            await prediction_feed.set(redis_client, scope, variant, json.dumps({
+                "ids": [str(i) for i in prediction_ids],
+                "next_cursor": next_cursor,
+            }))
+
+    # Shared documents plus the caller's votes for the whole page
+    documents = await _get_documents(db, redis_client, prediction_ids)
+    user_votes = await _get_overlay(db, redis_client, current_user, prediction_ids)
+
+    enriched_predictions = [
+        _personalize(documents[prediction_id], user_votes.get(prediction_id))
+        for prediction_id in prediction_ids
+        if prediction_id in documents
+    ]
 
     return PredictionListResponse(
         predictions=enriched_predictions,
         pagination={
-            "page": page,
             "limit": limit,
-            "total": total,
-            "has_more": (page * limit) < total
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+            "total": total
+        }
+    )
+
+
+@router.get("/hot", response_model=PredictionListResponse)
+async def get_hot_predictions(
+    offset: int = Query(0, ge=0, le=1000),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client)
+):
+    """
+    Get active predictions ranked by heat (PRD "热门预测").
+
+    Heat combines time-decayed votes, recent comments on the symbol and
+    closeness to the deadline. The ranking is a Redis sorted set, so a page
+    is one range read plus the usual cached documents.
+    """
+    try:
+        ranked = await hot_predictions.top(redis_client, limit, offset)
+    except Exception as e:
+        print(f"Redis hot predictions error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Hot predictions temporarily unavailable"
+        )
+
+    prediction_ids = [prediction_id for prediction_id, _ in ranked]
+    documents = await _get_documents(db, redis_client, prediction_ids)
+    user_votes = await _get_overlay(db, redis_client, current_user, prediction_ids)
+
+    # Predictions settled since the last ranking are left out
+    hot = [
+        _personalize(documents[prediction_id], user_votes.get(prediction_id))
+        for prediction_id in prediction_ids
+        if prediction_id in documents and documents[prediction_id].status == "active"
+    ]
+
+    return PredictionListResponse(
+        predictions=hot,
+        pagination={
+            "limit": limit,
+            "offset": offset,
+            "has_more": len(ranked) == limit,
         }
     )
 
@@ -193,10 +474,16 @@ async def vote_on_prediction(
     redis_client: redis.Redis = Depends(get_redis_client)
 ):
     """Vote on a prediction"""
-    # Check if prediction exists and is active
-    stmt = select(Prediction).where(Prediction.id == prediction_id)
+    # Plain read (no row lock) for validation and the price anchor symbol;
+    # the insert below re-checks that the prediction is still open
+    stmt = select(
+        Prediction.symbol_code,
+        Prediction.options,
+        Prediction.status,
+        Prediction.verify_time,
+    ).where(Prediction.id == prediction_id)
     result = await db.execute(stmt)
-    prediction = result.scalar_one_or_none()
+    prediction = result.one_or_none()
 
     if not prediction:
         raise HTTPException(
@@ -224,73 +511,74 @@ async def vote_on_prediction(
             detail=f"Invalid option. Must be one of: {', '.join(valid_options)}"
         )
 
-    # Check if user already voted
-    existing_vote_stmt = select(Vote).where(
-        and_(
-            Vote.prediction_id == prediction_id,
-            Vote.user_id == current_user.id
-        )
-    )
-    existing_vote_result = await db.execute(existing_vote_stmt)
-    existing_vote = existing_vote_result.scalar_one_or_none()
+    # Anchor to the latest tick; never call the provider on the write path
+    tick = await tick_store.get_anchor(prediction.symbol_code, redis_client)
 
-    if existing_vote:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You have already voted on this prediction"
-        )
-
-    # Get current price
-    market_service = MarketDataService(db, redis_client)
-    quote = await market_service.get_quote(prediction.symbol_code)
-
-    if not quote:
+    if not tick:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Unable to fetch current price"
         )
 
-    # Create vote
-    vote = Vote(
-        prediction_id=prediction_id,
-        user_id=current_user.id,
-        selected_option=vote_data.selected_option,
-        price_at_vote=quote["price"]
-    )
-
-    db.add(vote)
-
-    # Update prediction participants count
-    prediction.participants_count += 1
-
+    # Insert the vote, bump the counters and read the distribution in one
+    # statement; row locks are held only until the immediate commit
+    result = await db.execute(_cast_vote(
+        prediction_id,
+        current_user.id,
+        vote_data.selected_option,
+        tick.price,
+        tick.timestamp,
+        datetime.utcnow()
+    ))
+    rows = result.all()
     await db.commit()
 
-    # Get updated vote distribution
-    vote_stmt = select(
-        Vote.selected_option,
-        func.count(Vote.id).label("count")
-    ).where(Vote.prediction_id == prediction_id).group_by(Vote.selected_option)
-
-    vote_result = await db.execute(vote_stmt)
-    vote_counts = {row[0]: row[1] for row in vote_result.all()}
+    voted = bool(rows) and rows[0].voted
+    if voted:
+        await prediction_cache.invalidate_documents(redis_client, [prediction_id])
+        await prediction_cache.set_user_votes(
+            redis_client, current_user.id, {prediction_id: vote_data.selected_option}
+        )
+        await hot_predictions.record_vote(
+            redis_client, prediction_id, prediction.verify_time, datetime.utcnow()
+        )
 
-    total_votes = sum(vote_counts.values())
-    vote_distribution = {}
+    if not voted:
+        # Nothing inserted: a concurrent request voted first, or the
+        # prediction closed since it was read
+        existing_vote = await db.execute(
+            select(Vote.id).where(
+                and_(
+                    Vote.prediction_id == prediction_id,
+                    Vote.user_id == current_user.id
+                )
+            )
+        )
+        if existing_vote.first() is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You have already voted on this prediction"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Prediction is not active"
+        )
 
-    for option in prediction.options:
-        count = vote_counts.get(option["key"], 0)
-        percentage = (count / total_votes * 100) if total_votes > 0 else 0
-        vote_distribution[option["key"]] = {
-            "count": count,
-            "percentage": round(percentage, 2)
-        }
+    vote_counts = {row.option_key: int(row.count) for row in rows}
+    vote_distribution = {
+        key: distribution.model_dump()
+        for key, distribution in _build_vote_distribution(
+            prediction.options, vote_counts
+        ).items()
+    }
 
     return VoteResultResponse(
         prediction_id=prediction_id,
         user_vote=vote_data.selected_option,
-        price_at_vote=quote["price"],
+        price_at_vote=tick.price,
+        price_tick_at=tick.timestamp,
         vote_distribution=vote_distribution,
-        participants_count=prediction.participants_count
+        participants_count=sum(vote_counts.values())
     )
 
 
@@ -298,67 +586,18 @@ async def vote_on_prediction(
 async def get_prediction(
     prediction_id: UUID,
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis_client)
 ):
-    """Get a single prediction by ID"""
-    stmt = select(Prediction).where(Prediction.id == prediction_id)
-    result = await db.execute(stmt)
-    prediction = result.scalar_one_or_none()
+    """Get a single prediction by ID (shared cached document plus the caller's vote)"""
+    documents = await _get_documents(db, redis_client, [prediction_id])
 
-    if not prediction:
+    if prediction_id not in documents:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Prediction not found"
         )
 
-    await db.refresh(prediction, ["user"])
-
-    # Get vote distribution
-    vote_stmt = select(
-        Vote.selected_option,
-        func.count(Vote.id).label("count")
-    ).where(Vote.prediction_id == prediction_id).group_by(Vote.selected_option)
-
-    vote_result = await db.execute(vote_stmt)
-    vote_counts = {row[0]: row[1] for row in vote_result.all()}
-
-    total_votes = sum(vote_counts.values())
-    vote_distribution = {}
-
-    for option in prediction.options:
-        count = vote_counts.get(option["key"], 0)
-        percentage = (count / total_votes * 100) if total_votes > 0 else 0
-        vote_distribution[option["key"]] = VoteDistribution(
-            count=count,
-            percentage=round(percentage, 2)
-        )
-
-    # Check if current user voted
-    user_voted = False
-    user_vote = None
-    if current_user:
-        user_vote_stmt = select(Vote).where(
-            and_(
-                Vote.prediction_id == prediction_id,
-                Vote.user_id == current_user.id
-            )
-        )
-        user_vote_result = await db.execute(user_vote_stmt)
-        user_vote_obj = user_vote_result.scalar_one_or_none()
-        if user_vote_obj:
-            user_voted = True
-            user_vote = user_vote_obj.selected_option
+    user_votes = await _get_overlay(db, redis_client, current_user, [prediction_id])
 
-    # Calculate time remaining
-    time_remaining = None
-    if prediction.status == "active":
-        delta = prediction.verify_time - datetime.utcnow()
-        time_remaining = max(0, int(delta.total_seconds()))
-
-    return PredictionWithVotes(
-        **prediction.__dict__,
-        user_voted=user_voted,
-        user_vote=user_vote,
-        vote_distribution=vote_distribution,
-        time_remaining=time_remaining
-    )
+    return _personalize(documents[prediction_id], user_votes.get(prediction_id))
@@ -13,6 +13,7 @@ from app.schemas.quote import (
     HistoricalQuote
 )
 from app.services.market_data_service import MarketDataService
+from app.services.trading_calendar import trading_calendar
 
 router = APIRouter(prefix="/quotes", tags=["Market Data"])
 
@@ -53,7 +54,10 @@ async def get_quote(
 
     # Combine symbol info with quote
     return QuoteWithSymbol(
-        **quote_data,
+        **{
+            **quote_data,
+            "market_status": trading_calendar.market_status(symbol_info.market),
+        },
         name_cn=symbol_info.name_cn,
         name_en=symbol_info.name_en,
         market=symbol_info.market
@@ -84,7 +88,10 @@ async def get_multiple_quotes(
         symbol_info = await service.get_symbol_info(symbol_code)
         if symbol_info:
             result.append(QuoteWithSymbol(
-                **quote_data,
+                **{
+                    **quote_data,
+                    "market_status": trading_calendar.market_status(symbol_info.market),
+                },
                 name_cn=symbol_info.name_cn,
                 name_en=symbol_info.name_en,
                 market=symbol_info.market
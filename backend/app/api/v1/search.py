@@ -0,0 +1,138 @@
+"""Search API endpoints"""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Float, func, select, and_
+from sqlalchemy.orm import joinedload
+
+from app.core.database import get_db
+from app.core.pagination import ranked_page, split_ranked_page
+from app.core.text_search import search_query
+from app.models.comment import Comment
+from app.models.news import News
+from app.schemas.comment import CommentResponse
+from app.schemas.news import NewsListItem
+from app.schemas.search import (
+    CommentSearchResponse,
+    CommentSearchResult,
+    NewsSearchResponse,
+    NewsSearchResult,
+)
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+# ts_rank_cd normalization: divide by 1 + log(document length)
+_RANK_NORMALIZATION = 1
+
+
+def _parse_query(q: str):
+    """Segmented tsquery of the search text"""
+    query = search_query(q)
+    if query is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Query has no searchable terms"
+        )
+    return query
+
+
+def _rank(vector, query):
+    return func.ts_rank_cd(vector, query, _RANK_NORMALIZATION, type_=Float)
+
+
+@router.get("/comments", response_model=CommentSearchResponse)
+async def search_comments(
+    q: str = Query(..., min_length=1, max_length=100, description="Search text"),
+    symbol: Optional[str] = Query(None, description="Filter by symbol"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search comments, most relevant first, with cursor pagination.
+
+    Text is segmented like the indexed comments (CJK bigrams, lowercased
+    words) and matched against the GIN-indexed ``search_vector``, so no
+    query scans ``comments.content``.
+    """
+    query = _parse_query(q)
+    rank = _rank(Comment.search_vector, query)
+
+    stmt = select(Comment, Comment.id, rank.label("rank")).where(
+        and_(
+            Comment.search_vector.bool_op("@@")(query),
+            Comment.is_deleted == False
+        )
+    )
+    if symbol:
+        stmt = stmt.where(Comment.symbol_code == symbol)
+
+    try:
+        page_stmt = ranked_page(stmt, rank, Comment.id, limit, cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    result = await db.execute(page_stmt.options(joinedload(Comment.user)))
+    rows, next_cursor = split_ranked_page(result.all(), limit)
+
+    return CommentSearchResponse(
+        comments=[
+            CommentSearchResult(**CommentResponse.model_validate(row.Comment).model_dump(), rank=row.rank)
+            for row in rows
+        ],
+        pagination={
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
+    )
+
+
+@router.get("/news", response_model=NewsSearchResponse)
+async def search_news(
+    q: str = Query(..., min_length=1, max_length=100, description="Search text"),
+    category: Optional[str] = Query(None, pattern="^(gold|forex|market|economic)$"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search news, most relevant first, with cursor pagination.
+
+    Title matches weigh more than summary matches, which weigh more than
+    body matches.
+    """
+    query = _parse_query(q)
+    rank = _rank(News.search_vector, query)
+
+    stmt = select(News, News.id, rank.label("rank")).where(
+        News.search_vector.bool_op("@@")(query)
+    )
+    if category:
+        stmt = stmt.where(News.category == category)
+
+    try:
+        page_stmt = ranked_page(stmt, rank, News.id, limit, cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    result = await db.execute(page_stmt)
+    rows, next_cursor = split_ranked_page(result.all(), limit)
+
+    return NewsSearchResponse(
+        news=[
+            NewsSearchResult(**NewsListItem.model_validate(row.News).model_dump(), rank=row.rank)
+            for row in rows
+        ],
+        pagination={
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
+    )
@@ -1,5 +1,6 @@
 """Application configuration"""
-from typing import List
+from datetime import date
+from typing import Dict, List
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -24,9 +25,26 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 0
     
+    # Background jobs
+    RUN_BACKGROUND_JOBS: bool = True  # Set False on API workers when a job worker runs
+    JOBS_DATABASE_POOL_SIZE: int = 5
+    JOBS_DATABASE_MAX_OVERFLOW: int = 0
+    
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_CACHE_TTL: int = 300
+    PAGINATION_TOTAL_CACHE_SECONDS: int = 60  # Cache for optional list totals
+    COUNTER_SHARDS: int = 16  # Rows per sharded counter (vote counts, likes)
+    COUNTER_CACHE_SECONDS: int = 5  # Cache for summed counter shards
+    PREDICTION_CACHE_SECONDS: int = 60  # Shared prediction documents (invalidated on vote/settle)
+    PREDICTION_OVERLAY_CACHE_SECONDS: int = 300  # Per-user votes merged into prediction responses
+    LEADERBOARD_WINDOW_CACHE_SECONDS: int = 60  # Daily/weekly/monthly boards unioned from day buckets
+    COMMENT_LIKES_CACHE_SECONDS: int = 604800  # Per-comment like sets, refreshed on every tap
+    FEED_CACHE_SECONDS: int = 30  # First pages of the comment/prediction feeds (invalidated on events)
+    FEED_L1_CACHE_SECONDS: int = 2  # In-process copies of the first pages
+    
+    # Moderators allowed to use the admin endpoints
+    ADMIN_USERNAMES: List[str] = []
     
     # JWT Authentication
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
@@ -37,6 +55,19 @@ class Settings(BaseSettings):
     MARKET_DATA_API_KEY: str = ""
     MARKET_DATA_BASE_URL: str = "https://api.twelvedata.com"
     MARKET_DATA_RATE_LIMIT: int = 8
+    MARKET_DATA_TIMEOUT: float = 10.0
+    MARKET_DATA_BREAKER_FAILURE_THRESHOLD: int = 5  # Consecutive failures before opening
+    MARKET_DATA_BREAKER_BASE_BACKOFF: float = 1.0  # Seconds, doubled on each re-open
+    MARKET_DATA_BREAKER_MAX_BACKOFF: float = 60.0
+    
+    # Trading calendar
+    MARKET_HOLIDAYS: Dict[str, List[date]] = {}  # Extra holidays per market, e.g. {"SGE": ["2026-02-17"]}
+    CLOSED_MARKET_POLL_SECONDS: int = 300  # Price polling interval while a market is closed
+    
+    # Price anchors
+    PRICE_ANCHOR_MAX_AGE_SECONDS: int = 30  # Max tick age for anchoring while the market is open
+    TICK_TTL_SECONDS: int = 345600  # 4 days: last ticks outlive weekends and holidays even if polling stalls
+    PRICE_AT_VERIFY_MAX_GAP_SECONDS: int = 600  # Max age of a stored tick used as price at a deadline
     
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8080"]
@@ -1,22 +1,38 @@
 """Database connection and session management"""
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
 
-# Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-)
+
+def make_engine(pool_size: int, max_overflow: int) -> AsyncEngine:
+    """Create an async engine with its own connection pool"""
+    return create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
+
+
+def make_session_factory(bind: AsyncEngine) -> async_sessionmaker:
+    """Create an async session factory bound to an engine"""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+# Create async engine for API request handling
+engine = make_engine(settings.DATABASE_POOL_SIZE, settings.DATABASE_MAX_OVERFLOW)
 
 # Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+AsyncSessionLocal = make_session_factory(engine)
 
 # Create declarative base for models
 Base = declarative_base()
@@ -33,4 +49,3 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
-
@@ -0,0 +1,225 @@
+"""Keyset (cursor) pagination helpers"""
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor.
+
+    Args:
+        created_at: Creation time of the last row
+        id: ID of the last row (tie-breaker for equal timestamps)
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        (created_at, id) of the last row of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_rank_cursor(rank: float, id: UUID) -> str:
+    """
+    Encode the sort key of the last row of a relevance-ranked page.
+
+    Args:
+        rank: Relevance of the last row
+        id: ID of the last row (tie-breaker for equal ranks)
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{rank!r}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, UUID]:
+    """
+    Decode a cursor produced by ``encode_rank_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return float(rank), UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def keyset_page(
+    stmt: Select,
+    created_at_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Select:
+    """
+    Apply newest-first keyset pagination to a query.
+
+    Rows are ordered by ``(created_at, id)`` descending and the page starts
+    right after the cursor, so the cost stays O(limit) at any depth. One
+    extra row is fetched to know whether another page exists.
+
+    Args:
+        stmt: Filtered select statement without ordering or limit
+        created_at_column: Creation time column
+        id_column: Primary key column
+        limit: Page size
+        cursor: Cursor of the previous page, None for the first page
+
+    Returns:
+        Statement selecting up to ``limit + 1`` rows
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(created_at_column, id_column) < tuple_(created_at, id))
+
+    return stmt.order_by(created_at_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def split_page(rows: Sequence[T], limit: int) -> Tuple[List[T], Optional[str]]:
+    """
+    Trim the look-ahead row of a keyset page and build the next cursor.
+
+    Args:
+        rows: Rows returned by a ``keyset_page`` query
+        limit: Page size
+
+    Returns:
+        (rows of this page, cursor of the next page or None on the last page)
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
+
+def ranked_page(
+    stmt: Select,
+    rank_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Select:
+    """
+    Apply most-relevant-first keyset pagination to a query.
+
+    Like ``keyset_page`` with ``(rank, id)`` as the sort key; the rank must
+    be deterministic for a row, e.g. a text search rank for a fixed query.
+
+    Args:
+        stmt: Filtered select statement without ordering or limit
+        rank_column: Relevance expression
+        id_column: Primary key column
+        limit: Page size
+        cursor: Cursor of the previous page, None for the first page
+
+    Returns:
+        Statement selecting up to ``limit + 1`` rows
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor:
+        rank, id = decode_rank_cursor(cursor)
+        stmt = stmt.where(tuple_(rank_column, id_column) < tuple_(rank, id))
+
+    return stmt.order_by(rank_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def split_ranked_page(rows: Sequence[T], limit: int) -> Tuple[List[T], Optional[str]]:
+    """
+    Trim the look-ahead row of a ``ranked_page`` and build the next cursor.
+
+    Rows must expose ``rank`` and ``id``.
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_rank_cursor(last.rank, last.id)
+
+
+async def cached_total(
+    db: AsyncSession,
+    redis_client: Optional[redis.Redis],
+    cache_key: str,
+    stmt: Select,
+) -> int:
+    """
+    Count the rows of a filtered query, caching the result in Redis.
+
+    Totals are only used for display, so a count that is up to
+    PAGINATION_TOTAL_CACHE_SECONDS old is acceptable.
+
+    Args:
+        db: Database session
+        redis_client: Redis client (count is not cached when None)
+        cache_key: Cache key identifying the filters
+        stmt: Filtered select statement
+
+    Returns:
+        Number of rows
+    """
+    key = f"total:{cache_key}"
+
+    if redis_client:
+        try:
+            cached = await redis_client.get(key)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            print(f"Redis get error: {e}")
+
+    result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+    total = result.scalar()
+
+    if redis_client:
+        try:
+            await redis_client.setex(key, settings.PAGINATION_TOTAL_CACHE_SECONDS, total)
+        except Exception as e:
+            print(f"Redis set error: {e}")
+
+    return total
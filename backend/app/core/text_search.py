@@ -0,0 +1,85 @@
+"""Tokenization for the full-text search indexes"""
+import re
+from typing import List, Optional
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR, plainto_tsquery, to_tsvector
+
+# Runs of CJK ideographs, kana and hangul, otherwise runs of letters/digits
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_RE = re.compile(rf"([{_CJK}]+)|([^\W_{_CJK}]+)")
+
+# Longer words are skipped (tsvector lexemes are limited to 2KB)
+_MAX_WORD_LENGTH = 100
+
+# Text search configuration applied to the pre-segmented text: no stemming
+# or stop words, so it works the same for Chinese and English
+TS_CONFIG = "simple"
+
+
+def tokenize(text: Optional[str], query: bool = False) -> List[str]:
+    """
+    Segment text into search terms.
+
+    Words are lowercased. CJK text has no spaces, so runs of CJK
+    characters are indexed as their characters and overlapping bigrams;
+    queries use the bigrams (a single character on its own), so
+    ``黄金价格`` matches text containing the phrase, and ``金`` any text
+    with the character.
+
+    Args:
+        text: Text to segment
+        query: Segment a search query instead of a document
+
+    Returns:
+        Terms in order
+    """
+    terms = []
+    for cjk, word in _TOKEN_RE.findall((text or "").lower()):
+        if word:
+            if len(word) <= _MAX_WORD_LENGTH:
+                terms.append(word)
+            continue
+
+        bigrams = [cjk[i:i + 2] for i in range(len(cjk) - 1)]
+        if query:
+            terms.extend(bigrams or [cjk])
+        else:
+            terms.extend(cjk)
+            terms.extend(bigrams)
+    return terms
+
+
+def search_document(text: Optional[str]) -> str:
+    """Segmented text fed to ``to_tsvector``"""
+    return " ".join(tokenize(text))
+
+
+def search_vector(text: Optional[str], weight: str = "D"):
+    """
+    SQL expression of the tsvector indexing ``text``.
+
+    Args:
+        text: Document text
+        weight: tsvector weight (A highest, D default)
+    """
+    if weight not in ("A", "B", "C", "D"):
+        raise ValueError(f"Invalid weight: {weight}")
+    return func.setweight(
+        to_tsvector(TS_CONFIG, search_document(text)),
+        literal_column(f"'{weight}'"),
+        type_=TSVECTOR,
+    )
+
+
+def search_query(text: str):
+    """
+    SQL expression of the tsquery matching documents with all terms of ``text``.
+
+    Returns:
+        tsquery expression, None when the text has no searchable terms
+    """
+    terms = tokenize(text, query=True)
+    if not terms:
+        return None
+    return plainto_tsquery(TS_CONFIG, " ".join(terms))
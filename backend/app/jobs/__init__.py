@@ -1,14 +1,28 @@
 """Background jobs package"""
-from .base import BaseJob
+from .base import BaseJob, JobRunStats, MissedTickPolicy
 from .price_fetcher import PriceFetcherJob
 from .news_fetcher import NewsFetcherJob
 from .prediction_verifier import PredictionVerifierJob
+from .counter_rollup import CounterRollupJob
+from .leaderboard_rebuild import LeaderboardRebuildJob
+from .stats_recompute import StatsRecomputeJob
+from .hot_predictions import HotPredictionsJob
+from .comment_like_flush import CommentLikeFlushJob
+from .hot_comments import HotCommentsJob
 from .manager import JobManager
 
 __all__ = [
     "BaseJob",
+    "JobRunStats",
+    "MissedTickPolicy",
     "PriceFetcherJob",
     "NewsFetcherJob",
     "PredictionVerifierJob",
+    "CounterRollupJob",
+    "LeaderboardRebuildJob",
+    "StatsRecomputeJob",
+    "HotPredictionsJob",
+    "CommentLikeFlushJob",
+    "HotCommentsJob",
     "JobManager",
 ]
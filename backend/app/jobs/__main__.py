@@ -0,0 +1,69 @@
+"""Standalone background job worker
+
+Runs the JobManager in its own process so that job execution does not share
+an event loop (or a connection pool) with API request handling.
+
+Usage:
+    python -m app.jobs
+
+API workers should be started with RUN_BACKGROUND_JOBS=false when this
+worker is deployed, otherwise every process runs its own copy of the jobs.
+"""
+import asyncio
+import logging
+import signal
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.database import make_engine, make_session_factory
+from app.jobs.manager import JobManager
+from app.services.market_data_client import market_data_client
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker() -> None:
+    """Start all jobs and block until SIGINT/SIGTERM is received"""
+    # Dedicated engine so job queries never compete with API requests
+    engine = make_engine(
+        settings.JOBS_DATABASE_POOL_SIZE,
+        settings.JOBS_DATABASE_MAX_OVERFLOW,
+    )
+    session_factory = make_session_factory(engine)
+    redis_client = redis.from_url(settings.REDIS_URL, decode_responses=False)
+
+    job_manager = JobManager(
+        market_data_service=market_data_client,
+        redis_client=redis_client,
+        session_factory=session_factory,
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    job_manager.start_all()
+    logger.info("Job worker started")
+
+    try:
+        await stop_event.wait()
+    finally:
+        await job_manager.stop_all()
+        await redis_client.close()
+        await engine.dispose()
+        logger.info("Job worker stopped")
+
+
+def main() -> None:
+    """Worker entry point"""
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,143 @@
 """Base job class for background tasks"""
 import asyncio
 import logging
+import random
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Deque, Optional
 
 logger = logging.getLogger(__name__)
 
 
+class MissedTickPolicy(str, Enum):
+    """What to do with ticks that passed while a run was still executing"""
+
+    SKIP = "skip"  # Drop missed ticks and realign to the schedule
+    CATCH_UP = "catch_up"  # Run missed ticks back-to-back until on schedule
+
+
+class JobRunStats:
+    """Rolling execution statistics for a job"""
+
+    def __init__(self, window: int = 100):
+        """
+        Initialize the statistics.
+
+        Args:
+            window: Number of recent runs used for duration aggregates
+        """
+        self._durations: Deque[float] = deque(maxlen=window)
+        self.runs = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.skipped_ticks = 0
+        self.last_duration: Optional[float] = None
+        self.last_lag: Optional[float] = None
+        self.max_lag = 0.0
+        self.last_run_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    def record(
+        self,
+        duration: float,
+        lag: float,
+        error: Optional[str] = None,
+        timed_out: bool = False,
+    ) -> None:
+        """
+        Record a finished run.
+
+        Args:
+            duration: Execution time in seconds
+            lag: Delay between the scheduled and the actual start in seconds
+            error: Error message if the run failed
+            timed_out: Whether the run was cancelled by the max-runtime timeout
+        """
+        self.runs += 1
+        self._durations.append(duration)
+        self.last_duration = duration
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.last_run_at = datetime.utcnow()
+
+        if timed_out:
+            self.timeouts += 1
+        if error is not None:
+            self.failures += 1
+            self.last_error = error
+
+    @property
+    def avg_duration(self) -> Optional[float]:
+        """Average duration over the rolling window"""
+        if not self._durations:
+            return None
+        return sum(self._durations) / len(self._durations)
+
+    @property
+    def p95_duration(self) -> Optional[float]:
+        """95th percentile duration over the rolling window"""
+        if not self._durations:
+            return None
+        ordered = sorted(self._durations)
+        index = max(0, int(round(0.95 * len(ordered))) - 1)
+        return ordered[index]
+
+    def to_dict(self) -> dict:
+        """Serialize statistics for the job status endpoint"""
+
+        def _ms(value: Optional[float]) -> Optional[float]:
+            return round(value * 1000, 2) if value is not None else None
+
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "skipped_ticks": self.skipped_ticks,
+            "last_duration_ms": _ms(self.last_duration),
+            "avg_duration_ms": _ms(self.avg_duration),
+            "p95_duration_ms": _ms(self.p95_duration),
+            "last_lag_ms": _ms(self.last_lag),
+            "max_lag_ms": _ms(self.max_lag),
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_error": self.last_error,
+        }
+
+
 class BaseJob(ABC):
-    """Base class for background jobs"""
+    """
+    Base class for background jobs.
+
+    Runs are scheduled at a fixed rate: the n-th run is due at
+    ``start + n * interval_seconds`` regardless of how long previous runs
+    took, so the period does not drift. Runs never overlap; ticks missed
+    while a slow run was executing are handled by ``missed_tick_policy``.
+    """
 
-    def __init__(self, interval_seconds: int):
+    def __init__(
+        self,
+        interval_seconds: float,
+        missed_tick_policy: MissedTickPolicy = MissedTickPolicy.SKIP,
+        jitter_seconds: float = 0.0,
+        max_runtime_seconds: Optional[float] = None,
+    ):
         """
         Initialize the job.
 
         Args:
             interval_seconds: How often to run the job (in seconds)
+            missed_tick_policy: Whether to skip or catch up on missed ticks
+            jitter_seconds: Random delay (0..jitter) added before each run to
+                spread load across instances; it does not accumulate
+            max_runtime_seconds: Cancel a run that takes longer than this
+                (None disables the timeout)
         """
         self.interval_seconds = interval_seconds
+        self.missed_tick_policy = missed_tick_policy
+        self.jitter_seconds = jitter_seconds
+        self.max_runtime_seconds = max_runtime_seconds
+        self.stats = JobRunStats()
         self._task: Optional[asyncio.Task] = None
         self._running = False
 
@@ -27,22 +147,88 @@ class BaseJob(ABC):
         pass
 
     async def _run_loop(self) -> None:
-        """Internal loop that runs the job at the specified interval"""
+        """Internal loop that runs the job at a fixed rate"""
         logger.info(
             f"Starting {self.__class__.__name__} with {self.interval_seconds}s interval"
         )
 
+        loop = asyncio.get_running_loop()
+        next_run = loop.time()
+
         while self._running:
-            try:
+            # Wait for the next scheduled tick
+            delay = next_run - loop.time()
+            if self.jitter_seconds:
+                delay += random.uniform(0, self.jitter_seconds)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            await self._run_once(lag=max(0.0, loop.time() - next_run))
+
+            next_run = self._next_run_time(next_run, loop.time())
+
+    async def _run_once(self, lag: float) -> None:
+        """
+        Execute the job once, enforcing the max-runtime timeout.
+
+        Args:
+            lag: Delay between the scheduled and the actual start in seconds
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        error: Optional[str] = None
+        timed_out = False
+
+        try:
+            if self.max_runtime_seconds:
+                await asyncio.wait_for(self.execute(), timeout=self.max_runtime_seconds)
+            else:
                 await self.execute()
-            except Exception as e:
-                logger.error(
-                    f"Error in {self.__class__.__name__}: {str(e)}",
-                    exc_info=True
-                )
-
-            # Wait for the next interval
-            await asyncio.sleep(self.interval_seconds)
+        except asyncio.TimeoutError:
+            timed_out = True
+            error = f"Run exceeded {self.max_runtime_seconds}s"
+            logger.warning(f"{self.__class__.__name__}: {error}")
+        except Exception as e:
+            error = str(e)
+            logger.error(
+                f"Error in {self.__class__.__name__}: {str(e)}",
+                exc_info=True
+            )
+
+        self.stats.record(
+            duration=loop.time() - started,
+            lag=lag,
+            error=error,
+            timed_out=timed_out,
+        )
+
+    def status_details(self) -> dict:
+        """Job-specific metrics for the job status endpoint"""
+        return {}
+
+    def _next_run_time(self, scheduled: float, now: float) -> float:
+        """
+        Compute when the next run is due.
+
+        Args:
+            scheduled: Time the run that just finished was due
+            now: Current loop time
+
+        Returns:
+            Loop time of the next run
+        """
+        next_run = scheduled + self.interval_seconds
+        if next_run > now:
+            return next_run
+
+        if self.missed_tick_policy == MissedTickPolicy.CATCH_UP:
+            # Run immediately; the schedule itself is left untouched
+            return next_run
+
+        missed = int((now - next_run) // self.interval_seconds) + 1
+        self.stats.skipped_ticks += missed
+        logger.debug(f"{self.__class__.__name__} skipped {missed} tick(s)")
+        return next_run + missed * self.interval_seconds
 
     def start(self) -> None:
         """Start the background job"""
@@ -0,0 +1,51 @@
+"""Write buffered comment likes to PostgreSQL"""
+import logging
+
+from app.jobs.base import BaseJob
+from app.services.comment_likes import comment_likes
+
+logger = logging.getLogger(__name__)
+
+
+class CommentLikeFlushJob(BaseJob):
+    """
+    Background job flushing like taps from Redis to ``comment_likes``.
+
+    ``POST /comments/{id}/like`` only toggles the comment's Redis set and
+    records the change; this job writes the coalesced changes with batched
+    inserts and deletes and applies the net count per comment to the like
+    counter, all in one transaction. Runs every 5 seconds.
+    """
+
+    def __init__(self, session_factory=None, redis_client=None, interval_seconds: float = 5):
+        """
+        Initialize the flush job.
+
+        Args:
+            session_factory: Async session factory of the job process
+            redis_client: Redis client buffering the likes
+            interval_seconds: How often to flush
+        """
+        super().__init__(
+            interval_seconds=interval_seconds,
+            max_runtime_seconds=60,
+        )
+        self.session_factory = session_factory
+        self.redis_client = redis_client
+        self.flushed = 0
+
+    async def execute(self) -> None:
+        """Flush pending likes and unlikes"""
+        if not self.session_factory or not self.redis_client:
+            return
+
+        async with self.session_factory() as session:
+            inserted, deleted = await comment_likes.flush(session, self.redis_client)
+
+        self.flushed = inserted + deleted
+        if self.flushed:
+            logger.info(f"Flushed {inserted} likes and {deleted} unlikes")
+
+    def status_details(self) -> dict:
+        """Rows written by the last flush"""
+        return {"flushed": self.flushed}
@@ -0,0 +1,114 @@
+"""Roll sharded counters up into their denormalized columns"""
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func, select, update
+
+from app.jobs.base import BaseJob
+from app.models.comment import Comment
+from app.models.counter import CounterShard
+from app.models.prediction import Prediction, PredictionVoteCount
+from app.services.sharded_counter import comment_likes_counter
+
+logger = logging.getLogger(__name__)
+
+# Shards are stamped by the writers before they commit: each run re-reads
+# this much before the previous one started, so late commits are not lost
+ROLLUP_OVERLAP = timedelta(minutes=1)
+
+
+class CounterRollupJob(BaseJob):
+    """
+    Background job copying sharded counter totals into entity columns.
+
+    API reads sum the shards; ``predictions.participants_count`` and
+    ``comments.likes_count`` are kept as a lagging copy for queries that
+    sort or filter on them. Each run updates only entities whose shards
+    changed since the previous run (found through the ``updated_at``
+    indexes), with one ``UPDATE ... FROM`` per column.
+    """
+
+    def __init__(self, session_factory=None, interval_seconds: float = 60):
+        """
+        Initialize the rollup job.
+
+        Args:
+            session_factory: Async session factory of the job process
+            interval_seconds: How often to roll up
+        """
+        super().__init__(
+            interval_seconds=interval_seconds,
+            max_runtime_seconds=interval_seconds,
+        )
+        self.session_factory = session_factory
+        self._since: Optional[datetime] = None  # None rolls up everything
+        self.rolled_up = 0
+
+    async def execute(self) -> None:
+        """Roll up counters changed since the previous run"""
+        if not self.session_factory:
+            return
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                # Database clock, the one shard timestamps are compared against
+                started = await session.scalar(select(func.timezone("UTC", func.now())))
+                participants = await session.execute(self._participants_stmt(self._since))
+                likes = await session.execute(self._likes_stmt(self._since))
+
+        self.rolled_up = participants.rowcount + likes.rowcount
+        # Shards written while this run was in flight are picked up next time
+        self._since = started - ROLLUP_OVERLAP
+        logger.info(
+            f"Rolled up {participants.rowcount} participant and {likes.rowcount} like counters"
+        )
+
+    def _participants_stmt(self, since: Optional[datetime]):
+        """UPDATE predictions.participants_count from the vote count shards"""
+        totals = (
+            select(
+                PredictionVoteCount.prediction_id,
+                func.sum(PredictionVoteCount.count).label("total"),
+            )
+            .group_by(PredictionVoteCount.prediction_id)
+        )
+        if since:
+            changed = (
+                select(PredictionVoteCount.prediction_id)
+                .where(PredictionVoteCount.updated_at >= since)
+                .distinct()
+            )
+            totals = totals.where(PredictionVoteCount.prediction_id.in_(changed))
+        totals = totals.subquery()
+
+        return (
+            update(Prediction)
+            .where(Prediction.id == totals.c.prediction_id)
+            .values(participants_count=totals.c.total, updated_at=Prediction.updated_at)
+        )
+
+    def _likes_stmt(self, since: Optional[datetime]):
+        """UPDATE comments.likes_count from the like counter shards"""
+        totals = comment_likes_counter.totals_stmt()
+        if since:
+            changed = (
+                select(CounterShard.entity_id)
+                .where(
+                    CounterShard.name == comment_likes_counter.name,
+                    CounterShard.updated_at >= since,
+                )
+                .distinct()
+            )
+            totals = totals.where(CounterShard.entity_id.in_(changed))
+        totals = totals.subquery()
+
+        return (
+            update(Comment)
+            .where(Comment.id == totals.c.entity_id)
+            .values(likes_count=totals.c.total, updated_at=Comment.updated_at)
+        )
+
+    def status_details(self) -> dict:
+        """Counters rolled up by the last run"""
+        return {"rolled_up": self.rolled_up}
@@ -0,0 +1,104 @@
+"""In-memory deadline scheduler for prediction verification"""
+import asyncio
+import heapq
+import itertools
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class DeadlineScheduler:
+    """
+    Min-heap of prediction deadlines.
+
+    Scheduling and cancelling are O(log n) / O(1): a cancelled or moved
+    deadline stays in the heap and is dropped when it reaches the top
+    (lazy deletion). Waiters are woken whenever an earlier deadline is
+    added so they can re-arm their timer.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, Any]] = []
+        self._deadlines: Dict[Any, datetime] = {}
+        self._sequence = itertools.count()  # Tie-breaker for equal deadlines
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, prediction_id) -> bool:
+        return prediction_id in self._deadlines
+
+    def schedule(self, prediction_id, verify_time: datetime) -> None:
+        """
+        Add or move the deadline of a prediction.
+
+        Args:
+            prediction_id: Prediction ID
+            verify_time: Naive UTC verification time
+        """
+        if self._deadlines.get(prediction_id) == verify_time:
+            return
+
+        next_deadline = self.next_deadline()
+        self._deadlines[prediction_id] = verify_time
+        heapq.heappush(self._heap, (verify_time, next(self._sequence), prediction_id))
+
+        if next_deadline is None or verify_time < next_deadline:
+            self._changed.set()
+
+    def cancel(self, prediction_id) -> None:
+        """
+        Remove the deadline of a prediction.
+
+        Args:
+            prediction_id: Prediction ID
+        """
+        self._deadlines.pop(prediction_id, None)
+
+    def next_deadline(self) -> Optional[datetime]:
+        """Earliest pending deadline or None"""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[Any]:
+        """
+        Remove and return all predictions whose deadline has passed.
+
+        Args:
+            now: Current naive UTC time
+
+        Returns:
+            Prediction IDs in deadline order
+        """
+        due = []
+        while self.next_deadline() is not None and self._heap[0][0] <= now:
+            _, _, prediction_id = heapq.heappop(self._heap)
+            del self._deadlines[prediction_id]
+            due.append(prediction_id)
+        return due
+
+    async def wait(self, now: datetime) -> None:
+        """
+        Sleep until the next deadline or until an earlier one is scheduled.
+
+        Args:
+            now: Current naive UTC time
+        """
+        next_deadline = self.next_deadline()
+        timeout = None
+        if next_deadline is not None:
+            timeout = max(0.0, (next_deadline - now).total_seconds())
+
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _drop_stale(self) -> None:
+        """Pop heap entries that were cancelled or moved"""
+        while self._heap:
+            verify_time, _, prediction_id = self._heap[0]
+            if self._deadlines.get(prediction_id) == verify_time:
+                return
+            heapq.heappop(self._heap)
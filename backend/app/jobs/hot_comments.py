@@ -0,0 +1,131 @@
+"""Maintain the hot comments rankings"""
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select
+
+from app.jobs.base import BaseJob
+from app.models.comment import Comment
+from app.services.hot_comments import hot_comments, hot_score
+from app.services.sharded_counter import comment_likes_counter
+
+logger = logging.getLogger(__name__)
+
+# Dirty comments rescored per run
+DIRTY_BATCH_SIZE = 5000
+
+# Full rebuilds consider comments this recent (older ones have decayed away)
+REBUILD_WINDOW = timedelta(days=7)
+REBUILD_INTERVAL = timedelta(hours=1)
+
+
+class HotCommentsJob(BaseJob):
+    """
+    Background job keeping the hot comments rankings current.
+
+    Every run rescores the comments whose likes or replies changed since
+    the last run (queued by the like flush and reply creation). Hourly,
+    the rankings are rebuilt from the last week's engaged comments to
+    drop drift. Runs every 30 seconds.
+    """
+
+    def __init__(self, session_factory=None, redis_client=None, interval_seconds: float = 30):
+        """
+        Initialize the ranking job.
+
+        Args:
+            session_factory: Async session factory of the job process
+            redis_client: Redis client holding the rankings
+            interval_seconds: How often to rescore
+        """
+        super().__init__(
+            interval_seconds=interval_seconds,
+            max_runtime_seconds=300,
+        )
+        self.session_factory = session_factory
+        self.redis_client = redis_client
+        self._last_rebuild: Optional[datetime] = None
+        self.rescored = 0
+
+    async def execute(self) -> None:
+        """Rescore dirty comments, or rebuild when due"""
+        if not self.session_factory or not self.redis_client:
+            return
+
+        now = datetime.utcnow()
+        if self._last_rebuild is None or now - self._last_rebuild >= REBUILD_INTERVAL:
+            await self._rebuild(now)
+            self._last_rebuild = now
+            return
+
+        comment_ids = await hot_comments.pop_dirty(self.redis_client, DIRTY_BATCH_SIZE)
+        if not comment_ids:
+            self.rescored = 0
+            return
+
+        scored = await self._score(self._dirty_stmt(comment_ids))
+        # Comments deleted or gone since they were queued leave the rankings
+        found = {comment_id for comment_id, _, _ in scored}
+        gone = await self._symbols_of([i for i in comment_ids if i not in found])
+        await hot_comments.update(self.redis_client, scored + gone)
+
+        self.rescored = len(comment_ids)
+        logger.info(f"Rescored {len(comment_ids)} hot comment candidates")
+
+    async def _rebuild(self, now: datetime) -> None:
+        scored = await self._score(self._candidates_stmt(now))
+        await hot_comments.update(
+            self.redis_client,
+            [entry for entry in scored if entry[2] is not None],
+            rebuild=True,
+        )
+        self.rescored = len(scored)
+        logger.info(f"Rebuilt hot comments from {len(scored)} candidates")
+
+    def _dirty_stmt(self, comment_ids: List[UUID]):
+        """Top-level, visible comments among the queued ones"""
+        return select(
+            Comment.id, Comment.symbol_code, Comment.replies_count, Comment.created_at
+        ).where(
+            Comment.id.in_(comment_ids),
+            Comment.parent_id.is_(None),
+            Comment.is_deleted.is_(False),
+        )
+
+    def _candidates_stmt(self, now: datetime):
+        """Recent engaged top-level comments"""
+        return select(
+            Comment.id, Comment.symbol_code, Comment.replies_count, Comment.created_at
+        ).where(
+            Comment.created_at >= now - REBUILD_WINDOW,
+            Comment.parent_id.is_(None),
+            Comment.is_deleted.is_(False),
+            or_(Comment.likes_count > 0, Comment.replies_count > 0),
+        )
+
+    async def _score(self, stmt):
+        """(comment_id, symbol_code, score) with likes summed from the counter shards"""
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+            likes = await comment_likes_counter.totals(session, [row.id for row in rows])
+
+        return [
+            (row.id, row.symbol_code, hot_score(likes.get(row.id, 0), row.replies_count, row.created_at))
+            for row in rows
+        ]
+
+    async def _symbols_of(self, comment_ids: List[UUID]):
+        """(comment_id, symbol_code, None) for comments to remove"""
+        if not comment_ids:
+            return []
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(Comment.id, Comment.symbol_code).where(Comment.id.in_(comment_ids))
+            )
+            return [(comment_id, symbol_code, None) for comment_id, symbol_code in result.all()]
+
+    def status_details(self) -> dict:
+        """Comments scored by the last run"""
+        return {"rescored": self.rescored}
@@ -0,0 +1,109 @@
+"""Recompute the heat of active predictions"""
+import logging
+from datetime import datetime, timedelta
+from typing import Dict
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from app.jobs.base import BaseJob
+from app.models.comment import Comment
+from app.models.prediction import Prediction
+from app.models.vote import Vote
+from app.services.hot_predictions import DECAY_RATE, HALF_LIFE_SECONDS, heat, hot_predictions
+
+logger = logging.getLogger(__name__)
+
+# Activity older than this many half-lives adds less than 0.1% and is ignored
+ACTIVITY_HALF_LIVES = 10
+
+
+def _decayed(column, now: datetime):
+    """SQL sum of exp(-DECAY_RATE * age) over a timestamp column"""
+    age = func.extract("epoch", now - column)
+    return func.coalesce(func.sum(func.exp(-DECAY_RATE * age)), 0)
+
+
+class HotPredictionsJob(BaseJob):
+    """
+    Background job rebuilding the hot predictions ranking.
+
+    Votes raise a prediction's heat incrementally as they are cast; this
+    job recomputes every active prediction's heat from recent votes,
+    recent comments on its symbol and its deadline, and drops predictions
+    that are no longer active. Runs every 5 minutes.
+    """
+
+    def __init__(self, session_factory=None, redis_client=None, interval_seconds: float = 300):
+        """
+        Initialize the ranking job.
+
+        Args:
+            session_factory: Async session factory of the job process
+            redis_client: Redis client holding the ranking
+            interval_seconds: How often to recompute
+        """
+        super().__init__(
+            interval_seconds=interval_seconds,
+            max_runtime_seconds=interval_seconds,
+        )
+        self.session_factory = session_factory
+        self.redis_client = redis_client
+        self.last_ranked = 0
+
+    async def execute(self) -> None:
+        """Recompute and swap in the ranking"""
+        if not self.session_factory or not self.redis_client:
+            return
+
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            predictions = (await session.execute(self._predictions_stmt(now))).all()
+            comments = dict((await session.execute(self._comments_stmt(now))).all())
+
+        scores: Dict[UUID, float] = {
+            row.id: heat(
+                float(row.vote_activity),
+                float(comments.get(row.symbol_code, 0)),
+                row.verify_time,
+                now,
+            )
+            for row in predictions
+        }
+        await hot_predictions.rebuild(self.redis_client, scores, now)
+
+        self.last_ranked = len(scores)
+        logger.info(f"Ranked {len(scores)} active predictions by heat")
+
+    def _predictions_stmt(self, now: datetime):
+        """Active predictions with their decayed vote activity"""
+        since = now - timedelta(seconds=HALF_LIFE_SECONDS * ACTIVITY_HALF_LIVES)
+        activity = (
+            select(Vote.prediction_id, _decayed(Vote.voted_at, now).label("activity"))
+            .where(Vote.voted_at >= since)
+            .group_by(Vote.prediction_id)
+            .subquery()
+        )
+        return (
+            select(
+                Prediction.id,
+                Prediction.symbol_code,
+                Prediction.verify_time,
+                func.coalesce(activity.c.activity, 0).label("vote_activity"),
+            )
+            .outerjoin(activity, activity.c.prediction_id == Prediction.id)
+            .where(Prediction.status == "active", Prediction.verify_time > now)
+        )
+
+    def _comments_stmt(self, now: datetime):
+        """Decayed comment activity per symbol"""
+        since = now - timedelta(seconds=HALF_LIFE_SECONDS * ACTIVITY_HALF_LIVES)
+        return (
+            select(Comment.symbol_code, _decayed(Comment.created_at, now))
+            .where(Comment.created_at >= since, Comment.is_deleted.is_(False))
+            .group_by(Comment.symbol_code)
+        )
+
+    def status_details(self) -> dict:
+        """Size of the last ranking"""
+        return {"ranked": self.last_ranked}
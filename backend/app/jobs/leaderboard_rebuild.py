@@ -0,0 +1,174 @@
+"""Rebuild prediction leaderboards from PostgreSQL"""
+import logging
+from datetime import datetime, time, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import Date, Integer, cast, func, select
+
+from app.jobs.base import BaseJob
+from app.models.prediction import Prediction
+from app.models.user_stats import UserPredictionStats
+from app.models.vote import Vote
+from app.services.leaderboard import leaderboard
+from app.services.scoring import SCORE_CORRECT, streak_bonus_sql
+
+logger = logging.getLogger(__name__)
+
+# Stats rows fetched per round trip while streaming
+STREAM_CHUNK_SIZE = 5000
+
+# Settlements stamped this long before the rebuild started may still have
+# been uncommitted when its snapshot was taken
+SNAPSHOT_MARGIN = timedelta(minutes=5)
+
+
+class LeaderboardRebuildJob(BaseJob):
+    """
+    Background job rebuilding the Redis leaderboards.
+
+    Settlement keeps the boards up to date incrementally; this job repairs
+    drift (missed updates, Redis restarts) by streaming
+    ``user_prediction_stats`` in chunks and swapping in fresh boards. The
+    day buckets of the windowed boards are rebuilt the same way from the
+    votes settled within their retention. Rows settled while the snapshots
+    were streamed are re-applied after the swaps, so the fresh boards never
+    roll back a settlement. It runs once at startup and then hourly.
+    """
+
+    def __init__(self, session_factory=None, redis_client=None, interval_seconds: float = 3600):
+        """
+        Initialize the rebuild job.
+
+        Args:
+            session_factory: Async session factory of the job process
+            redis_client: Redis client holding the boards
+            interval_seconds: How often to rebuild
+        """
+        super().__init__(
+            interval_seconds=interval_seconds,
+            jitter_seconds=60,
+            max_runtime_seconds=600,
+        )
+        self.session_factory = session_factory
+        self.redis_client = redis_client
+        self.last_users = 0
+        self.last_user_days = 0
+
+    async def execute(self) -> None:
+        """Rebuild all boards"""
+        if not self.session_factory or not self.redis_client:
+            return
+
+        started = datetime.utcnow() - SNAPSHOT_MARGIN
+        today = datetime.utcnow().date()
+        since = datetime.combine(leaderboard.bucket_days(today)[-1], time.min)
+
+        self.last_users = await leaderboard.rebuild(self.redis_client, self._stream_stats())
+        self.last_user_days = await leaderboard.rebuild_days(
+            self.redis_client, self._stream(self._day_totals_stmt(since)), today
+        )
+
+        # The swaps replaced whatever settlement wrote to the live boards meanwhile
+        async for chunk in self._stream_stats(started):
+            await leaderboard.update_users(self.redis_client, chunk)
+        async for chunk in self._stream(self._day_totals_stmt(since, settled_since=started)):
+            await leaderboard.set_days(self.redis_client, chunk)
+
+        logger.info(
+            f"Rebuilt leaderboards with {self.last_users} users "
+            f"and {self.last_user_days} user-days"
+        )
+
+    def _stream_stats(
+        self, updated_since: Optional[datetime] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stats rows, optionally only those updated since a time"""
+        stmt = select(
+            UserPredictionStats.user_id,
+            UserPredictionStats.total_participations,
+            UserPredictionStats.accuracy_rate,
+            UserPredictionStats.current_streak,
+            UserPredictionStats.prediction_score,
+        )
+        if updated_since is not None:
+            stmt = stmt.where(UserPredictionStats.updated_at >= updated_since)
+        return self._stream(stmt)
+
+    def _day_totals_stmt(self, since: datetime, settled_since: Optional[datetime] = None):
+        """
+        Per-user day totals of the votes settled since ``since``.
+
+        Points need the streak at each vote, which may have started before
+        ``since``: the streak is the running count of correct votes since
+        the user's last incorrect one, over their whole settled history.
+        Only users with a vote in range are read; with ``settled_since``,
+        only those in predictions settled since then.
+        """
+        voters = (
+            select(Vote.user_id)
+            .join(Prediction, Prediction.id == Vote.prediction_id)
+            .where(Prediction.status == "ended", Prediction.verify_time >= since)
+        )
+        if settled_since is not None:
+            voters = voters.where(Prediction.updated_at >= settled_since)
+
+        order = (Prediction.verify_time, Prediction.id)
+        votes = (
+            select(
+                Vote.user_id,
+                Prediction.id.label("prediction_id"),
+                Prediction.verify_time,
+                cast(Vote.is_correct, Integer).label("correct"),
+                # Incorrect votes so far; each one starts a new streak
+                func.count()
+                .filter(Vote.is_correct.is_(False))
+                .over(partition_by=Vote.user_id, order_by=order)
+                .label("breaks"),
+            )
+            .join(Prediction, Prediction.id == Vote.prediction_id)
+            .where(
+                Prediction.status == "ended",
+                Vote.is_correct.is_not(None),
+                Vote.user_id.in_(voters),
+            )
+            .subquery()
+        )
+        streaks = select(
+            votes.c.user_id,
+            votes.c.verify_time,
+            votes.c.correct,
+            func.sum(votes.c.correct)
+            .over(
+                partition_by=(votes.c.user_id, votes.c.breaks),
+                order_by=(votes.c.verify_time, votes.c.prediction_id),
+            )
+            .label("streak"),
+        ).subquery()
+
+        day = cast(streaks.c.verify_time, Date)
+        return (
+            select(
+                streaks.c.user_id,
+                day.label("day"),
+                func.count().label("participations"),
+                func.sum(streaks.c.correct).label("correct"),
+                func.sum(
+                    streaks.c.correct * (SCORE_CORRECT + streak_bonus_sql(streaks.c.streak))
+                ).label("points"),
+            )
+            .where(streaks.c.verify_time >= since)
+            .group_by(streaks.c.user_id, day)
+            .order_by(day, streaks.c.user_id)
+        )
+
+    async def _stream(self, stmt) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield rows in chunks without loading the whole result"""
+        stmt = stmt.execution_options(yield_per=STREAM_CHUNK_SIZE)
+        async with self.session_factory() as session:
+            result = await session.stream(stmt)
+            async for partition in result.mappings().partitions(STREAM_CHUNK_SIZE):
+                yield [dict(row) for row in partition]
+
+    def status_details(self) -> dict:
+        """Size of the last rebuild"""
+        return {"users": self.last_users, "user_days": self.last_user_days}
@@ -3,9 +3,18 @@ import logging
 from typing import List, Optional
 
 from app.jobs.base import BaseJob
+from app.jobs.comment_like_flush import CommentLikeFlushJob
+from app.jobs.counter_rollup import CounterRollupJob
+from app.jobs.hot_comments import HotCommentsJob
+from app.jobs.hot_predictions import HotPredictionsJob
+from app.jobs.leaderboard_rebuild import LeaderboardRebuildJob
 from app.jobs.price_fetcher import PriceFetcherJob
 from app.jobs.news_fetcher import NewsFetcherJob
 from app.jobs.prediction_verifier import PredictionVerifierJob
+from app.jobs.stats_recompute import StatsRecomputeJob
+from app.repositories.prediction_repository import PredictionRepository
+from app.repositories.quote_repository import QuoteRepository
+from app.repositories.settlement_repository import SettlementRepository
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +40,7 @@ class JobManager:
         redis_client=None,
         websocket_manager=None,
         notification_service=None,
+        session_factory=None,
     ):
         """
         Initialize the job manager with required services.
@@ -45,8 +55,11 @@ class JobManager:
             redis_client: Redis client
             websocket_manager: WebSocket manager
             notification_service: Notification service
+            session_factory: Session factory bound to the engine of the
+                process running the jobs (API or dedicated worker)
         """
         self.jobs: List[BaseJob] = []
+        self.session_factory = session_factory
 
         # Initialize jobs
         self._initialize_jobs(
@@ -63,12 +76,17 @@ class JobManager:
 
     def _initialize_jobs(self, **kwargs) -> None:
         """Initialize all background jobs"""
+        quote_repository = (
+            QuoteRepository(self.session_factory) if self.session_factory else None
+        )
 
         # Price Fetcher Job (every 5 seconds)
         price_fetcher = PriceFetcherJob(
             market_data_service=kwargs.get("market_data_service"),
             redis_client=kwargs.get("redis_client"),
             websocket_manager=kwargs.get("websocket_manager"),
+            session_factory=self.session_factory,
+            quote_repository=quote_repository,
         )
         self.jobs.append(price_fetcher)
 
@@ -81,16 +99,63 @@ class JobManager:
         self.jobs.append(news_fetcher)
 
         # Prediction Verifier Job (every 1 minute)
+        prediction_repository = kwargs.get("prediction_repository")
+        settlement_repository = None
+        if self.session_factory:
+            prediction_repository = prediction_repository or PredictionRepository(
+                self.session_factory
+            )
+            settlement_repository = SettlementRepository(self.session_factory)
+
         prediction_verifier = PredictionVerifierJob(
-            prediction_repository=kwargs.get("prediction_repository"),
+            prediction_repository=prediction_repository,
             vote_repository=kwargs.get("vote_repository"),
             user_stats_repository=kwargs.get("user_stats_repository"),
             market_data_service=kwargs.get("market_data_service"),
             websocket_manager=kwargs.get("websocket_manager"),
             notification_service=kwargs.get("notification_service"),
+            settlement_repository=settlement_repository,
+            redis_client=kwargs.get("redis_client"),
+            quote_repository=quote_repository,
         )
         self.jobs.append(prediction_verifier)
 
+        # Counter Rollup Job (every 1 minute)
+        counter_rollup = CounterRollupJob(session_factory=self.session_factory)
+        self.jobs.append(counter_rollup)
+
+        # Leaderboard Rebuild Job (at startup, then hourly)
+        leaderboard_rebuild = LeaderboardRebuildJob(
+            session_factory=self.session_factory,
+            redis_client=kwargs.get("redis_client"),
+        )
+        self.jobs.append(leaderboard_rebuild)
+
+        # Stats Recompute Job (at startup, then daily)
+        stats_recompute = StatsRecomputeJob(session_factory=self.session_factory)
+        self.jobs.append(stats_recompute)
+
+        # Hot Predictions Job (every 5 minutes)
+        hot_predictions = HotPredictionsJob(
+            session_factory=self.session_factory,
+            redis_client=kwargs.get("redis_client"),
+        )
+        self.jobs.append(hot_predictions)
+
+        # Comment Like Flush Job (every 5 seconds)
+        comment_like_flush = CommentLikeFlushJob(
+            session_factory=self.session_factory,
+            redis_client=kwargs.get("redis_client"),
+        )
+        self.jobs.append(comment_like_flush)
+
+        # Hot Comments Job (every 30 seconds, rebuilt hourly)
+        hot_comments = HotCommentsJob(
+            session_factory=self.session_factory,
+            redis_client=kwargs.get("redis_client"),
+        )
+        self.jobs.append(hot_comments)
+
         logger.info(f"Initialized {len(self.jobs)} background jobs")
 
     def start_all(self) -> None:
@@ -139,6 +204,10 @@ class JobManager:
                 "name": job.__class__.__name__,
                 "running": job._running,
                 "interval_seconds": job.interval_seconds,
+                "missed_tick_policy": job.missed_tick_policy.value,
+                "max_runtime_seconds": job.max_runtime_seconds,
+                "stats": job.stats.to_dict(),
+                "details": job.status_details(),
             })
 
         return status_list
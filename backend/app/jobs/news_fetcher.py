@@ -35,7 +35,11 @@ class NewsFetcherJob(BaseJob):
             news_repository: Repository to store news in database
             redis_client: Redis client for caching
         """
-        super().__init__(interval_seconds=900)  # 15 minutes = 900 seconds
+        super().__init__(
+            interval_seconds=900,  # 15 minutes = 900 seconds
+            jitter_seconds=30,
+            max_runtime_seconds=300,
+        )
         self.news_service = news_service
         self.news_repository = news_repository
         self.redis_client = redis_client
@@ -1,13 +1,41 @@
 """Prediction verification background job (Task 1.7.8)"""
+import asyncio
 import logging
-from typing import Optional, List
-from datetime import datetime
+import math
+from collections import defaultdict
+from typing import Dict, Optional, List
+from datetime import datetime, timedelta
 from decimal import Decimal
 
+from app.core.config import settings
 from app.jobs.base import BaseJob
+from app.jobs.deadline_scheduler import DeadlineScheduler
+from app.services.conditions import (
+    ConditionError,
+    compile_condition,
+    evaluate_batch,
+    load_intervals,
+    matches,
+)
+from app.services.leaderboard import leaderboard
+from app.services.feed_cache import prediction_feed
+from app.services.prediction_cache import invalidate_documents
+from app.services.prediction_events import DEADLINE_CHANNEL, parse_deadline
 
 logger = logging.getLogger(__name__)
 
+# Deadlines up to this far ahead are kept in the in-memory heap
+DEADLINE_HORIZON_SECONDS = 3600
+
+# Delay before resubscribing after the Redis connection dropped
+RESUBSCRIBE_DELAY_SECONDS = 5
+
+# Symbols whose backlog is settled concurrently (bounded by the job DB pool)
+VERIFY_CONCURRENCY = 4
+
+# Most 1min candles requested from the provider per symbol
+MAX_CANDLES = 5000
+
 
 class PredictionVerifierJob(BaseJob):
     """
@@ -17,13 +45,22 @@ class PredictionVerifierJob(BaseJob):
 
     Responsibilities:
     - Check predictions where verify_time <= NOW() and status = 'active'
-    - Fetch current price at verification time
+    - Resolve the price at verification time from stored price history
     - Calculate price change percentage
     - Determine correct answer based on verification rules
     - Update prediction and vote records
     - Update user prediction statistics (accuracy, streak)
     - Broadcast verification results via WebSocket
     - Send push notifications to participants
+
+    With a ``settlement_repository`` the prediction, its votes and the
+    voters' statistics are settled with a few bulk statements in one
+    transaction; otherwise the per-vote repository calls are used.
+
+    Predictions are verified at their exact deadline by a timer task fed
+    from an in-memory min-heap. The heap is filled by the periodic run
+    (which also verifies anything overdue, as a safety net) and by
+    deadline events published when predictions are created or cancelled.
     """
 
     def __init__(
@@ -34,6 +71,9 @@ class PredictionVerifierJob(BaseJob):
         market_data_service=None,
         websocket_manager=None,
         notification_service=None,
+        settlement_repository=None,
+        redis_client=None,
+        quote_repository=None,
     ):
         """
         Initialize the prediction verifier job.
@@ -45,47 +85,380 @@ class PredictionVerifierJob(BaseJob):
             market_data_service: Service to fetch current market prices
             websocket_manager: Manager to broadcast verification results
             notification_service: Service to send push notifications
+            settlement_repository: Repository settling predictions in bulk
+            redis_client: Redis client to receive deadline events and
+                invalidate cached prediction documents
+            quote_repository: Repository of stored price history
         """
-        super().__init__(interval_seconds=60)  # Run every 1 minute
+        # Reconcile scan only; deadlines themselves are handled by the timer
+        super().__init__(interval_seconds=300)  # Run every 5 minutes
         self.prediction_repository = prediction_repository
         self.vote_repository = vote_repository
         self.user_stats_repository = user_stats_repository
         self.market_data_service = market_data_service
         self.websocket_manager = websocket_manager
         self.notification_service = notification_service
+        self.settlement_repository = settlement_repository
+        self.settled_predictions = 0
+        self.settled_votes = 0
+        self.settlement_seconds = 0.0
+        self.last_votes_per_second: Optional[float] = None
+        self.redis_client = redis_client
+        self.quote_repository = quote_repository
+        self.deadlines = DeadlineScheduler()
+        self._verify_lock = asyncio.Lock()
+        self._deadline_tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the reconcile loop, the deadline timer and the event listener"""
+        if self._running:
+            super().start()
+            return
+
+        super().start()
+        self._deadline_tasks = [asyncio.create_task(self._deadline_loop())]
+        if self.redis_client:
+            self._deadline_tasks.append(asyncio.create_task(self._listen_deadlines()))
+
+    async def stop(self) -> None:
+        """Stop all tasks of the job"""
+        for task in self._deadline_tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._deadline_tasks = []
+
+        await super().stop()
 
     async def execute(self) -> None:
-        """Verify predictions that have reached their deadline"""
+        """
+        Reconcile scan: verify overdue predictions and refill the deadline heap.
+
+        Catches anything the timer missed (events lost while the worker was
+        down, predictions beyond the heap horizon at the previous scan).
+        """
         try:
             # Find predictions that need verification
             predictions = await self._find_predictions_to_verify()
 
-            if not predictions:
+            if predictions:
+                await self._verify_predictions(predictions)
+            else:
                 logger.debug("No predictions to verify")
-                return
 
+            await self._schedule_upcoming()
+
+        except Exception as e:
+            logger.error(f"Error in prediction verification job: {str(e)}", exc_info=True)
+
+    async def _verify_predictions(self, predictions: List[dict]) -> None:
+        """
+        Verify a batch of predictions, grouped by symbol.
+
+        Each symbol group resolves the prices at all its deadlines with one
+        lookup, then settles its predictions in deadline order. Up to
+        VERIFY_CONCURRENCY groups run at once, so a backlog after downtime
+        is caught up quickly without exhausting the connection pool.
+
+        Runs are serialized so the timer and the reconcile scan never settle
+        the same prediction concurrently.
+
+        Args:
+            predictions: Predictions to verify
+        """
+        async with self._verify_lock:
             logger.info(f"Verifying {len(predictions)} predictions")
 
+            by_symbol: Dict[str, List[dict]] = defaultdict(list)
             for prediction in predictions:
+                self.deadlines.cancel(prediction.get("id"))
+                by_symbol[prediction.get("symbol_code")].append(prediction)
+
+            semaphore = asyncio.Semaphore(VERIFY_CONCURRENCY)
+            await asyncio.gather(*(
+                self._verify_symbol_group(symbol_code, group, semaphore)
+                for symbol_code, group in by_symbol.items()
+            ))
+
+            logger.info("Prediction verification completed")
+
+    async def _verify_symbol_group(
+        self, symbol_code: str, predictions: List[dict], semaphore: asyncio.Semaphore
+    ) -> None:
+        """
+        Verify the predictions of one symbol.
+
+        Args:
+            symbol_code: Symbol shared by all predictions
+            predictions: Predictions to verify
+            semaphore: Bounds the number of symbols verified concurrently
+        """
+        async with semaphore:
+            predictions = sorted(predictions, key=self._verify_time)
+
+            try:
+                prices = await self._resolve_prices(
+                    symbol_code, [self._verify_time(p) for p in predictions]
+                )
+            except Exception as e:
+                logger.error(f"Failed to resolve prices for {symbol_code}: {str(e)}")
+                return
+
+            correct_options = self._batch_correct_options(predictions, prices)
+
+            for prediction, price, correct_option in zip(predictions, prices, correct_options):
+                # A price the batch could not resolve is final for this run
+                if price is None:
+                    await self._handle_unpriced(prediction)
+                    continue
                 try:
-                    await self._verify_prediction(prediction)
+                    await self._verify_prediction(prediction, price, correct_option)
                 except Exception as e:
                     logger.error(
                         f"Failed to verify prediction {prediction.get('id')}: {str(e)}",
                         exc_info=True
                     )
 
-            logger.info("Prediction verification completed")
+    async def _handle_unpriced(self, prediction: dict) -> None:
+        """
+        Skip a prediction whose deadline price is unknown.
+
+        Deadlines older than the candle history the provider returns can
+        never be priced, so they are flagged for a moderator
+        (``price_unresolved_at``) instead of being retried by every
+        reconcile scan; newer ones are retried. The author's
+        ``verify_rule`` is left as it is.
+
+        Args:
+            prediction: Prediction without a price
+        """
+        prediction_id = prediction.get("id")
+        age = datetime.utcnow() - self._verify_time(prediction)
+        if age <= timedelta(minutes=MAX_CANDLES - 1) or not self.prediction_repository:
+            logger.warning(f"No price for prediction {prediction_id} yet, retrying next scan")
+            return
+
+        await self.prediction_repository.update(
+            prediction_id, {"price_unresolved_at": datetime.utcnow()}
+        )
+        logger.warning(
+            f"Prediction {prediction_id} is older than the {MAX_CANDLES} minute candle "
+            f"history and has no stored price: flagged for review"
+        )
+
+    def _batch_correct_options(
+        self, predictions: List[dict], prices: List[Optional[Decimal]]
+    ) -> List[Optional[str]]:
+        """
+        Evaluate the conditions of a symbol group in one vectorized pass.
+
+        Args:
+            predictions: Predictions of one symbol
+            prices: Price at each prediction's verification time
+
+        Returns:
+            Correct option per prediction, None where it is left to
+            ``_determine_correct_option`` (manual rule, no price, no match)
+        """
+        changes = [
+            float(self._calculate_price_change(
+                Decimal(str(p.get("price_at_create", 0))), price
+            )) if price else float("nan")
+            for p, price in zip(predictions, prices)
+        ]
+        conditions = [
+            p.get("auto_verify_conditions") if p.get("verify_rule", "auto") == "auto" else None
+            for p in predictions
+        ]
 
+        try:
+            return evaluate_batch(conditions, changes)
+        except ConditionError as e:
+            logger.error(f"Invalid stored condition, evaluating one by one: {str(e)}")
+            return [None] * len(predictions)
+
+    @staticmethod
+    def _verify_time(prediction: dict) -> datetime:
+        """Deadline of a prediction (now when unknown)"""
+        return prediction.get("verify_time") or datetime.utcnow()
+
+    async def _resolve_prices(
+        self, symbol_code: str, verify_times: List[datetime]
+    ) -> List[Optional[Decimal]]:
+        """
+        Get the price of a symbol at each verification time.
+
+        Sources, in order: stored ticks at or shortly before the deadline
+        (one query for all deadlines), provider 1min candles covering the
+        deadlines (one call per symbol), and the live quote for deadlines
+        that have only just passed.
+
+        Args:
+            symbol_code: Symbol code
+            verify_times: Naive UTC deadlines
+
+        Returns:
+            Price per deadline (same order), None where it cannot be resolved
+        """
+        max_gap = settings.PRICE_AT_VERIFY_MAX_GAP_SECONDS
+        prices: List[Optional[Decimal]] = [None] * len(verify_times)
+
+        if self.quote_repository:
+            prices = await self.quote_repository.prices_at(symbol_code, verify_times, max_gap)
+
+        missing = [i for i, price in enumerate(prices) if price is None]
+        if not missing:
+            return prices
+
+        now = datetime.utcnow()
+        overdue = [i for i in missing if (now - verify_times[i]).total_seconds() > max_gap]
+        if overdue:
+            candle_prices = await self._candle_prices(
+                symbol_code, [verify_times[i] for i in overdue]
+            )
+            for i, price in zip(overdue, candle_prices):
+                prices[i] = price
+
+        # The live price is only the price at the deadline if it just passed
+        recent = [i for i in missing if i not in overdue]
+        if recent:
+            current_price = await self._fetch_current_price(symbol_code)
+            for i in recent:
+                prices[i] = current_price
+
+        return prices
+
+    async def _candle_prices(
+        self, symbol_code: str, verify_times: List[datetime]
+    ) -> List[Optional[Decimal]]:
+        """
+        Resolve prices from provider 1min candles.
+
+        The price at a deadline is the close of the last candle that ended
+        at or before it.
+
+        Args:
+            symbol_code: Symbol code
+            verify_times: Naive UTC deadlines
+
+        Returns:
+            Price per deadline, None where no candle covers it
+        """
+        if not self.market_data_service or not hasattr(self.market_data_service, "get_time_series"):
+            return [None] * len(verify_times)
+
+        # Deadlines beyond the history the provider returns are not requested
+        now = datetime.utcnow()
+        coverable = [t for t in verify_times if now - t <= timedelta(minutes=MAX_CANDLES - 1)]
+        if not coverable:
+            return [None] * len(verify_times)
+        minutes = math.ceil((now - min(coverable)).total_seconds() / 60) + 1
+
+        try:
+            candles = await self.market_data_service.get_time_series(
+                symbol_code, interval="1min", outputsize=min(minutes, MAX_CANDLES)
+            )
         except Exception as e:
-            logger.error(f"Error in prediction verification job: {str(e)}", exc_info=True)
+            logger.error(f"Failed to fetch candles for {symbol_code}: {str(e)}")
+            return [None] * len(verify_times)
+
+        # Candle timestamps are minute starts; newest first from the provider
+        closes = sorted(
+            (candle["timestamp"].replace(tzinfo=None) + timedelta(minutes=1), candle["close"])
+            for candle in candles or []
+        )
+
+        prices = []
+        for verify_time in verify_times:
+            price = None
+            for closed_at, close in closes:
+                if closed_at > verify_time:
+                    break
+                price = close
+            prices.append(Decimal(str(price)) if price is not None else None)
+        return prices
+
+    async def _schedule_upcoming(self) -> None:
+        """Load deadlines within the horizon into the heap"""
+        if not self.prediction_repository:
+            return
+
+        now = datetime.utcnow()
+        upcoming = await self.prediction_repository.find_by_criteria({
+            "verify_time__gt": now,
+            "verify_time__lte": now + timedelta(seconds=DEADLINE_HORIZON_SECONDS),
+            "status": "active",
+            "verify_rule": "auto",
+            "price_unresolved_at": None,
+        })
+
+        for prediction in upcoming:
+            self.deadlines.schedule(prediction["id"], prediction["verify_time"])
+
+    async def _deadline_loop(self) -> None:
+        """Verify predictions as soon as their deadline passes"""
+        while self._running:
+            await self.deadlines.wait(datetime.utcnow())
+
+            due = self.deadlines.pop_due(datetime.utcnow())
+            if not due or not self.prediction_repository:
+                continue
+
+            try:
+                predictions = await self.prediction_repository.find_by_criteria({
+                    "id__in": due,
+                    "status": "active",
+                    "verify_rule": "auto",
+                    "price_unresolved_at": None,
+                })
+                if predictions:
+                    await self._verify_predictions(predictions)
+            except Exception as e:
+                logger.error(f"Error verifying due predictions: {str(e)}", exc_info=True)
+
+    async def _listen_deadlines(self) -> None:
+        """Feed the heap from deadline events published by the API"""
+        while self._running:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(DEADLINE_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._handle_deadline_event(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Deadline event subscription failed: {str(e)}")
+                await asyncio.sleep(RESUBSCRIBE_DELAY_SECONDS)
+            finally:
+                await pubsub.close()
+
+    def _handle_deadline_event(self, data) -> None:
+        """
+        Apply a deadline event to the heap.
+
+        Args:
+            data: Raw message published by ``publish_deadline``
+        """
+        try:
+            prediction_id, verify_time = parse_deadline(data)
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring malformed deadline event: {str(e)}")
+            return
+
+        if verify_time is None:
+            self.deadlines.cancel(prediction_id)
+        elif verify_time <= datetime.utcnow() + timedelta(seconds=DEADLINE_HORIZON_SECONDS):
+            self.deadlines.schedule(prediction_id, verify_time)
 
     async def _find_predictions_to_verify(self) -> List[dict]:
         """
         Find predictions that need verification.
 
         Returns:
-            List of predictions where verify_time has passed and status is active
+            Auto-verified predictions where verify_time has passed and status is active
         """
         if not self.prediction_repository:
             logger.warning("Prediction repository not configured")
@@ -93,9 +466,13 @@ class PredictionVerifierJob(BaseJob):
 
         try:
             now = datetime.utcnow()
+            # Manual predictions, and ones whose price could not be found,
+            # wait for a moderator and are never priced
             predictions = await self.prediction_repository.find_by_criteria({
                 "verify_time__lte": now,
-                "status": "active"
+                "status": "active",
+                "verify_rule": "auto",
+                "price_unresolved_at": None,
             })
 
             return predictions
@@ -104,12 +481,20 @@ class PredictionVerifierJob(BaseJob):
             logger.error(f"Failed to find predictions to verify: {str(e)}")
             return []
 
-    async def _verify_prediction(self, prediction: dict) -> None:
+    async def _verify_prediction(
+        self,
+        prediction: dict,
+        current_price: Optional[Decimal],
+        correct_option: Optional[str] = None,
+    ) -> None:
         """
         Verify a single prediction.
 
         Args:
             prediction: Prediction data
+            current_price: Price at the verification time, resolved for the
+                whole symbol group
+            correct_option: Correct option if already evaluated
         """
         prediction_id = prediction.get("id")
         symbol_code = prediction.get("symbol_code")
@@ -117,10 +502,9 @@ class PredictionVerifierJob(BaseJob):
 
         logger.info(f"Verifying prediction {prediction_id} for {symbol_code}")
 
-        # Step 1: Fetch current price
-        current_price = await self._fetch_current_price(symbol_code)
+        # Step 1: The price at the verification time is resolved per symbol group
         if not current_price:
-            logger.error(f"Failed to fetch price for {symbol_code}")
+            logger.error(f"No price for {symbol_code}")
             return
 
         # Step 2: Calculate price change percentage
@@ -135,9 +519,10 @@ class PredictionVerifierJob(BaseJob):
         )
 
         # Step 3: Determine correct answer
-        correct_option = await self._determine_correct_option(
-            prediction, price_change_percent
-        )
+        if correct_option is None:
+            correct_option = await self._determine_correct_option(
+                prediction, price_change_percent
+            )
 
         if not correct_option:
             logger.error(f"Failed to determine correct option for {prediction_id}")
@@ -145,22 +530,39 @@ class PredictionVerifierJob(BaseJob):
 
         logger.info(f"Correct option: {correct_option}")
 
-        # Step 4: Update prediction record
-        await self._update_prediction(
-            prediction_id, current_price, correct_option
-        )
+        votes = None
+        if self.settlement_repository:
+            # Steps 4-6 as one set-based transaction
+            result = await self._settle(prediction_id, current_price, correct_option)
+            if result is None:
+                logger.info(f"Prediction {prediction_id} was already settled")
+                return
+            votes = result.votes if self.notification_service else None
+            await leaderboard.update_users(self.redis_client, result.stats)
+            await leaderboard.record_settlement(
+                self.redis_client, result.stats, self._verify_time(prediction).date()
+            )
+        else:
+            # Step 4: Update prediction record
+            await self._update_prediction(
+                prediction_id, current_price, correct_option
+            )
 
-        # Step 5: Update all vote records
-        await self._update_votes(prediction_id, correct_option)
+            # Step 5: Update all vote records
+            await self._update_votes(prediction_id, correct_option)
 
-        # Step 6: Update user statistics
-        await self._update_user_statistics(prediction_id)
+            # Step 6: Update user statistics
+            await self._update_user_statistics(prediction_id)
+
+        # Cached API documents and feeds still show the prediction as active
+        await invalidate_documents(self.redis_client, [prediction_id])
+        await prediction_feed.invalidate(self.redis_client, [symbol_code])
 
         # Step 7: Broadcast verification result
         await self._broadcast_verification(prediction, correct_option, current_price)
 
         # Step 8: Send notifications to participants
-        await self._send_notifications(prediction, correct_option)
+        await self._send_notifications(prediction, correct_option, votes)
 
         logger.info(f"Successfully verified prediction {prediction_id}")
 
@@ -172,7 +574,7 @@ class PredictionVerifierJob(BaseJob):
             symbol_code: Symbol to fetch price for
 
         Returns:
-            Current price as Decimal or None if failed
+            Current price as Decimal or None if failed or stale
         """
         if not self.market_data_service:
             logger.warning("Market data service not configured")
@@ -180,6 +582,11 @@ class PredictionVerifierJob(BaseJob):
 
         try:
             quote = await self.market_data_service.get_latest_quote(symbol_code)
+            # A stale quote is the last known price replayed while the provider
+            # is down; settlement is final, so wait for the next scan instead
+            if quote and quote.get("is_stale"):
+                logger.warning(f"Stale quote for {symbol_code}, not settling at it")
+                return None
             if quote and "price" in quote:
                 return Decimal(str(quote["price"]))
             return None
@@ -227,15 +634,17 @@ class PredictionVerifierJob(BaseJob):
             logger.info("Manual verification required")
             return None
 
-        # Auto verification based on conditions
-        conditions = prediction.get("auto_verify_conditions", {})
+        # Auto verification based on compiled conditions
+        conditions = prediction.get("auto_verify_conditions") or {}
 
         for option_key, condition_data in conditions.items():
-            condition = condition_data.get("condition", "")
+            try:
+                intervals = load_intervals(condition_data)
+            except ConditionError as e:
+                logger.error(f"Invalid condition for option {option_key}: {str(e)}")
+                continue
 
-            # Evaluate condition
-            # Example: "price_change_percent >= 1.0"
-            if self._evaluate_condition(condition, price_change_percent):
+            if matches(intervals, float(price_change_percent)):
                 return option_key
 
         logger.warning("No matching condition found")
@@ -253,19 +662,60 @@ class PredictionVerifierJob(BaseJob):
             True if condition is met
         """
         try:
-            # Replace placeholder with actual value
-            condition_str = condition.replace(
-                "price_change_percent", str(price_change)
-            )
-
-            # Safely evaluate the condition
-            # Note: In production, use a proper expression parser
-            return eval(condition_str)
-
-        except Exception as e:
+            return matches(compile_condition(condition), float(price_change))
+        except ConditionError as e:
             logger.error(f"Failed to evaluate condition '{condition}': {str(e)}")
             return False
 
+    async def _settle(self, prediction_id, current_price: Decimal, correct_option: str):
+        """
+        Settle a prediction through the settlement repository.
+
+        Args:
+            prediction_id: Prediction ID
+            current_price: Price at verification time
+            correct_option: Determined correct option
+
+        Returns:
+            SettlementResult, or None if the prediction was no longer active
+        """
+        result = await self.settlement_repository.settle(
+            prediction_id,
+            current_price,
+            correct_option,
+            return_votes=self.notification_service is not None,
+        )
+        if result is None:
+            return None
+
+        self.settled_predictions += 1
+        self.settled_votes += result.votes_settled
+        self.settlement_seconds += result.elapsed_seconds
+        self.last_votes_per_second = result.votes_per_second
+
+        logger.info(
+            f"Settled {result.votes_settled} votes of prediction {prediction_id} "
+            f"in {result.elapsed_seconds * 1000:.1f}ms "
+            f"({result.votes_per_second or 0:.0f} votes/sec)"
+        )
+        return result
+
+    def status_details(self) -> dict:
+        """Settlement throughput for the job status endpoint"""
+        return {
+            "scheduled_deadlines": len(self.deadlines),
+            "settled_predictions": self.settled_predictions,
+            "settled_votes": self.settled_votes,
+            "votes_per_second": (
+                round(self.settled_votes / self.settlement_seconds, 1)
+                if self.settlement_seconds > 0 else None
+            ),
+            "last_votes_per_second": (
+                round(self.last_votes_per_second, 1)
+                if self.last_votes_per_second is not None else None
+            ),
+        }
+
     async def _update_prediction(
         self, prediction_id: str, current_price: Decimal, correct_option: str
     ) -> None:
@@ -371,7 +821,7 @@ class PredictionVerifierJob(BaseJob):
             logger.error(f"Failed to broadcast verification: {str(e)}")
 
     async def _send_notifications(
-        self, prediction: dict, correct_option: str
+        self, prediction: dict, correct_option: str, votes: Optional[List[dict]] = None
     ) -> None:
         """
         Send push notifications to all participants.
@@ -379,8 +829,11 @@ class PredictionVerifierJob(BaseJob):
         Args:
             prediction: Prediction data
             correct_option: Correct option key
+            votes: Settled votes if already known (loaded otherwise)
         """
-        if not self.notification_service or not self.vote_repository:
+        if not self.notification_service:
+            return
+        if votes is None and not self.vote_repository:
             return
 
         try:
@@ -388,7 +841,8 @@ class PredictionVerifierJob(BaseJob):
             question = prediction.get("question")
 
             # Get all users who voted
-            votes = await self.vote_repository.find_by_prediction(prediction_id)
+            if votes is None:
+                votes = await self.vote_repository.find_by_prediction(prediction_id)
 
             for vote in votes:
                 user_id = vote.get("user_id")
@@ -1,11 +1,33 @@
 """Price fetching background job (Task 1.4.4)"""
 import logging
-from typing import Optional
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
 
+from sqlalchemy import select
+
+from app.core.config import settings
 from app.jobs.base import BaseJob
+from app.models.symbol import Symbol
+from app.services.tick_store import TickStore, tick_store as default_tick_store
+from app.services.trading_calendar import TradingCalendar, trading_calendar
 
 logger = logging.getLogger(__name__)
 
+# How often the list of active symbols is reloaded from the database
+SYMBOL_REFRESH_SECONDS = 60
+
+# Symbols used until the database has been read (or when it is not
+# configured), mapped to their Symbol.market
+DEFAULT_SYMBOLS: Dict[str, str] = {
+    "XAUUSD": "LBMA",  # Spot Gold
+    "XAGUSD": "LBMA",  # Spot Silver
+    "EURUSD": "FOREX",  # EUR/USD
+    "GBPUSD": "FOREX",  # GBP/USD
+    "USDJPY": "FOREX",  # USD/JPY
+    "BTCUSD": "CRYPTO",  # Bitcoin
+}
+
 
 class PriceFetcherJob(BaseJob):
     """
@@ -16,8 +38,13 @@ class PriceFetcherJob(BaseJob):
     Responsibilities:
     - Fetch latest prices from external market data API
     - Store in Redis with 5s TTL
-    - Optionally store in PostgreSQL for historical data
+    - Feed the tick store that write endpoints read price anchors from
+    - Store in PostgreSQL as price history (one INSERT per run)
     - Broadcast to WebSocket clients subscribed to each symbol
+
+    Symbols whose market is closed (weekends, holidays, session breaks) are
+    only polled every ``closed_poll_seconds`` to save provider credits and
+    writes; their price does not move outside the session anyway.
     """
 
     def __init__(
@@ -25,6 +52,11 @@ class PriceFetcherJob(BaseJob):
         market_data_service=None,
         redis_client=None,
         websocket_manager=None,
+        calendar: Optional[TradingCalendar] = None,
+        closed_poll_seconds: Optional[float] = None,
+        tick_store: Optional[TickStore] = None,
+        session_factory=None,
+        quote_repository=None,
     ):
         """
         Initialize the price fetcher job.
@@ -33,51 +65,122 @@ class PriceFetcherJob(BaseJob):
             market_data_service: Service to fetch market data from external API
             redis_client: Redis client for caching
             websocket_manager: Manager to broadcast price updates
+            calendar: Trading calendar deciding which markets are in session
+            closed_poll_seconds: Polling interval for symbols of closed markets
+            tick_store: Latest-tick store used for price anchors
+            session_factory: Session factory used to load the active symbols
+            quote_repository: Repository storing ticks as price history
         """
-        super().__init__(interval_seconds=5)
+        # A fetch cycle slower than a few intervals only delivers stale prices
+        super().__init__(interval_seconds=5, max_runtime_seconds=15)
         self.market_data_service = market_data_service
         self.redis_client = redis_client
         self.websocket_manager = websocket_manager
+        self.calendar = calendar or trading_calendar
+        self.closed_poll_seconds = (
+            closed_poll_seconds
+            if closed_poll_seconds is not None
+            else settings.CLOSED_MARKET_POLL_SECONDS
+        )
+        self.tick_store = tick_store or default_tick_store
+        self.session_factory = session_factory
+        self.quote_repository = quote_repository
+        self.symbols: Dict[str, str] = dict(DEFAULT_SYMBOLS)
+        self._last_fetched: Dict[str, float] = {}
+        self._symbols_loaded_at: Optional[float] = None
 
     async def execute(self) -> None:
         """Fetch and cache prices for all active symbols"""
         try:
-            # TODO: Get list of active symbols from database
-            # For now, use default symbols
-            default_symbols = [
-                "XAUUSD",  # Spot Gold
-                "XAGUSD",  # Spot Silver
-                "EURUSD",  # EUR/USD
-                "GBPUSD",  # GBP/USD
-                "USDJPY",  # USD/JPY
-                "BTCUSD",  # Bitcoin
-            ]
-
-            logger.debug(f"Fetching prices for {len(default_symbols)} symbols")
-
-            for symbol in default_symbols:
+            await self._refresh_symbols()
+            due_symbols = self._symbols_due()
+
+            logger.debug(
+                f"Fetching prices for {len(due_symbols)}/{len(self.symbols)} symbols"
+            )
+
+            fetched = []
+            for symbol in due_symbols:
                 try:
                     # Fetch price from external API
                     price_data = await self._fetch_price_for_symbol(symbol)
 
-                    if price_data:
+                    # A stale quote is the last known price replayed while the
+                    # provider is down; it must not look like a new tick
+                    if price_data and not price_data.get("is_stale"):
+                        self._last_fetched[symbol] = time.monotonic()
+
+                        # Record the tick for price anchors
+                        await self._record_tick(symbol, price_data)
+
                         # Cache in Redis
                         await self._cache_price(symbol, price_data)
 
                         # Broadcast to WebSocket clients
                         await self._broadcast_price(symbol, price_data)
 
-                        # Optionally store in database for historical data
-                        # await self._store_historical_price(symbol, price_data)
+                        fetched.append({**price_data, "symbol_code": symbol})
 
                 except Exception as e:
                     logger.error(f"Error fetching price for {symbol}: {str(e)}")
 
+            # Store all ticks of this run as price history in one INSERT
+            await self._store_historical_prices(fetched)
+
             logger.debug("Price fetching completed")
 
         except Exception as e:
             logger.error(f"Error in price fetching job: {str(e)}", exc_info=True)
 
+    async def _refresh_symbols(self) -> None:
+        """Reload active symbols and their markets from the database"""
+        if not self.session_factory:
+            return
+
+        now = time.monotonic()
+        if (
+            self._symbols_loaded_at is not None
+            and now - self._symbols_loaded_at < SYMBOL_REFRESH_SECONDS
+        ):
+            return
+
+        try:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(Symbol.code, Symbol.market).where(Symbol.is_active == True)
+                )
+                symbols = {code: market for code, market in result.all()}
+
+            if symbols:
+                self.symbols = symbols
+            self._symbols_loaded_at = now
+        except Exception as e:
+            logger.error(f"Failed to load active symbols: {str(e)}")
+
+    def _symbols_due(self) -> List[str]:
+        """
+        Get the symbols to poll in this run.
+
+        Symbols of open markets are polled every run; symbols of closed
+        markets only once per ``closed_poll_seconds``.
+
+        Returns:
+            List of symbol codes
+        """
+        now = time.monotonic()
+        due = []
+
+        for symbol, market in self.symbols.items():
+            if self.calendar.is_open(market):
+                due.append(symbol)
+                continue
+
+            last_fetched = self._last_fetched.get(symbol)
+            if last_fetched is None or now - last_fetched >= self.closed_poll_seconds:
+                due.append(symbol)
+
+        return due
+
     async def _fetch_price_for_symbol(self, symbol: str) -> Optional[dict]:
         """
         Fetch price data for a specific symbol from external API.
@@ -101,10 +204,31 @@ class PriceFetcherJob(BaseJob):
             logger.error(f"Failed to fetch price for {symbol}: {str(e)}")
             return None
 
+    async def _record_tick(self, symbol: str, price_data: dict) -> None:
+        """
+        Record the latest tick for price anchors.
+
+        Args:
+            symbol: Symbol code
+            price_data: Price data fetched from the provider
+        """
+        try:
+            await self.tick_store.update(
+                symbol,
+                price_data,
+                redis_client=self.redis_client,
+                market=self.symbols.get(symbol),
+            )
+        except Exception as e:
+            logger.error(f"Failed to record tick for {symbol}: {str(e)}")
+
     async def _cache_price(self, symbol: str, price_data: dict) -> None:
         """
         Cache price data in Redis with 5s TTL.
 
+        While the symbol's market is closed the TTL is extended to the
+        closed-market polling interval so readers keep hitting the cache.
+
         Args:
             symbol: Symbol code
             price_data: Price data to cache
@@ -115,10 +239,19 @@ class PriceFetcherJob(BaseJob):
 
         try:
             cache_key = f"quote:{symbol}"
-            # Store as hash in Redis
-            await self.redis_client.hset(cache_key, mapping=price_data)
-            # Set TTL to 5 seconds
-            await self.redis_client.expire(cache_key, 5)
+            # Store as hash in Redis (hash values must be scalars)
+            mapping = {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in price_data.items()
+                if value is not None
+            }
+            await self.redis_client.hset(cache_key, mapping=mapping)
+            # Set TTL to 5 seconds (closed-market polling interval when closed)
+            ttl = 5
+            market = self.symbols.get(symbol)
+            if market and not self.calendar.is_open(market):
+                ttl = int(self.closed_poll_seconds)
+            await self.redis_client.expire(cache_key, ttl)
 
             logger.debug(f"Cached price for {symbol}")
         except Exception as e:
@@ -151,14 +284,20 @@ class PriceFetcherJob(BaseJob):
         except Exception as e:
             logger.error(f"Failed to broadcast price for {symbol}: {str(e)}")
 
-    async def _store_historical_price(self, symbol: str, price_data: dict) -> None:
+    async def _store_historical_prices(self, prices: List[dict]) -> None:
         """
-        Store price data in PostgreSQL for historical charting.
+        Store price data in PostgreSQL for charting and for resolving
+        prices at prediction deadlines.
 
         Args:
-            symbol: Symbol code
-            price_data: Price data to store
+            prices: Price data of this run, each with its symbol_code
         """
-        # TODO: Implement historical price storage
-        # This will be implemented when the quotes repository is ready
-        pass
+        if not self.quote_repository or not prices:
+            return
+
+        try:
+            for price_data in prices:
+                price_data.setdefault("timestamp", datetime.utcnow())
+            await self.quote_repository.add_many(prices)
+        except Exception as e:
+            logger.error(f"Failed to store price history: {str(e)}")
@@ -0,0 +1,169 @@
+"""Recompute user prediction statistics from settled votes"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.jobs.base import BaseJob
+from app.models.prediction import Prediction
+from app.models.user_stats import UserPredictionStats
+from app.models.vote import Vote
+from app.services.scoring import DEFAULT_RANK_TITLE
+from app.services.stats_recompute import StatsAccumulator
+
+logger = logging.getLogger(__name__)
+
+# Votes fetched per round trip while streaming
+STREAM_CHUNK_SIZE = 50000
+
+# Stats rows written by one INSERT ... ON CONFLICT
+UPSERT_BATCH_SIZE = 1000
+
+# Rows settled this recently are left to the verifier: the vote may have
+# committed after the recompute's snapshot was taken
+RECENT_UPDATE_MARGIN = timedelta(minutes=5)
+
+_RECOMPUTED_COLUMNS = (
+    "total_participations",
+    "correct_count",
+    "accuracy_rate",
+    "current_streak",
+    "max_streak",
+    "prediction_score",
+    "rank_title",
+)
+
+
+class StatsRecomputeJob(BaseJob):
+    """
+    Background job rebuilding ``user_prediction_stats`` from the votes.
+
+    Settlement updates statistics incrementally, so a missed or repeated
+    update would otherwise never be repaired. This job streams every
+    settled vote ordered by user and deadline, computes accuracy, streaks
+    and points chunk by chunk with array operations, and bulk-upserts the
+    results. Users whose row changed during the run are skipped; the next
+    run picks them up. Predictions created (``total_predictions``) are not
+    touched. Runs once at startup and then daily.
+    """
+
+    def __init__(self, session_factory=None, interval_seconds: float = 86400):
+        """
+        Initialize the recompute job.
+
+        Args:
+            session_factory: Async session factory of the job process
+            interval_seconds: How often to recompute
+        """
+        super().__init__(
+            interval_seconds=interval_seconds,
+            jitter_seconds=300,
+            max_runtime_seconds=3600,
+        )
+        self.session_factory = session_factory
+        self.last_votes = 0
+        self.last_users = 0
+
+    async def execute(self) -> None:
+        """Recompute the statistics of all voters"""
+        if not self.session_factory:
+            return
+
+        cutoff = datetime.utcnow() - RECENT_UPDATE_MARGIN
+        accumulator = StatsAccumulator()
+        votes = users = 0
+
+        async with self.session_factory() as session:
+            result = await session.stream(self._votes_stmt())
+            async for partition in result.partitions(STREAM_CHUNK_SIZE):
+                votes += len(partition)
+                user_ids = [row[0] for row in partition]
+                correct = [row[1] for row in partition]
+                rows = accumulator.add(user_ids, correct)
+                users += len(rows)
+                await self._upsert(rows, cutoff)
+
+        rows = accumulator.finish()
+        users += len(rows)
+        await self._upsert(rows, cutoff)
+        await self._reset_inactive(cutoff)
+
+        self.last_votes = votes
+        self.last_users = users
+        logger.info(f"Recomputed statistics of {users} users from {votes} settled votes")
+
+    def _votes_stmt(self):
+        """Settled votes grouped by user, in settlement order"""
+        return (
+            select(Vote.user_id, Vote.is_correct)
+            .join(Prediction, Prediction.id == Vote.prediction_id)
+            .where(Prediction.status == "ended", Vote.is_correct.is_not(None))
+            .order_by(Vote.user_id, Prediction.verify_time, Prediction.id)
+            .execution_options(yield_per=STREAM_CHUNK_SIZE)
+        )
+
+    def _upsert_stmt(self, rows: List[Dict[str, Any]], cutoff: datetime):
+        """INSERT ... ON CONFLICT overwriting the recomputed columns"""
+        now = datetime.utcnow()
+        stmt = insert(UserPredictionStats).values([{**row, "updated_at": now} for row in rows])
+        return stmt.on_conflict_do_update(
+            index_elements=[UserPredictionStats.user_id],
+            set_={
+                **{column: stmt.excluded[column] for column in _RECOMPUTED_COLUMNS},
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=UserPredictionStats.updated_at < cutoff,
+        )
+
+    async def _upsert(self, rows: List[Dict[str, Any]], cutoff: datetime) -> None:
+        """Write stats rows in batches on a separate session from the stream"""
+        if not rows:
+            return
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                    await session.execute(
+                        self._upsert_stmt(rows[start:start + UPSERT_BATCH_SIZE], cutoff)
+                    )
+
+    def _reset_stmt(self, cutoff: datetime):
+        """Zero the statistics of users without any settled vote"""
+        settled = (
+            select(Vote.id)
+            .join(Prediction, Prediction.id == Vote.prediction_id)
+            .where(
+                Vote.user_id == UserPredictionStats.user_id,
+                Prediction.status == "ended",
+                Vote.is_correct.is_not(None),
+            )
+        )
+        return (
+            update(UserPredictionStats)
+            .where(
+                UserPredictionStats.total_participations != 0,
+                UserPredictionStats.updated_at < cutoff,
+                ~exists(settled),
+            )
+            .values(
+                total_participations=0,
+                correct_count=0,
+                accuracy_rate=0,
+                current_streak=0,
+                max_streak=0,
+                prediction_score=0,
+                rank_title=DEFAULT_RANK_TITLE,
+                updated_at=datetime.utcnow(),
+            )
+        )
+
+    async def _reset_inactive(self, cutoff: datetime) -> None:
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.execute(self._reset_stmt(cutoff))
+
+    def status_details(self) -> dict:
+        """Size of the last recompute"""
+        return {"votes": self.last_votes, "users": self.last_users}
@@ -1,11 +1,17 @@
 """Main FastAPI application"""
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import redis.asyncio as redis
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.jobs.manager import JobManager
+from app.services.market_data_client import market_data_client
 from app.api.v1 import api_router
 
+logger = logging.getLogger(__name__)
+
 # Global job manager instance
 job_manager: JobManager = None
 
@@ -18,21 +24,33 @@ async def lifespan(app: FastAPI):
     Handles:
     - Starting background jobs on startup
     - Stopping background jobs on shutdown
+
+    Jobs are skipped when RUN_BACKGROUND_JOBS is disabled, which is the
+    setup for API workers when a dedicated worker (``python -m app.jobs``)
+    runs the jobs instead.
     """
     global job_manager
 
+    if not settings.RUN_BACKGROUND_JOBS:
+        logger.info("Background jobs disabled for this process")
+        yield
+        return
+
     # Startup: Initialize and start background jobs
+    redis_client = redis.from_url(settings.REDIS_URL, decode_responses=False)
+
     # TODO: Initialize services and repositories when they are implemented
     job_manager = JobManager(
-        # market_data_service=market_data_service,
+        market_data_service=market_data_client,
         # news_service=news_service,
         # prediction_repository=prediction_repository,
         # vote_repository=vote_repository,
         # user_stats_repository=user_stats_repository,
         # news_repository=news_repository,
-        # redis_client=redis_client,
+        redis_client=redis_client,
         # websocket_manager=websocket_manager,
         # notification_service=notification_service,
+        session_factory=AsyncSessionLocal,
     )
 
     job_manager.start_all()
@@ -41,6 +59,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Stop all background jobs
     await job_manager.stop_all()
+    await redis_client.close()
 
 
 # Create FastAPI app
@@ -92,6 +111,8 @@ async def jobs_status():
         Status information for all running jobs
     """
     if not job_manager:
+        if not settings.RUN_BACKGROUND_JOBS:
+            return {"error": "Background jobs run in a dedicated worker process"}
         return {"error": "Job manager not initialized"}
 
     return {
@@ -4,10 +4,11 @@ from app.models.user import User
 from app.models.symbol import Symbol
 from app.models.quote import Quote
 from app.models.comment import Comment, CommentLike
-from app.models.prediction import Prediction
+from app.models.prediction import Prediction, PredictionVoteCount
 from app.models.vote import Vote
 from app.models.user_stats import UserPredictionStats
 from app.models.news import News
+from app.models.counter import CounterShard
 
 __all__ = [
     "User",
@@ -16,7 +17,9 @@ __all__ = [
     "Comment",
     "CommentLike",
     "Prediction",
+    "PredictionVoteCount",
     "Vote",
     "UserPredictionStats",
     "News",
+    "CounterShard",
 ]
@@ -1,15 +1,23 @@
 """Comment model"""
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DECIMAL, Integer, Boolean, DateTime, ForeignKey, Index
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, DECIMAL, Integer, Boolean, DateTime, ForeignKey, Index, UniqueConstraint, event, inspect
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 import uuid
 
 from app.core.database import Base
+from app.core.text_search import search_vector
 
 
 class Comment(Base):
-    """Comment model for price-anchored comments"""
+    """
+    Comment model for price-anchored comments.
+
+    ``search_vector`` is segmented in Python (``app.core.text_search``) and
+    set by the ORM events below, not by a database trigger: statements that
+    write ``content`` through Core ``insert()``/``update()`` or raw SQL must
+    set it themselves with ``search_vector``, or search goes stale.
+    """
 
     __tablename__ = "comments"
 
@@ -18,12 +26,14 @@ class Comment(Base):
     symbol_code = Column(String(20), ForeignKey("symbols.code", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
     price_at_comment = Column(DECIMAL(20, 8), nullable=False)  # Key feature: price anchor
+    price_tick_at = Column(DateTime, nullable=True)  # When the anchoring price was observed
     parent_id = Column(UUID(as_uuid=True), ForeignKey("comments.id", ondelete="CASCADE"), nullable=True)
     likes_count = Column(Integer, default=0, nullable=False)
     replies_count = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
+    search_vector = deferred(Column(TSVECTOR, nullable=True))  # Segmented content, maintained on write
 
     # Relationships
     user = relationship("User", back_populates="comments")
@@ -36,12 +46,26 @@ class Comment(Base):
         Index('idx_comments_symbol', 'symbol_code', 'created_at'),
         Index('idx_comments_user', 'user_id', 'created_at'),
         Index('idx_comments_parent', 'parent_id'),
+        Index('idx_comments_search', 'search_vector', postgresql_using='gin'),
     )
 
     def __repr__(self):
         return f"<Comment(id={self.id}, user_id={self.user_id}, symbol={self.symbol_code})>"
 
 
+@event.listens_for(Comment, "before_insert")
+def _index_new_comment(mapper, connection, target: Comment) -> None:
+    """Index the content of new comments"""
+    target.search_vector = search_vector(target.content)
+
+
+@event.listens_for(Comment, "before_update")
+def _reindex_comment(mapper, connection, target: Comment) -> None:
+    """Reindex edited content"""
+    if inspect(target).attrs.content.history.has_changes():
+        target.search_vector = search_vector(target.content)
+
+
 class CommentLike(Base):
     """CommentLike model for tracking comment likes"""
 
@@ -60,6 +84,7 @@ class CommentLike(Base):
     __table_args__ = (
         Index('idx_comment_likes_comment', 'comment_id'),
         Index('idx_comment_likes_user', 'user_id'),
+        UniqueConstraint('comment_id', 'user_id', name='uq_comment_likes_comment_user'),
     )
 
     def __repr__(self):
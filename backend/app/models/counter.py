@@ -0,0 +1,31 @@
+"""Sharded counter model"""
+from datetime import datetime
+from sqlalchemy import BigInteger, Column, DateTime, Index, SmallInteger, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class CounterShard(Base):
+    """
+    One shard of a sharded counter.
+
+    A counter is the sum of its shards; writers increment a random shard so
+    concurrent increments of one entity do not queue on a single row lock.
+    """
+
+    __tablename__ = "counter_shards"
+
+    name = Column(String(50), primary_key=True)  # e.g. comment_likes
+    entity_id = Column(UUID(as_uuid=True), primary_key=True)
+    shard = Column(SmallInteger, primary_key=True)
+    value = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_counter_shards_updated', 'name', 'updated_at'),
+    )
+
+    def __repr__(self):
+        return f"<CounterShard(name={self.name}, entity_id={self.entity_id}, shard={self.shard}, value={self.value})>"
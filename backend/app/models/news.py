@@ -1,14 +1,23 @@
 """News model"""
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Index
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy import Column, String, Text, DateTime, Index, event, inspect
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID, ARRAY
+from sqlalchemy.orm import deferred
 import uuid
 
 from app.core.database import Base
+from app.core.text_search import search_vector
 
 
 class News(Base):
-    """News model for financial news aggregation"""
+    """
+    News model for financial news aggregation.
+
+    ``search_vector`` is segmented in Python (``app.core.text_search``) and
+    set by the ORM events below, not by a database trigger: rows written
+    with Core ``insert()``/``update()`` or raw SQL must set it themselves
+    with ``news_search_vector``, or they are missing from search.
+    """
 
     __tablename__ = "news"
 
@@ -25,13 +34,38 @@ class News(Base):
     published_at = Column(DateTime, nullable=False)  # Original publication time
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    search_vector = deferred(Column(TSVECTOR, nullable=True))  # Segmented title (A), summary (B), content (D)
 
     # Indexes
     __table_args__ = (
         Index('idx_news_category', 'category', 'published_at'),
         Index('idx_news_published_at', 'published_at'),
         Index('idx_news_source_url', 'source_url', unique=True),  # For deduplication
+        Index('idx_news_search', 'search_vector', postgresql_using='gin'),
     )
 
     def __repr__(self):
         return f"<News(id={self.id}, title={self.title[:50]}, category={self.category})>"
+
+
+def news_search_vector(title, summary, content):
+    """Weighted search vector of a news article"""
+    return (
+        search_vector(title, "A")
+        .op("||", return_type=TSVECTOR)(search_vector(summary, "B"))
+        .op("||", return_type=TSVECTOR)(search_vector(content, "D"))
+    )
+
+
+@event.listens_for(News, "before_insert")
+def _index_new_news(mapper, connection, target: News) -> None:
+    """Index the text of new articles"""
+    target.search_vector = news_search_vector(target.title, target.summary, target.content)
+
+
+@event.listens_for(News, "before_update")
+def _reindex_news(mapper, connection, target: News) -> None:
+    """Reindex edited text"""
+    attrs = inspect(target).attrs
+    if any(attrs[name].history.has_changes() for name in ("title", "summary", "content")):
+        target.search_vector = news_search_vector(target.title, target.summary, target.content)
@@ -1,6 +1,6 @@
 """Prediction model"""
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DECIMAL, Integer, DateTime, ForeignKey, Index
+from sqlalchemy import Column, String, Text, DECIMAL, Integer, SmallInteger, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import uuid
@@ -19,12 +19,14 @@ class Prediction(Base):
     question = Column(Text, nullable=False)
     options = Column(JSONB, nullable=False)  # [{"key": "A", "text": "涨超1%"}, ...]
     price_at_create = Column(DECIMAL(20, 8), nullable=False)  # Key feature: price anchor
+    price_tick_at = Column(DateTime, nullable=True)  # When the anchoring price was observed
     price_at_verify = Column(DECIMAL(20, 8), nullable=True)  # Filled at verification
     verify_time = Column(DateTime, nullable=False)
     correct_option = Column(String(1), nullable=True)  # A, B, C, or D
     verify_rule = Column(String(20), default='auto', nullable=False)  # auto or manual
     auto_verify_conditions = Column(JSONB, nullable=True)  # Rules for auto verification
     status = Column(String(20), default='active', nullable=False)  # active, ended, cancelled
+    price_unresolved_at = Column(DateTime, nullable=True)  # Deadline price never found; awaits a moderator
     participants_count = Column(Integer, default=0, nullable=False)
     comments_count = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -34,6 +36,7 @@ class Prediction(Base):
     user = relationship("User", back_populates="predictions")
     symbol = relationship("Symbol", back_populates="predictions")
     votes = relationship("Vote", back_populates="prediction", cascade="all, delete-orphan")
+    vote_counts = relationship("PredictionVoteCount", cascade="all, delete-orphan")
 
     # Indexes
     __table_args__ = (
@@ -44,3 +47,31 @@ class Prediction(Base):
 
     def __repr__(self):
         return f"<Prediction(id={self.id}, question={self.question[:30]}, status={self.status})>"
+
+
+class PredictionVoteCount(Base):
+    """
+    Materialized number of votes per prediction option.
+
+    Incremented in the vote transaction, so distribution reads cost
+    O(options) instead of a GROUP BY over all votes. Each option is split
+    into COUNTER_SHARDS rows and a vote increments a random one, so a burst
+    of votes on one prediction does not serialize on a single row lock.
+    The prediction's participants count is the sum over all options.
+    """
+
+    __tablename__ = "prediction_vote_counts"
+
+    prediction_id = Column(UUID(as_uuid=True), ForeignKey("predictions.id", ondelete="CASCADE"), primary_key=True)
+    option_key = Column(String(1), primary_key=True)  # A, B, C, or D
+    shard = Column(SmallInteger, primary_key=True, default=0)
+    count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_prediction_vote_counts_updated', 'updated_at'),
+    )
+
+    def __repr__(self):
+        return f"<PredictionVoteCount(prediction_id={self.prediction_id}, option={self.option_key}, count={self.count})>"
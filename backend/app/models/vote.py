@@ -1,6 +1,6 @@
 """Vote model"""
 from datetime import datetime
-from sqlalchemy import Column, String, DECIMAL, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import Column, String, DECIMAL, Boolean, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -18,6 +18,7 @@ class Vote(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     selected_option = Column(String(1), nullable=False)  # A, B, C, or D
     price_at_vote = Column(DECIMAL(20, 8), nullable=False)  # Price when user voted
+    price_tick_at = Column(DateTime, nullable=True)  # When the anchoring price was observed
     is_correct = Column(Boolean, nullable=True)  # Filled after verification
     voted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -29,6 +30,7 @@ class Vote(Base):
     __table_args__ = (
         Index('idx_votes_prediction', 'prediction_id'),
         Index('idx_votes_user', 'user_id', 'voted_at'),
+        UniqueConstraint('prediction_id', 'user_id', name='uq_votes_prediction_user'),
     )
 
     def __repr__(self):
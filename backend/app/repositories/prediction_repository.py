@@ -0,0 +1,76 @@
+"""Prediction repository used by background jobs"""
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import select, update
+
+from app.models.prediction import Prediction
+
+_OPERATORS = {
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "in": lambda column, value: column.in_(value),
+}
+
+
+def _to_dict(prediction: Prediction) -> Dict[str, Any]:
+    return {c.name: getattr(prediction, c.name) for c in Prediction.__table__.columns}
+
+
+class PredictionRepository:
+    """
+    Dict-based prediction access for jobs.
+
+    Each call runs in its own short session from ``session_factory`` so jobs
+    never hold a connection between runs.
+    """
+
+    def __init__(self, session_factory):
+        """
+        Initialize the repository.
+
+        Args:
+            session_factory: Async session factory of the job process
+        """
+        self.session_factory = session_factory
+
+    async def find_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Find predictions matching all criteria.
+
+        Args:
+            criteria: Column filters; ``column__op`` keys use an operator
+                (lt, lte, gt, gte, in), plain keys test equality
+
+        Returns:
+            Matching predictions as dictionaries
+        """
+        stmt = select(Prediction)
+
+        for key, value in criteria.items():
+            name, _, op = key.partition("__")
+            column = getattr(Prediction, name)
+            if op:
+                stmt = stmt.where(_OPERATORS[op](column, value))
+            else:
+                stmt = stmt.where(column == value)
+
+        async with self.session_factory() as session:
+            result = await session.execute(stmt)
+            return [_to_dict(p) for p in result.scalars().all()]
+
+    async def update(self, prediction_id: UUID, values: Dict[str, Any]) -> None:
+        """
+        Update columns of a prediction.
+
+        Args:
+            prediction_id: Prediction ID
+            values: Column values to set
+        """
+        async with self.session_factory() as session:
+            await session.execute(
+                update(Prediction).where(Prediction.id == prediction_id).values(**values)
+            )
+            await session.commit()
@@ -0,0 +1,92 @@
+"""Quote (price history) repository used by background jobs"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert, text
+
+from app.models.quote import Quote
+
+_QUOTE_COLUMNS = {c.name for c in Quote.__table__.columns} - {"id", "created_at"}
+
+# Latest stored tick at or before each requested time, one index probe per
+# time on idx_quotes_symbol_timestamp
+_PRICES_AT_SQL = text("""
+    SELECT t.at, q.price, q.timestamp
+    FROM unnest(CAST(:times AS timestamp[])) AS t(at)
+    LEFT JOIN LATERAL (
+        SELECT price, timestamp
+        FROM quotes
+        WHERE symbol_code = :symbol_code AND timestamp <= t.at
+        ORDER BY timestamp DESC
+        LIMIT 1
+    ) q ON true
+""")
+
+
+class QuoteRepository:
+    """Stores fetched ticks and looks up historical prices"""
+
+    def __init__(self, session_factory):
+        """
+        Initialize the repository.
+
+        Args:
+            session_factory: Async session factory of the job process
+        """
+        self.session_factory = session_factory
+
+    async def add_many(self, quotes: List[Dict[str, Any]]) -> None:
+        """
+        Store ticks with a single multi-row INSERT.
+
+        Args:
+            quotes: Quote data with at least symbol_code, price and timestamp
+        """
+        if not quotes:
+            return
+
+        rows = [
+            {key: value for key, value in quote.items() if key in _QUOTE_COLUMNS}
+            for quote in quotes
+        ]
+        async with self.session_factory() as session:
+            await session.execute(insert(Quote), rows)
+            await session.commit()
+
+    async def prices_at(
+        self,
+        symbol_code: str,
+        times: List[datetime],
+        max_gap_seconds: float,
+    ) -> List[Optional[Decimal]]:
+        """
+        Get the price of a symbol at several points in time with one query.
+
+        Args:
+            symbol_code: Symbol code
+            times: Naive UTC points in time
+            max_gap_seconds: Maximum age of the stored tick relative to the
+                requested time; older ticks do not count as the price then
+
+        Returns:
+            Price per requested time (same order), None where no tick is known
+        """
+        if not times:
+            return []
+
+        async with self.session_factory() as session:
+            result = await session.execute(
+                _PRICES_AT_SQL,
+                {"symbol_code": symbol_code, "times": list(set(times))},
+            )
+            found = {at: (price, timestamp) for at, price, timestamp in result.all()}
+
+        prices = []
+        for at in times:
+            price, timestamp = found.get(at, (None, None))
+            if timestamp is None or (at - timestamp).total_seconds() > max_gap_seconds:
+                prices.append(None)
+            else:
+                prices.append(price)
+        return prices
@@ -0,0 +1,210 @@
+"""Set-based prediction settlement"""
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Integer, Numeric, case, cast, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.prediction import Prediction
+from app.models.user_stats import UserPredictionStats
+from app.models.vote import Vote
+from app.services.scoring import SCORE_CORRECT, rank_title_sql, streak_bonus_sql
+
+
+@dataclass
+class SettlementResult:
+    """Outcome of settling one prediction"""
+
+    prediction_id: UUID
+    votes_settled: int
+    elapsed_seconds: float
+    votes: List[Dict[str, Any]] = field(default_factory=list)  # Only when requested
+    stats: List[Dict[str, Any]] = field(default_factory=list)  # Voters' new statistics and correct (0/1)
+
+    @property
+    def votes_per_second(self) -> Optional[float]:
+        if self.elapsed_seconds <= 0:
+            return None
+        return self.votes_settled / self.elapsed_seconds
+
+
+class SettlementRepository:
+    """
+    Settles a prediction with a fixed number of statements in one transaction.
+
+    Whatever the number of votes, settlement is four statements: claim the
+    prediction, mark every vote correct or not, create missing stats rows,
+    and apply accuracy, streak, score and title changes to all voters with a
+    single ``UPDATE ... FROM``.
+    """
+
+    def __init__(self, session_factory):
+        """
+        Initialize the repository.
+
+        Args:
+            session_factory: Async session factory of the job process
+        """
+        self.session_factory = session_factory
+
+    async def settle(
+        self,
+        prediction_id: UUID,
+        price_at_verify: Decimal,
+        correct_option: str,
+        return_votes: bool = False,
+    ) -> Optional[SettlementResult]:
+        """
+        Settle a prediction and update its voters' statistics.
+
+        Args:
+            prediction_id: Prediction ID
+            price_at_verify: Price at the verification time
+            correct_option: Correct option key
+            return_votes: Also return (user_id, selected_option, is_correct)
+                of every vote, e.g. for notifications
+
+        Returns:
+            Settlement result, or None if the prediction was not active
+            (already settled or cancelled)
+        """
+        started = time.perf_counter()
+        now = datetime.utcnow()
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                # Claim the prediction; a concurrent or repeated run finds nothing
+                claimed = await session.execute(
+                    update(Prediction)
+                    .where(Prediction.id == prediction_id, Prediction.status == "active")
+                    .values(
+                        price_at_verify=price_at_verify,
+                        correct_option=correct_option,
+                        status="ended",
+                        updated_at=now,
+                    )
+                    .returning(Prediction.id)
+                )
+                if claimed.first() is None:
+                    return None
+
+                votes = await self._mark_votes(session, prediction_id, correct_option, return_votes)
+                votes_settled = len(votes) if return_votes else votes
+
+                await session.execute(self._create_missing_stats(prediction_id))
+                applied = await session.execute(self._apply_stats(prediction_id, now))
+                stats = [dict(row._mapping) for row in applied.all()]
+
+        return SettlementResult(
+            prediction_id=prediction_id,
+            votes_settled=votes_settled,
+            elapsed_seconds=time.perf_counter() - started,
+            votes=votes if return_votes else [],
+            stats=stats,
+        )
+
+    async def resettle(
+        self,
+        prediction_id: UUID,
+        price_at_verify: Decimal,
+        correct_option: str,
+    ) -> Optional[int]:
+        """
+        Change the outcome of an ended prediction and re-mark its votes.
+
+        Voter statistics are not adjusted here; StatsRecomputeJob rebuilds
+        them from the votes.
+
+        Args:
+            prediction_id: Prediction ID
+            price_at_verify: Corrected price at the verification time
+            correct_option: Corrected option key
+
+        Returns:
+            Number of votes re-marked, or None if the prediction has not ended
+        """
+        async with self.session_factory() as session:
+            async with session.begin():
+                updated = await session.execute(
+                    update(Prediction)
+                    .where(Prediction.id == prediction_id, Prediction.status == "ended")
+                    .values(
+                        price_at_verify=price_at_verify,
+                        correct_option=correct_option,
+                        updated_at=datetime.utcnow(),
+                    )
+                    .returning(Prediction.id)
+                )
+                if updated.first() is None:
+                    return None
+
+                return await self._mark_votes(session, prediction_id, correct_option, False)
+
+    async def _mark_votes(self, session, prediction_id, correct_option, return_votes):
+        """Set is_correct on all votes; returns the votes or their number"""
+        stmt = (
+            update(Vote)
+            .where(Vote.prediction_id == prediction_id)
+            .values(is_correct=(Vote.selected_option == correct_option))
+        )
+
+        if return_votes:
+            result = await session.execute(
+                stmt.returning(Vote.user_id, Vote.selected_option, Vote.is_correct)
+            )
+            return [dict(row._mapping) for row in result.all()]
+
+        result = await session.execute(stmt)
+        return result.rowcount
+
+    def _create_missing_stats(self, prediction_id):
+        """INSERT ... SELECT of default stats rows for first-time voters"""
+        voters = select(Vote.user_id).where(Vote.prediction_id == prediction_id)
+        return (
+            insert(UserPredictionStats)
+            .from_select(["user_id"], voters, include_defaults=False)
+            .on_conflict_do_nothing(index_elements=[UserPredictionStats.user_id])
+        )
+
+    def _apply_stats(self, prediction_id, now: datetime):
+        """UPDATE ... FROM applying this prediction's outcome to all voters, returning their new stats"""
+        stats = UserPredictionStats
+        settled = (
+            select(Vote.user_id, cast(Vote.is_correct, Integer).label("correct"))
+            .where(Vote.prediction_id == prediction_id)
+            .subquery()
+        )
+
+        # SET expressions see the row before the update
+        participations = stats.total_participations + 1
+        correct_count = stats.correct_count + settled.c.correct
+        accuracy_rate = func.round(cast(correct_count, Numeric) * 100 / participations, 2)
+        streak = case((settled.c.correct == 1, stats.current_streak + 1), else_=0)
+        points = settled.c.correct * (SCORE_CORRECT + streak_bonus_sql(stats.current_streak + 1))
+
+        return (
+            update(stats)
+            .where(stats.user_id == settled.c.user_id)
+            .values(
+                total_participations=participations,
+                correct_count=correct_count,
+                accuracy_rate=accuracy_rate,
+                current_streak=streak,
+                max_streak=func.greatest(stats.max_streak, streak),
+                prediction_score=stats.prediction_score + points,
+                rank_title=rank_title_sql(participations, accuracy_rate),
+                updated_at=now,
+            )
+            .returning(
+                stats.user_id,
+                stats.total_participations,
+                stats.accuracy_rate,
+                stats.current_streak,
+                stats.prediction_score,
+                settled.c.correct,
+            )
+        )
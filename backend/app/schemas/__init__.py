@@ -67,6 +67,21 @@ from app.schemas.community import (
     TrendingSymbolsResponse,
     TopCommentsResponse,
 )
+from app.schemas.backtest import (
+    BacktestTemplate,
+    TemplateBacktestRequest,
+    TemplateBacktestResult,
+    TemplateBacktestResponse,
+    PredictionBacktestRequest,
+    PredictionResolution,
+    PredictionBacktestResponse,
+)
+from app.schemas.search import (
+    CommentSearchResult,
+    NewsSearchResult,
+    CommentSearchResponse,
+    NewsSearchResponse,
+)
 
 __all__ = [
     # User
@@ -128,4 +143,17 @@ __all__ = [
     "CommunityTopicsResponse",
     "TrendingSymbolsResponse",
     "TopCommentsResponse",
+    # Backtest
+    "BacktestTemplate",
+    "TemplateBacktestRequest",
+    "TemplateBacktestResult",
+    "TemplateBacktestResponse",
+    "PredictionBacktestRequest",
+    "PredictionResolution",
+    "PredictionBacktestResponse",
+    # Search
+    "CommentSearchResult",
+    "NewsSearchResult",
+    "CommentSearchResponse",
+    "NewsSearchResponse",
 ]
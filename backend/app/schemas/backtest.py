@@ -0,0 +1,68 @@
+"""Backtest schemas"""
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from app.schemas.prediction import AutoVerifyCondition
+
+_INTERVAL_PATTERN = "^(1min|5min|15min|30min|1h|1day)$"
+
+
+class BacktestTemplate(BaseModel):
+    """Schema for a condition template to backtest"""
+    conditions: dict[str, AutoVerifyCondition] = Field(..., min_length=1, max_length=4)
+    horizon_minutes: int = Field(..., ge=1, le=60 * 24 * 365)
+
+
+class TemplateBacktestRequest(BaseModel):
+    """Schema for backtesting templates over one symbol's history"""
+    symbol_code: str = Field(..., max_length=20)
+    interval: str = Field(default="1min", pattern=_INTERVAL_PATTERN)
+    outputsize: int = Field(default=5000, ge=2, le=5000)
+    step: int = Field(default=1, ge=1)
+    templates: list[BacktestTemplate] = Field(..., min_length=1, max_length=1000)
+
+
+class OptionOutcome(BaseModel):
+    """Schema for how often an option would have been correct"""
+    count: int
+    frequency: float
+
+
+class TemplateBacktestResult(BaseModel):
+    """Schema for one template's backtest"""
+    windows: int
+    unresolved: int
+    no_match: int
+    options: dict[str, OptionOutcome]
+
+
+class TemplateBacktestResponse(BaseModel):
+    """Schema for template backtest response"""
+    candles: int
+    results: list[TemplateBacktestResult]
+
+
+class PredictionBacktestRequest(BaseModel):
+    """Schema for re-resolving existing predictions"""
+    prediction_ids: list[UUID] = Field(..., min_length=1, max_length=5000)
+    interval: str = Field(default="1min", pattern=_INTERVAL_PATTERN)
+    outputsize: int = Field(default=5000, ge=2, le=5000)
+    apply: bool = False  # Re-settle ended predictions whose outcome differs
+
+
+class PredictionResolution(BaseModel):
+    """Schema for one prediction's outcome from historical candles"""
+    prediction_id: UUID
+    price_at_verify: Optional[Decimal] = None
+    correct_option: Optional[str] = None
+    stored_option: Optional[str] = None
+    differs: bool = False
+    resettled: bool = False
+
+
+class PredictionBacktestResponse(BaseModel):
+    """Schema for prediction backtest response"""
+    results: list[PredictionResolution]
+    resettled: int = 0
@@ -29,11 +29,13 @@ class CommentResponse(CommentBase):
     id: UUID
     user: UserResponse
     price_at_comment: Decimal
+    price_tick_at: Optional[datetime] = None
     parent_id: Optional[UUID] = None
     likes_count: int
     replies_count: int
     created_at: datetime
     is_deleted: bool
+    user_liked: Optional[bool] = None  # Only for a signed-in viewer
 
     class Config:
         from_attributes = True
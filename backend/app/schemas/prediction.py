@@ -3,9 +3,10 @@ from datetime import datetime
 from typing import Optional
 from decimal import Decimal
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from app.schemas.user import UserResponse
+from app.services.conditions import compile_condition
 
 
 class PredictionOption(BaseModel):
@@ -18,6 +19,12 @@ class AutoVerifyCondition(BaseModel):
     """Schema for auto verification condition"""
     condition: str = Field(..., max_length=200)
 
+    @field_validator("condition")
+    @classmethod
+    def condition_must_compile(cls, value: str) -> str:
+        compile_condition(value)  # ConditionError is a ValueError
+        return value
+
 
 class PredictionBase(BaseModel):
     """Base prediction schema"""
@@ -44,10 +51,12 @@ class PredictionResponse(PredictionBase):
     id: UUID
     user: UserResponse
     price_at_create: Decimal
+    price_tick_at: Optional[datetime] = None
     price_at_verify: Optional[Decimal] = None
     correct_option: Optional[str] = None
     verify_rule: str
     status: str
+    price_unresolved_at: Optional[datetime] = None
     participants_count: int
     comments_count: int
     created_at: datetime
@@ -62,11 +71,15 @@ class VoteDistribution(BaseModel):
     percentage: float
 
 
-class PredictionWithVotes(PredictionResponse):
+class PredictionDocument(PredictionResponse):
+    """Shared (cacheable) part of a prediction with vote statistics"""
+    vote_distribution: dict[str, VoteDistribution] = {}
+
+
+class PredictionWithVotes(PredictionDocument):
     """Schema for prediction with vote statistics"""
     user_voted: bool = False
     user_vote: Optional[str] = None
-    vote_distribution: dict[str, VoteDistribution] = {}
     time_remaining: Optional[int] = None  # seconds
 
 
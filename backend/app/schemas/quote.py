@@ -33,7 +33,8 @@ class QuoteResponse(QuoteBase):
     prev_close: Optional[Decimal] = None
     volume: Optional[int] = None
     timestamp: datetime
-    market_status: Optional[str] = "trading"
+    market_status: Optional[str] = "trading"  # trading or closed, from the trading calendar
+    is_stale: bool = False  # Last known quote served while the provider is unavailable
 
     class Config:
         from_attributes = True
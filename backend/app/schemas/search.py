@@ -0,0 +1,27 @@
+"""Search schemas"""
+from pydantic import BaseModel
+
+from app.schemas.comment import CommentResponse
+from app.schemas.news import NewsListItem
+
+
+class CommentSearchResult(CommentResponse):
+    """Schema for a comment matching a search"""
+    rank: float
+
+
+class NewsSearchResult(NewsListItem):
+    """Schema for a news article matching a search"""
+    rank: float
+
+
+class CommentSearchResponse(BaseModel):
+    """Schema for comment search results with cursor pagination"""
+    comments: list[CommentSearchResult]
+    pagination: dict
+
+
+class NewsSearchResponse(BaseModel):
+    """Schema for news search results with cursor pagination"""
+    news: list[NewsSearchResult]
+    pagination: dict
@@ -22,6 +22,7 @@ class VoteResponse(VoteBase):
     prediction_id: UUID
     user_id: UUID
     price_at_vote: Decimal
+    price_tick_at: Optional[datetime] = None
     is_correct: Optional[bool] = None
     voted_at: datetime
 
@@ -34,5 +35,6 @@ class VoteResultResponse(BaseModel):
     prediction_id: UUID
     user_vote: str
     price_at_vote: Decimal
+    price_tick_at: Optional[datetime] = None
     vote_distribution: dict
     participants_count: int
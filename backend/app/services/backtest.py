@@ -0,0 +1,216 @@
+"""Backtesting auto-verification conditions over historical candles"""
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.conditions import ConditionError, compile_conditions, evaluate_batch, load_intervals
+
+# Candle length per provider interval
+INTERVAL_SECONDS = {
+    "1min": 60,
+    "5min": 300,
+    "15min": 900,
+    "30min": 1800,
+    "1h": 3600,
+    "1day": 86400,
+}
+
+# Largest series the provider returns in one call
+MAX_CANDLES = 5000
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _seconds(moments: Sequence[datetime]) -> np.ndarray:
+    """Naive UTC datetimes as integer Unix seconds"""
+    return np.array([(m - _EPOCH) // timedelta(seconds=1) for m in moments], dtype=np.int64)
+
+
+@dataclass
+class Candles:
+    """Close prices of a symbol keyed by the time each candle closed"""
+
+    closed_at: np.ndarray  # int64 Unix seconds, ascending
+    close: np.ndarray  # float64
+
+    @classmethod
+    def from_series(cls, series: List[Dict[str, Any]], interval: str) -> "Candles":
+        """
+        Build from ``MarketDataClient.get_time_series`` output.
+
+        Args:
+            series: Candles with ``timestamp`` (open time) and ``close``
+            interval: Provider interval of the candles
+
+        Returns:
+            Candles in ascending order
+        """
+        rows = sorted(
+            (candle["timestamp"].replace(tzinfo=None), float(candle["close"]))
+            for candle in series
+        )
+        closed_at = _seconds([opened for opened, _ in rows]) + INTERVAL_SECONDS[interval]
+        return cls(closed_at=closed_at, close=np.array([close for _, close in rows], dtype=float))
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def prices_at(self, seconds: np.ndarray) -> np.ndarray:
+        """
+        Close of the last candle that ended at or before each time.
+
+        Args:
+            seconds: Unix seconds
+
+        Returns:
+            Prices, NaN before the first candle or after the last one closed
+        """
+        if not len(self):
+            return np.full(len(seconds), np.nan)
+
+        index = np.searchsorted(self.closed_at, seconds, side="right") - 1
+        covered = (index >= 0) & (seconds <= self.closed_at[-1])
+        return np.where(covered, self.close[np.clip(index, 0, None)], np.nan)
+
+
+def backtest_template(
+    candles: Candles,
+    conditions: Dict[str, Any],
+    horizon_seconds: int,
+    step: int = 1,
+) -> Dict[str, Any]:
+    """
+    Resolve a condition template for a prediction created at every candle.
+
+    Each window starts at a candle close (the price at creation) and ends
+    ``horizon_seconds`` later, priced like the verifier does. All windows
+    are priced with array operations and matched by ``evaluate_batch``,
+    the evaluation settlement uses.
+
+    Args:
+        candles: Historical candles
+        conditions: Option key to condition string or stored condition
+        horizon_seconds: Time from creation to verification
+        step: Use every ``step``-th candle as a start
+
+    Returns:
+        Number of windows, unresolved windows and per-option outcome counts
+        and frequencies
+
+    Raises:
+        ConditionError: If a condition is invalid
+    """
+    compiled = compile_conditions(conditions)
+    starts = candles.closed_at[::step]
+    entry = candles.close[::step]
+    exit_prices = candles.prices_at(starts + horizon_seconds)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = (exit_prices - entry) / entry * 100
+
+    # Same first-match evaluation as settlement, one entry per window
+    outcomes = evaluate_batch([compiled] * len(changes), changes)
+    resolved = ~np.isnan(changes)
+    windows = int(resolved.sum())
+    counts = Counter(option for option, ok in zip(outcomes, resolved.tolist()) if ok)
+
+    return {
+        "windows": windows,
+        "unresolved": int(len(changes) - windows),
+        "no_match": counts[None],
+        "options": {
+            key: {
+                "count": counts[key],
+                "frequency": round(counts[key] / windows, 4) if windows else 0.0,
+            }
+            for key in compiled
+        },
+    }
+
+
+def _valid_conditions(conditions: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Stored conditions, None if any of them cannot be compiled"""
+    try:
+        for data in (conditions or {}).values():
+            load_intervals(data)
+    except ConditionError:
+        return None
+    return conditions
+
+
+def resolve_predictions(
+    candles: Candles,
+    predictions: List[Dict[str, Any]],
+    stored_prices: Optional[List[Optional[Decimal]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Resolve predictions of one symbol against historical candles.
+
+    The price at creation is the prediction's stored anchor; the price at
+    verification is the stored tick at its deadline when given, otherwise
+    the candle close at its deadline.
+
+    Args:
+        candles: Historical candles of the predictions' symbol
+        predictions: Dicts with id, price_at_create, verify_time,
+            auto_verify_conditions and correct_option
+        stored_prices: Stored tick per prediction (None where unknown)
+
+    Returns:
+        Per prediction: id, price_at_verify (None when not covered),
+        resolved correct_option (None when not covered or the stored
+        condition is invalid) and whether it differs from the stored one
+    """
+    if not predictions:
+        return []
+
+    verify_prices = candles.prices_at(_seconds([p["verify_time"] for p in predictions]))
+    if stored_prices is not None:
+        stored = np.array([np.nan if p is None else float(p) for p in stored_prices])
+        verify_prices = np.where(np.isnan(stored), verify_prices, stored)
+    anchors = np.array([float(p["price_at_create"]) for p in predictions])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = (verify_prices - anchors) / anchors * 100
+
+    # Legacy rows whose condition no longer compiles stay unresolved
+    conditions = [_valid_conditions(p.get("auto_verify_conditions")) for p in predictions]
+    options = evaluate_batch(conditions, changes)
+
+    results = []
+    for prediction, valid, price, option in zip(predictions, conditions, verify_prices.tolist(), options):
+        price_at_verify: Optional[Decimal] = None if np.isnan(price) else Decimal(str(price))
+        results.append({
+            "prediction_id": prediction["id"],
+            "price_at_verify": price_at_verify,
+            "correct_option": option if price_at_verify is not None and valid else None,
+            "stored_option": prediction.get("correct_option"),
+            "differs": (
+                price_at_verify is not None
+                and valid is not None
+                and option is not None
+                and option != prediction.get("correct_option")
+            ),
+        })
+    return results
+
+
+async def load_candles(market_data_service, symbol: str, interval: str, outputsize: int) -> Candles:
+    """
+    Fetch historical candles from the market data provider.
+
+    Args:
+        market_data_service: Client with ``get_time_series``
+        symbol: Symbol code
+        interval: Provider interval (see INTERVAL_SECONDS)
+        outputsize: Number of candles, at most MAX_CANDLES
+
+    Returns:
+        Candles (empty when the provider returned nothing)
+    """
+    series = await market_data_service.get_time_series(
+        symbol, interval=interval, outputsize=min(outputsize, MAX_CANDLES)
+    )
+    return Candles.from_series(series or [], interval)
@@ -0,0 +1,142 @@
+"""Circuit breaker for calls to external providers"""
+import logging
+import random
+import time
+from enum import Enum
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+
+    CLOSED = "closed"  # Calls go through
+    OPEN = "open"  # Calls are short-circuited until the backoff expires
+    HALF_OPEN = "half_open"  # A single trial call decides whether to close
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with exponential backoff and jitter.
+
+    After ``failure_threshold`` consecutive failures the circuit opens for
+    ``base_backoff_seconds * 2 ** (n - 1)`` (capped at ``max_backoff_seconds``
+    and randomized by ``jitter``), where n counts how many times in a row the
+    circuit opened. Once the backoff expires a single trial call is let
+    through: success closes the circuit, failure re-opens it with a longer
+    backoff.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        base_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+        jitter: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Name used in logs
+            failure_threshold: Consecutive failures that open the circuit
+            base_backoff_seconds: Open duration after the first trip
+            max_backoff_seconds: Upper bound for the open duration
+            jitter: Relative randomization of the open duration (0.2 = ±20%)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.jitter = jitter
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._consecutive_trips = 0
+        self._open_until = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from OPEN to HALF_OPEN once the backoff expired"""
+        if self._state == CircuitState.OPEN and self._clock() >= self._open_until:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the next call will be allowed (0 if allowed now)"""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._open_until - self._clock())
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go to the provider.
+
+        Returns:
+            True if the call should be made, False to short-circuit it
+        """
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return True
+
+        if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit"""
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"Circuit '{self.name}' closed")
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._consecutive_trips = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit when needed"""
+        self._consecutive_failures += 1
+
+        if (
+            self._state == CircuitState.HALF_OPEN
+            or self._consecutive_failures >= self.failure_threshold
+        ):
+            self._trip()
+
+    def _trip(self) -> None:
+        """Open the circuit with exponential backoff and jitter"""
+        self._consecutive_trips += 1
+        backoff = min(
+            self.max_backoff_seconds,
+            self.base_backoff_seconds * (2 ** (self._consecutive_trips - 1)),
+        )
+        if self.jitter:
+            backoff *= random.uniform(1 - self.jitter, 1 + self.jitter)
+
+        self._state = CircuitState.OPEN
+        self._open_until = self._clock() + backoff
+        self._trial_in_flight = False
+
+        logger.warning(
+            f"Circuit '{self.name}' opened for {backoff:.1f}s "
+            f"after {self._consecutive_failures} consecutive failures"
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize breaker state for health/status output"""
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "retry_after_seconds": round(self.retry_after(), 2),
+        }
@@ -0,0 +1,238 @@
+"""Comment likes in Redis sets with write-behind to PostgreSQL"""
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.comment import Comment, CommentLike
+from app.services.hot_comments import hot_comments
+from app.services.sharded_counter import comment_likes_counter
+
+# Member marking a set as loaded, so comments without likes are cached too
+_LOADED = ""
+
+# Likes and unlikes not yet written to PostgreSQL: "{comment_id}:{user_id}" -> "1"/"0"
+_PENDING_KEY = "comment:likes:pending"
+_FLUSHING_KEY = "comment:likes:flushing"
+
+# Set members per SADD and rows per statement
+_CHUNK = 1000
+
+# Returns -1 when the set is not loaded, otherwise the new state (1 liked,
+# 0 unliked); the pending hash keeps only the last state per user
+_TOGGLE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+local liked = 1
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 1 then
+    redis.call('SREM', KEYS[1], ARGV[1])
+    liked = 0
+else
+    redis.call('SADD', KEYS[1], ARGV[1])
+end
+redis.call('HSET', KEYS[2], ARGV[2], liked)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return liked
+"""
+
+
+def _key(comment_id: UUID) -> str:
+    return f"comment:likes:{comment_id}"
+
+
+class CommentLikes:
+    """
+    Who liked which comment, kept in one Redis set per comment.
+
+    A tap is a single script call (toggle, record the change, refresh the
+    TTL); ``user_liked`` checks are ``SISMEMBER`` and counts ``SCARD``,
+    pipelined for whole pages by ``counts``.
+    Changes are coalesced in a pending hash and written to ``comment_likes``
+    and the like counter in batches by CommentLikeFlushJob, so like storms
+    never reach PostgreSQL per tap. A comment's set is loaded from
+    PostgreSQL the first time it is liked after expiring.
+    """
+
+    async def toggle(self, redis_client: redis.Redis, comment_id: UUID, user_id: UUID) -> Optional[bool]:
+        """
+        Like or unlike a comment.
+
+        Args:
+            redis_client: Redis client
+            comment_id: Comment ID
+            user_id: User tapping like
+
+        Returns:
+            Whether the user now likes the comment, None if the comment's
+            set must be loaded first (see ``load``)
+        """
+        liked = await redis_client.eval(
+            _TOGGLE_SCRIPT,
+            2,
+            _key(comment_id),
+            _PENDING_KEY,
+            str(user_id),
+            f"{comment_id}:{user_id}",
+            settings.COMMENT_LIKES_CACHE_SECONDS,
+        )
+        return None if int(liked) < 0 else bool(int(liked))
+
+    async def load(self, db: AsyncSession, redis_client: redis.Redis, comment_id: UUID) -> None:
+        """
+        Load a comment's likers from PostgreSQL into its set.
+
+        Args:
+            db: Database session
+            redis_client: Redis client
+            comment_id: Comment ID
+        """
+        result = await db.execute(
+            select(CommentLike.user_id).where(CommentLike.comment_id == comment_id)
+        )
+        members = [_LOADED] + [str(user_id) for user_id in result.scalars().all()]
+
+        key = _key(comment_id)
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for start in range(0, len(members), _CHUNK):
+                pipe.sadd(key, *members[start:start + _CHUNK])
+            pipe.expire(key, settings.COMMENT_LIKES_CACHE_SECONDS)
+            await pipe.execute()
+
+    async def count(self, redis_client: redis.Redis, comment_id: UUID) -> int:
+        """Number of likes of a loaded comment"""
+        return max(await redis_client.scard(_key(comment_id)) - 1, 0)
+
+    async def counts(
+        self, redis_client: redis.Redis, comment_ids: List[UUID], user_id: Optional[UUID] = None
+    ) -> Tuple[Dict[UUID, int], Dict[UUID, bool]]:
+        """
+        Like counts of several comments, and whether a user liked them.
+
+        One pipeline of ``SCARD`` (and ``SISMEMBER`` with a user) per
+        comment. Comments whose set is not loaded are left out; their
+        likes are in PostgreSQL.
+
+        Args:
+            redis_client: Redis client
+            comment_ids: Comment IDs
+            user_id: Viewing user, if any
+
+        Returns:
+            (likes per loaded comment, user_liked per loaded comment; empty
+            without a user)
+        """
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for comment_id in comment_ids:
+                pipe.scard(_key(comment_id))
+                if user_id:
+                    pipe.sismember(_key(comment_id), str(user_id))
+            replies = await pipe.execute()
+
+        step = 2 if user_id else 1
+        counts, liked = {}, {}
+        for comment_id, start in zip(comment_ids, range(0, len(replies), step)):
+            # An unloaded set is missing; a loaded one holds at least the marker
+            if not replies[start]:
+                continue
+            counts[comment_id] = replies[start] - 1
+            if user_id:
+                liked[comment_id] = bool(replies[start + 1])
+        return counts, liked
+
+    async def is_liked(self, redis_client: redis.Redis, comment_id: UUID, user_id: UUID) -> Optional[bool]:
+        """Whether a user likes a comment, None if its set is not loaded"""
+        _, liked = await self.counts(redis_client, [comment_id], user_id)
+        return liked.get(comment_id)
+
+    async def invalidate(self, redis_client: redis.Redis, comment_id: UUID) -> None:
+        """Drop a comment's set, so the next tap reloads it from PostgreSQL"""
+        await redis_client.delete(_key(comment_id))
+
+    async def flush(self, db: AsyncSession, redis_client: redis.Redis) -> Tuple[int, int]:
+        """
+        Write pending likes and unlikes to PostgreSQL.
+
+        The pending hash is renamed away first, so taps during the flush go
+        to a new batch. A batch that failed to write is retried by the next
+        flush before a new one is taken.
+
+        Args:
+            db: Database session
+            redis_client: Redis client
+
+        Returns:
+            (likes inserted, likes deleted)
+        """
+        if not await redis_client.exists(_FLUSHING_KEY):
+            if not await redis_client.exists(_PENDING_KEY):
+                return 0, 0
+            await redis_client.rename(_PENDING_KEY, _FLUSHING_KEY)
+
+        pending = await redis_client.hgetall(_FLUSHING_KEY)
+        liked, unliked = self._parse_pending(pending)
+
+        # Comments deleted since the tap are skipped
+        comment_ids = list({comment_id for comment_id, _ in liked})
+        existing_ids = set()
+        for start in range(0, len(comment_ids), _CHUNK):
+            existing = await db.execute(
+                select(Comment.id).where(Comment.id.in_(comment_ids[start:start + _CHUNK]))
+            )
+            existing_ids.update(existing.scalars().all())
+        liked = [pair for pair in liked if pair[0] in existing_ids]
+
+        # Only rows actually inserted or deleted change the counter
+        deltas: Counter = Counter()
+        for start in range(0, len(liked), _CHUNK):
+            result = await db.execute(
+                insert(CommentLike)
+                .values([{"comment_id": c, "user_id": u} for c, u in liked[start:start + _CHUNK]])
+                .on_conflict_do_nothing(index_elements=[CommentLike.comment_id, CommentLike.user_id])
+                .returning(CommentLike.comment_id)
+            )
+            deltas.update(result.scalars().all())
+        inserted = sum(deltas.values())
+
+        removed: Counter = Counter()
+        for start in range(0, len(unliked), _CHUNK):
+            result = await db.execute(
+                delete(CommentLike)
+                .where(tuple_(CommentLike.comment_id, CommentLike.user_id).in_(unliked[start:start + _CHUNK]))
+                .returning(CommentLike.comment_id)
+            )
+            removed.update(result.scalars().all())
+        deleted = sum(removed.values())
+        deltas.subtract(removed)
+
+        for comment_id, delta in deltas.items():
+            if delta:
+                await db.execute(comment_likes_counter.increment(comment_id, delta))
+
+        await db.commit()
+        await redis_client.delete(_FLUSHING_KEY)
+        await hot_comments.mark_dirty(
+            redis_client, [comment_id for comment_id, delta in deltas.items() if delta]
+        )
+        return inserted, deleted
+
+    @staticmethod
+    def _parse_pending(pending: Dict) -> Tuple[List[Tuple[UUID, UUID]], List[Tuple[UUID, UUID]]]:
+        """Split the pending hash into (comment_id, user_id) likes and unlikes"""
+        liked, unliked = [], []
+        for field, state in pending.items():
+            field = field.decode() if isinstance(field, bytes) else field
+            state = state.decode() if isinstance(state, bytes) else state
+            comment_id, user_id = field.split(":")
+            pair = (UUID(comment_id), UUID(user_id))
+            (liked if state == "1" else unliked).append(pair)
+        return liked, unliked
+
+
+# Global comment likes instance
+comment_likes = CommentLikes()
@@ -0,0 +1,275 @@
+"""Auto-verification conditions compiled to interval sets"""
+import ast
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# The only variable a condition may reference
+VARIABLE = "price_change_percent"
+
+# Documented conditions use upper-case boolean operators
+_KEYWORDS = re.compile(r"\b(AND|OR|NOT)\b")
+
+# (low, high, low_closed, high_closed); None bounds are unbounded
+Interval = Tuple[Optional[float], Optional[float], bool, bool]
+
+# Operator to use when the number is on the left ("1 < x" is "x > 1")
+_FLIPPED = {
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+    ast.Eq: ast.Eq,
+    ast.NotEq: ast.NotEq,
+}
+
+
+class ConditionError(ValueError):
+    """Raised for conditions that are not valid comparisons"""
+
+
+def _is_empty(interval: Interval) -> bool:
+    low, high, low_closed, high_closed = interval
+    if low is None or high is None:
+        return False
+    return low > high or (low == high and not (low_closed and high_closed))
+
+
+def _intersect_one(a: Interval, b: Interval) -> Interval:
+    """Intersection of two intervals (possibly empty)"""
+    if a[0] is None or (b[0] is not None and (b[0], not b[2]) > (a[0], not a[2])):
+        low, low_closed = b[0], b[2]
+    else:
+        low, low_closed = a[0], a[2]
+    if a[1] is None or (b[1] is not None and (b[1], b[3]) < (a[1], a[3])):
+        high, high_closed = b[1], b[3]
+    else:
+        high, high_closed = a[1], a[3]
+    return (low, high, low_closed, high_closed)
+
+
+def _intersect(a: Tuple[Interval, ...], b: Tuple[Interval, ...]) -> Tuple[Interval, ...]:
+    pairs = (_intersect_one(x, y) for x in a for y in b)
+    return tuple(i for i in pairs if not _is_empty(i))
+
+
+def _union(a: Tuple[Interval, ...], b: Tuple[Interval, ...]) -> Tuple[Interval, ...]:
+    return a + tuple(i for i in b if i not in a)
+
+
+def _complement(intervals: Tuple[Interval, ...]) -> Tuple[Interval, ...]:
+    """Complement of a union: intersection of the complements of its parts"""
+    result: Tuple[Interval, ...] = ((None, None, False, False),)
+    for low, high, low_closed, high_closed in intervals:
+        parts = []
+        if low is not None:
+            parts.append((None, low, False, not low_closed))
+        if high is not None:
+            parts.append((high, None, not high_closed, False))
+        result = _intersect(result, tuple(parts))
+    return result
+
+
+def _comparison(op: ast.cmpop, value: float) -> Tuple[Interval, ...]:
+    """Interval set of ``VARIABLE <op> value``"""
+    if isinstance(op, ast.Lt):
+        return ((None, value, False, False),)
+    if isinstance(op, ast.LtE):
+        return ((None, value, False, True),)
+    if isinstance(op, ast.Gt):
+        return ((value, None, False, False),)
+    if isinstance(op, ast.GtE):
+        return ((value, None, True, False),)
+    if isinstance(op, ast.Eq):
+        return ((value, value, True, True),)
+    # NotEq
+    return ((None, value, False, False), (value, None, False, False))
+
+
+def _number(node: ast.AST) -> Optional[float]:
+    """Numeric literal value, None if the node is not one"""
+    sign = 1
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        sign = -1 if isinstance(node.op, ast.USub) else 1
+        node = node.operand
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = sign * float(node.value)
+        if math.isfinite(value):
+            return value
+    return None
+
+
+def _is_variable(node: ast.AST) -> bool:
+    return isinstance(node, ast.Name) and node.id == VARIABLE
+
+
+def _compile(node: ast.AST) -> Tuple[Interval, ...]:
+    if isinstance(node, ast.BoolOp):
+        combine = _intersect if isinstance(node.op, ast.And) else _union
+        result = _compile(node.values[0])
+        for value in node.values[1:]:
+            result = combine(result, _compile(value))
+        return result
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _complement(_compile(node.operand))
+
+    if isinstance(node, ast.Compare):
+        # Chained comparisons such as "-1 < price_change_percent < 1"
+        result: Tuple[Interval, ...] = ((None, None, False, False),)
+        operands = [node.left] + node.comparators
+        for left, op, right in zip(operands, node.ops, operands[1:]):
+            if type(op) not in _FLIPPED:
+                raise ConditionError(f"Unsupported operator: {type(op).__name__}")
+            if _is_variable(left) and _number(right) is not None:
+                part = _comparison(op, _number(right))
+            elif _is_variable(right) and _number(left) is not None:
+                part = _comparison(_FLIPPED[type(op)](), _number(left))
+            else:
+                raise ConditionError(f"Comparisons must be between {VARIABLE} and a number")
+            result = _intersect(result, part)
+        return result
+
+    raise ConditionError(f"Unsupported expression: {type(node).__name__}")
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Tuple[Interval, ...]:
+    """
+    Compile a condition to the set of values for which it holds.
+
+    Conditions compare ``price_change_percent`` with numbers (``<``,
+    ``<=``, ``>``, ``>=``, ``==``, ``!=``, chained) combined with
+    ``and``, ``or``, ``not`` (or ``AND``, ``OR``, ``NOT``) and parentheses.
+
+    Args:
+        condition: Condition string (e.g. "price_change_percent >= 1.0")
+
+    Returns:
+        Intervals whose union is the set of matching values
+
+    Raises:
+        ConditionError: If the condition is invalid
+    """
+    try:
+        source = _KEYWORDS.sub(lambda m: m.group(1).lower(), condition.strip())
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as e:
+        raise ConditionError(f"Invalid condition: {e.msg}") from None
+    return _compile(tree.body)
+
+
+def compile_conditions(conditions: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the stored form of a prediction's auto-verification conditions.
+
+    Args:
+        conditions: Option key to condition string, or to a mapping with a
+            ``condition`` key
+
+    Returns:
+        Option key to {"condition": source, "intervals": compiled form}
+
+    Raises:
+        ConditionError: If a condition is invalid
+    """
+    compiled = {}
+    for option_key, data in conditions.items():
+        condition = data if isinstance(data, str) else data["condition"]
+        compiled[option_key] = {
+            "condition": condition,
+            "intervals": [list(i) for i in compile_condition(condition)],
+        }
+    return compiled
+
+
+def load_intervals(condition_data: Dict[str, Any]) -> Tuple[Interval, ...]:
+    """
+    Intervals of a stored condition; compiles rows stored before compilation.
+
+    Args:
+        condition_data: Stored condition ({"condition": ..., "intervals": ...})
+
+    Returns:
+        Compiled intervals
+    """
+    intervals = condition_data.get("intervals")
+    if intervals is None:
+        return compile_condition(condition_data.get("condition", ""))
+    return tuple(tuple(i) for i in intervals)
+
+
+def matches(intervals: Sequence[Interval], value: float) -> bool:
+    """Whether a value lies in any of the intervals"""
+    if math.isnan(value):
+        return False
+    for low, high, low_closed, high_closed in intervals:
+        if low is not None and (value < low or (value == low and not low_closed)):
+            continue
+        if high is not None and (value > high or (value == high and not high_closed)):
+            continue
+        return True
+    return False
+
+
+def evaluate_batch(
+    conditions_list: Sequence[Optional[Dict[str, Dict[str, Any]]]],
+    price_changes: Sequence[float],
+) -> List[Optional[str]]:
+    """
+    Find the first matching option of many predictions in one vectorized pass.
+
+    All intervals of all options are flattened into arrays and tested
+    against their prediction's price change at once.
+
+    Args:
+        conditions_list: Stored conditions of each prediction (None for none)
+        price_changes: Price change percentage of each prediction (NaN when
+            unknown, which matches nothing)
+
+    Returns:
+        First matching option key per prediction, None where nothing matches
+
+    Raises:
+        ConditionError: If a legacy condition cannot be compiled
+    """
+    option_keys: List[List[str]] = []
+    owners, ranks, bounds = [], [], []
+    for index, conditions in enumerate(conditions_list):
+        keys = list((conditions or {}).keys())
+        option_keys.append(keys)
+        for rank, key in enumerate(keys):
+            for low, high, low_closed, high_closed in load_intervals(conditions[key]):
+                owners.append(index)
+                ranks.append(rank)
+                bounds.append((
+                    -np.inf if low is None else low,
+                    np.inf if high is None else high,
+                    low_closed,
+                    high_closed,
+                ))
+
+    if not owners:
+        return [None] * len(option_keys)
+
+    owners = np.asarray(owners)
+    ranks = np.asarray(ranks)
+    low, high, low_closed, high_closed = (np.asarray(column) for column in zip(*bounds))
+    values = np.asarray(price_changes, dtype=float)[owners]
+
+    hit = (
+        np.where(low_closed.astype(bool), values >= low, values > low)
+        & np.where(high_closed.astype(bool), values <= high, values < high)
+    )
+
+    no_match = len(ranks)
+    first = np.full(len(option_keys), no_match)
+    np.minimum.at(first, owners[hit], ranks[hit])
+
+    return [
+        keys[rank] if rank != no_match else None
+        for keys, rank in zip(option_keys, first.tolist())
+    ]
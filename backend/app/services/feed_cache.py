@@ -0,0 +1,122 @@
+"""First pages of the per-symbol feeds cached in Redis and in process"""
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+# Scope of the feed without a symbol filter
+ALL_SYMBOLS = "*"
+
+# Local entries kept before the L1 is cleared
+_L1_MAX_ENTRIES = 1024
+
+
+class FeedCache:
+    """
+    Serialized first pages of a feed, one Redis hash per symbol.
+
+    Hash fields are page variants (status, limit), so an event invalidates
+    every variant of a symbol with one ``DEL``. An in-process L1 in front of
+    Redis serves the hottest pages without a round trip: invalidations in
+    this process drop it at once, other processes' entries expire after
+    FEED_L1_CACHE_SECONDS.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._local: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+    def _key(self, scope: str) -> str:
+        return f"feed:{self.name}:{scope}"
+
+    def _remember(self, scope: str, variant: str, payload: str) -> None:
+        if len(self._local) >= _L1_MAX_ENTRIES:
+            self._local.clear()
+        self._local[(scope, variant)] = (time.monotonic() + settings.FEED_L1_CACHE_SECONDS, payload)
+
+    def clear_local(self) -> None:
+        """Drop this process's copies of all pages"""
+        self._local.clear()
+
+    async def get(self, redis_client: Optional[redis.Redis], scope: str, variant: str) -> Optional[str]:
+        """
+        Get a cached first page.
+
+        Args:
+            redis_client: Redis client (only the L1 is used when None)
+            scope: Symbol code, or ALL_SYMBOLS
+            variant: Page variant within the scope
+
+        Returns:
+            Serialized page, None on a miss
+        """
+        local = self._local.get((scope, variant))
+        if local and local[0] > time.monotonic():
+            return local[1]
+
+        if not redis_client:
+            return None
+
+        try:
+            raw = await redis_client.hget(self._key(scope), variant)
+        except Exception as e:
+            print(f"Redis get error: {e}")
+            return None
+
+        if raw is None:
+            return None
+        payload = raw.decode() if isinstance(raw, bytes) else raw
+        self._remember(scope, variant, payload)
+        return payload
+
+    async def set(self, redis_client: Optional[redis.Redis], scope: str, variant: str, payload: str) -> None:
+        """
+        Cache a first page for FEED_CACHE_SECONDS.
+
+        Args:
+            redis_client: Redis client
+            scope: Symbol code, or ALL_SYMBOLS
+            variant: Page variant within the scope
+            payload: Serialized page
+        """
+        self._remember(scope, variant, payload)
+        if not redis_client:
+            return
+
+        key = self._key(scope)
+        try:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, variant, payload)
+                pipe.expire(key, settings.FEED_CACHE_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            print(f"Redis set error: {e}")
+
+    async def invalidate(self, redis_client: Optional[redis.Redis], symbol_codes: Iterable[str]) -> None:
+        """
+        Drop the first pages of symbols after an event changed them.
+
+        The unfiltered feed is dropped as well.
+
+        Args:
+            redis_client: Redis client
+            symbol_codes: Changed symbols
+        """
+        scopes = {ALL_SYMBOLS} | set(symbol_codes)
+        for entry in [entry for entry in self._local if entry[0] in scopes]:
+            del self._local[entry]
+
+        if not redis_client:
+            return
+
+        try:
+            await redis_client.delete(*[self._key(scope) for scope in scopes])
+        except Exception as e:
+            print(f"Redis delete error: {e}")
+
+
+# Global feed caches
+comment_feed = FeedCache("comments")
+prediction_feed = FeedCache("predictions")
@@ -0,0 +1,170 @@
+"""Hot comments ranked by Wilson score and recency in Redis sorted sets"""
+import math
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+
+# Engagement loses half its weight every HALF_LIFE_SECONDS of comment age
+HALF_LIFE_SECONDS = 24 * 3600
+DECAY_RATE = math.log(2) / HALF_LIFE_SECONDS
+
+# Comments have no views or downvotes: engagement (likes, and replies
+# counted at REPLY_WEIGHT) is scored against a prior of unengaged readers
+REPLY_WEIGHT = 2
+IMPRESSION_PRIOR = 20
+
+# z for a 95% confidence lower bound
+WILSON_Z = 1.96
+
+# Comments kept per ranking
+TOP_K = 100
+
+GLOBAL = "all"
+
+_DIRTY_KEY = "comments:hot:dirty"
+
+# Symbols that have a ranking, so rebuilds can drop the ones left empty
+_SYMBOLS_KEY = "comments:hot:symbols"
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _key(symbol_code: str) -> str:
+    return f"comments:hot:{symbol_code}"
+
+
+def wilson_lower_bound(positive: float, total: float, z: float = WILSON_Z) -> float:
+    """
+    Lower bound of the Wilson score interval of a success rate.
+
+    Args:
+        positive: Successes
+        total: Trials
+
+    Returns:
+        Lower bound in [0, 1] (0 without trials)
+    """
+    if total <= 0:
+        return 0.0
+    p = positive / total
+    z2 = z * z
+    centre = p + z2 / (2 * total)
+    margin = z * math.sqrt((p * (1 - p) + z2 / (4 * total)) / total)
+    return max((centre - margin) / (1 + z2 / total), 0.0)
+
+
+def hot_score(likes: int, replies: int, created_at: datetime) -> Optional[float]:
+    """
+    Rank of a comment: log(Wilson lower bound) plus recency.
+
+    ``wilson * exp(-DECAY_RATE * age)`` shrinks by the same factor for all
+    comments as time passes, so the order is fixed by
+    ``log(wilson) + DECAY_RATE * created_at``; scores only change when a
+    comment's engagement does and never need rescoring for age.
+
+    Args:
+        likes: Like count
+        replies: Reply count
+        created_at: Naive UTC creation time
+
+    Returns:
+        Score, None for comments without engagement
+    """
+    engagement = likes + REPLY_WEIGHT * replies
+    wilson = wilson_lower_bound(engagement, engagement + IMPRESSION_PRIOR)
+    if wilson <= 0:
+        return None
+    return math.log(wilson) + DECAY_RATE * (created_at - _EPOCH).total_seconds()
+
+
+class HotComments:
+    """
+    Top-K hot comments per symbol and overall, in sorted sets.
+
+    Like and reply events mark comments dirty (``SADD``); HotCommentsJob
+    rescoring the dirty comments keeps the rankings current and rebuilds
+    them periodically. Reads are one ``ZREVRANGE``.
+    """
+
+    async def mark_dirty(self, redis_client: Optional[redis.Redis], comment_ids: Iterable[UUID]) -> None:
+        """
+        Queue comments whose likes or replies changed for rescoring.
+
+        Args:
+            redis_client: Redis client
+            comment_ids: Comment IDs
+        """
+        members = [str(comment_id) for comment_id in comment_ids]
+        if not redis_client or not members:
+            return
+
+        try:
+            await redis_client.sadd(_DIRTY_KEY, *members)
+        except Exception as e:
+            print(f"Redis hot comments error: {e}")
+
+    async def pop_dirty(self, redis_client: redis.Redis, count: int) -> List[UUID]:
+        """Take up to ``count`` queued comments"""
+        members = await redis_client.spop(_DIRTY_KEY, count) or []
+        return [UUID(m.decode() if isinstance(m, bytes) else m) for m in members]
+
+    async def update(
+        self,
+        redis_client: redis.Redis,
+        comments: Iterable[Tuple[UUID, str, Optional[float]]],
+        rebuild: bool = False,
+    ) -> None:
+        """
+        Write scores to the symbol and global rankings and trim them to TOP_K.
+
+        Args:
+            redis_client: Redis client
+            comments: (comment_id, symbol_code, score or None to remove)
+            rebuild: Replace all rankings; symbols without comments
+                lose theirs
+        """
+        comments = list(comments)
+        symbols = {symbol_code for _, symbol_code, _ in comments}
+        keys = {_key(GLOBAL)} | {_key(symbol_code) for symbol_code in symbols}
+
+        stale = set()
+        if rebuild:
+            ranked = await redis_client.smembers(_SYMBOLS_KEY)
+            stale = {_key(m.decode() if isinstance(m, bytes) else m) for m in ranked} - keys
+
+        async with redis_client.pipeline(transaction=True) as pipe:
+            if rebuild:
+                pipe.delete(*keys, *stale, _SYMBOLS_KEY)
+            if symbols:
+                pipe.sadd(_SYMBOLS_KEY, *symbols)
+            for comment_id, symbol_code, score in comments:
+                member = str(comment_id)
+                for key in (_key(symbol_code), _key(GLOBAL)):
+                    if score is None:
+                        pipe.zrem(key, member)
+                    else:
+                        pipe.zadd(key, {member: score})
+            for key in keys:
+                pipe.zremrangebyrank(key, 0, -(TOP_K + 1))
+            await pipe.execute()
+
+    async def top(self, redis_client: redis.Redis, symbol_code: Optional[str], limit: int) -> List[UUID]:
+        """
+        Get the hottest comments.
+
+        Args:
+            redis_client: Redis client
+            symbol_code: Symbol, None for all symbols
+            limit: Number of comments (at most TOP_K)
+
+        Returns:
+            Comment IDs from the hottest down
+        """
+        members = await redis_client.zrevrange(_key(symbol_code or GLOBAL), 0, limit - 1)
+        return [UUID(m.decode() if isinstance(m, bytes) else m) for m in members]
+
+
+# Global hot comments instance
+hot_comments = HotComments()
@@ -0,0 +1,154 @@
+"""Hot predictions ranked by time-decayed heat in a Redis sorted set"""
+import math
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+
+# Activity loses half its weight every HALF_LIFE_SECONDS
+HALF_LIFE_SECONDS = 6 * 3600
+DECAY_RATE = math.log(2) / HALF_LIFE_SECONDS
+
+# A (decayed) comment on the prediction's symbol counts as this many votes
+COMMENT_WEIGHT = 0.5
+
+# Predictions close to their deadline get up to (1 + PROXIMITY_BOOST) times
+# the heat, fading over PROXIMITY_SECONDS before the deadline
+PROXIMITY_BOOST = 1.0
+PROXIMITY_SECONDS = 6 * 3600
+
+_KEY = "predictions:hot"
+_BUILDING_KEY = "predictions:hot:building"
+# Reference time scores are expressed at (Unix seconds)
+_EPOCH_KEY = "predictions:hot:epoch"
+
+_PIPELINE_CHUNK = 1000
+
+
+def proximity(verify_time: datetime, now: datetime) -> float:
+    """
+    Multiplier for how close a prediction is to its deadline.
+
+    Args:
+        verify_time: Naive UTC deadline
+        now: Current naive UTC time
+
+    Returns:
+        1.0 far from the deadline up to 1 + PROXIMITY_BOOST at it
+    """
+    remaining = max((verify_time - now).total_seconds(), 0.0)
+    return 1.0 + PROXIMITY_BOOST * math.exp(-remaining / PROXIMITY_SECONDS)
+
+
+def heat(
+    vote_activity: float,
+    comment_activity: float,
+    verify_time: datetime,
+    now: datetime,
+) -> float:
+    """
+    Heat of a prediction at ``now``.
+
+    Args:
+        vote_activity: Sum over votes of exp(-DECAY_RATE * age)
+        comment_activity: Same sum over recent comments on the symbol
+        verify_time: Naive UTC deadline
+        now: Current naive UTC time
+
+    Returns:
+        Heat score
+    """
+    return (vote_activity + COMMENT_WEIGHT * comment_activity) * proximity(verify_time, now)
+
+
+def _timestamp(moment: datetime) -> float:
+    return (moment - datetime(1970, 1, 1)).total_seconds()
+
+
+class HotPredictions:
+    """
+    Active predictions ranked by heat.
+
+    Heat decays exponentially, so all scores shrink by the same factor over
+    time and the order only changes through new activity. Scores are
+    therefore stored as of a reference time (the last rebuild) and a vote
+    adds ``exp(DECAY_RATE * (now - reference))`` with ``ZADD XX INCR``
+    instead of rescoring the set. ``rebuild`` recomputes everything from
+    PostgreSQL, resets the reference time and drops ended predictions.
+    """
+
+    async def record_vote(
+        self,
+        redis_client: Optional[redis.Redis],
+        prediction_id: UUID,
+        verify_time: datetime,
+        now: datetime,
+    ) -> None:
+        """
+        Add one vote's heat to a ranked prediction.
+
+        Predictions not in the set yet are left to the next rebuild.
+
+        Args:
+            redis_client: Redis client
+            prediction_id: Prediction ID
+            verify_time: Naive UTC deadline of the prediction
+            now: Naive UTC time of the vote
+        """
+        if not redis_client:
+            return
+
+        try:
+            epoch = await redis_client.get(_EPOCH_KEY)
+            if epoch is None:
+                return
+            elapsed = _timestamp(now) - float(epoch)
+            increment = math.exp(DECAY_RATE * elapsed) * proximity(verify_time, now)
+            await redis_client.zadd(_KEY, {str(prediction_id): increment}, xx=True, incr=True)
+        except Exception as e:
+            print(f"Redis hot predictions update error: {e}")
+
+    async def rebuild(self, redis_client: redis.Redis, scores: Dict[UUID, float], now: datetime) -> None:
+        """
+        Replace the ranking with freshly computed heat.
+
+        Args:
+            redis_client: Redis client
+            scores: Heat at ``now`` of every active prediction
+            now: Naive UTC time the scores were computed at
+        """
+        await redis_client.delete(_BUILDING_KEY)
+        members = [(str(prediction_id), score) for prediction_id, score in scores.items()]
+        for start in range(0, len(members), _PIPELINE_CHUNK):
+            await redis_client.zadd(_BUILDING_KEY, dict(members[start:start + _PIPELINE_CHUNK]))
+
+        async with redis_client.pipeline(transaction=True) as pipe:
+            if members:
+                pipe.rename(_BUILDING_KEY, _KEY)
+            else:
+                pipe.delete(_KEY)
+            pipe.set(_EPOCH_KEY, _timestamp(now))
+            await pipe.execute()
+
+    async def top(self, redis_client: redis.Redis, limit: int, offset: int = 0) -> List[Tuple[UUID, float]]:
+        """
+        Get the hottest predictions.
+
+        Args:
+            redis_client: Redis client
+            limit: Number of predictions
+            offset: Predictions to skip
+
+        Returns:
+            (prediction_id, score) from the hottest down
+        """
+        members = await redis_client.zrevrange(_KEY, offset, offset + limit - 1, withscores=True)
+        return [
+            (UUID(member.decode() if isinstance(member, bytes) else member), score)
+            for member, score in members
+        ]
+
+
+# Global hot predictions instance
+hot_predictions = HotPredictions()
@@ -0,0 +1,439 @@
+"""Prediction leaderboards in Redis sorted sets (PRD 4.5.8)"""
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.services.scoring import LEADERBOARD_MIN_PARTICIPATIONS, SCORE_CORRECT, streak_bonus
+
+# Accuracy, score and win-streak rankings
+BOARDS = ("accuracy", "score", "streak")
+
+# Rolling windows in days (ending today, UTC); streaks have no window
+WINDOWS = {"daily": 1, "weekly": 7, "monthly": 30}
+WINDOW_BOARDS = ("accuracy", "score")
+
+# Per-day counters a window is summed from
+_DAY_METRICS = ("participations", "correct", "points")
+
+# Day buckets outlive the longest window by a day
+_BUCKET_RETENTION_DAYS = max(WINDOWS.values()) + 1
+
+# Accuracy ties are broken by participations, packed below the accuracy
+_PARTICIPATIONS_FACTOR = 10 ** 7
+
+# Members written per pipeline round trip
+_PIPELINE_CHUNK = 1000
+
+
+def _key(board: str) -> str:
+    return f"leaderboard:{board}"
+
+
+def _day_key(day: date, metric: str) -> str:
+    return f"leaderboard:day:{day:%Y%m%d}:{metric}"
+
+
+def _bucket_expiry(day: date) -> datetime:
+    return datetime.combine(day + timedelta(days=_BUCKET_RETENTION_DAYS), time.min)
+
+
+def _window_key(window: str, today: date, metric: str) -> str:
+    return f"leaderboard:window:{window}:{today:%Y%m%d}:{metric}"
+
+
+def _member(member) -> UUID:
+    return UUID(member.decode() if isinstance(member, bytes) else member)
+
+
+def accuracy_score(accuracy_rate: Decimal, participations: int) -> float:
+    """
+    Sorted-set score of the accuracy board.
+
+    Accuracy (two decimals) is the primary key and participations the
+    tie-breaker; both fit exactly in a double.
+
+    Args:
+        accuracy_rate: Accuracy in percent
+        participations: Settled participations
+
+    Returns:
+        Score ordering users by accuracy, then participations
+    """
+    return (
+        round(float(accuracy_rate) * 100) * _PARTICIPATIONS_FACTOR
+        + min(participations, _PARTICIPATIONS_FACTOR - 1)
+    )
+
+
+def board_scores(stats: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """
+    Scores of one user's statistics on every board.
+
+    Args:
+        stats: user_prediction_stats columns (total_participations,
+            accuracy_rate, prediction_score, current_streak)
+
+    Returns:
+        Score per board; None where the user does not qualify
+    """
+    participations = stats["total_participations"]
+    return {
+        "accuracy": (
+            accuracy_score(stats["accuracy_rate"], participations)
+            if participations >= LEADERBOARD_MIN_PARTICIPATIONS else None
+        ),
+        "score": stats["prediction_score"],
+        "streak": stats["current_streak"],
+    }
+
+
+class Leaderboard:
+    """
+    Leaderboards kept incrementally in one sorted set per board.
+
+    Settlement pushes the new statistics of every voter; top-N reads are
+    ``ZREVRANGE`` (O(log n + N)) and a user's rank is ``ZREVRANK``
+    (O(log n)). Users below LEADERBOARD_MIN_PARTICIPATIONS are kept off
+    the accuracy board. ``rebuild`` repairs drift from PostgreSQL.
+    """
+
+    async def update_users(
+        self, redis_client: Optional[redis.Redis], stats: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Apply new user statistics to all boards.
+
+        Args:
+            redis_client: Redis client
+            stats: user_prediction_stats rows (dicts with user_id)
+        """
+        if not redis_client:
+            return
+
+        try:
+            await self._write(redis_client, stats, {board: _key(board) for board in BOARDS})
+        except Exception as e:
+            print(f"Redis leaderboard update error: {e}")
+
+    async def rebuild(
+        self,
+        redis_client: redis.Redis,
+        chunks: AsyncIterator[List[Dict[str, Any]]],
+    ) -> int:
+        """
+        Rebuild all boards from streamed statistics.
+
+        Boards are built under temporary keys and swapped in with RENAME,
+        so readers never see a partial board. The swap drops updates made
+        to the live boards while streaming; the caller re-applies rows
+        changed since the stream's snapshot.
+
+        Args:
+            redis_client: Redis client
+            chunks: Chunks of user_prediction_stats rows
+
+        Returns:
+            Number of users written
+        """
+        building = {board: f"{_key(board)}:building" for board in BOARDS}
+        await redis_client.delete(*building.values())
+
+        users = 0
+        async for chunk in chunks:
+            await self._write(redis_client, chunk, building)
+            users += len(chunk)
+
+        # A board nobody qualifies for has no building key to rename
+        built = {board: await redis_client.exists(key) for board, key in building.items()}
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for board, key in building.items():
+                if built[board]:
+                    pipe.rename(key, _key(board))
+                else:
+                    pipe.delete(_key(board))
+            await pipe.execute()
+
+        return users
+
+    async def _write(self, redis_client, stats, keys: Dict[str, str]) -> None:
+        """Write statistics in pipelined chunks"""
+        stats = list(stats)
+        for start in range(0, len(stats), _PIPELINE_CHUNK):
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for row in stats[start:start + _PIPELINE_CHUNK]:
+                    member = str(row["user_id"])
+                    for board, score in board_scores(row).items():
+                        if score is None:
+                            pipe.zrem(keys[board], member)
+                        else:
+                            pipe.zadd(keys[board], {member: score})
+                await pipe.execute()
+
+    async def top(
+        self, redis_client: redis.Redis, board: str, limit: int, offset: int = 0
+    ) -> List[Tuple[UUID, float]]:
+        """
+        Get the best users of a board.
+
+        Args:
+            redis_client: Redis client
+            board: Board name
+            limit: Number of users
+            offset: Number of users to skip
+
+        Returns:
+            (user_id, score) from the first place down
+        """
+        members = await redis_client.zrevrange(
+            _key(board), offset, offset + limit - 1, withscores=True
+        )
+        return [(_member(member), score) for member, score in members]
+
+    async def rank(
+        self, redis_client: redis.Redis, board: str, user_id: UUID
+    ) -> Optional[int]:
+        """
+        Get a user's 1-based rank on a board.
+
+        Args:
+            redis_client: Redis client
+            board: Board name
+            user_id: User ID
+
+        Returns:
+            Rank, or None if the user is not on the board
+        """
+        rank = await redis_client.zrevrank(_key(board), str(user_id))
+        return rank + 1 if rank is not None else None
+
+    async def record_settlement(
+        self,
+        redis_client: Optional[redis.Redis],
+        stats: Iterable[Dict[str, Any]],
+        day: date,
+    ) -> None:
+        """
+        Add a settlement's outcome to the day buckets of the windowed boards.
+
+        Args:
+            redis_client: Redis client
+            stats: Settled voters' new statistics with ``correct`` (0/1)
+            day: UTC day the prediction was due
+        """
+        if not redis_client:
+            return
+
+        keys = {metric: _day_key(day, metric) for metric in _DAY_METRICS}
+        expire_at = _bucket_expiry(day)
+        stats = list(stats)
+
+        try:
+            for start in range(0, len(stats), _PIPELINE_CHUNK):
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for row in stats[start:start + _PIPELINE_CHUNK]:
+                        member = str(row["user_id"])
+                        pipe.zincrby(keys["participations"], 1, member)
+                        if row["correct"]:
+                            # The new streak includes this correct answer
+                            points = SCORE_CORRECT + streak_bonus(row["current_streak"])
+                            pipe.zincrby(keys["correct"], 1, member)
+                            pipe.zincrby(keys["points"], points, member)
+                    for key in keys.values():
+                        pipe.expireat(key, expire_at)
+                    await pipe.execute()
+        except Exception as e:
+            print(f"Redis leaderboard update error: {e}")
+
+    def bucket_days(self, today: date) -> List[date]:
+        """Days whose buckets are kept, from ``today`` back"""
+        return [today - timedelta(days=offset) for offset in range(_BUCKET_RETENTION_DAYS)]
+
+    async def rebuild_days(
+        self,
+        redis_client: redis.Redis,
+        chunks: AsyncIterator[List[Dict[str, Any]]],
+        today: date,
+    ) -> int:
+        """
+        Rebuild the day buckets of the windowed boards from streamed totals.
+
+        Like ``rebuild``, buckets are built under temporary keys and swapped
+        in with RENAME; the caller re-applies totals changed meanwhile with
+        ``set_days``.
+
+        Args:
+            redis_client: Redis client
+            chunks: Chunks of per-user day totals (user_id, day,
+                participations, correct, points) within ``bucket_days``
+            today: Last day to rebuild (UTC)
+
+        Returns:
+            Number of user-days written
+        """
+        keys = [_day_key(day, metric) for day in self.bucket_days(today) for metric in _DAY_METRICS]
+        await redis_client.delete(*(f"{key}:building" for key in keys))
+
+        rows = 0
+        async for chunk in chunks:
+            await self._write_days(redis_client, chunk, suffix=":building")
+            rows += len(chunk)
+
+        built = {key: await redis_client.exists(f"{key}:building") for key in keys}
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for day in self.bucket_days(today):
+                for metric in _DAY_METRICS:
+                    key = _day_key(day, metric)
+                    if built[key]:
+                        pipe.rename(f"{key}:building", key)
+                        pipe.expireat(key, _bucket_expiry(day))
+                    else:
+                        pipe.delete(key)
+            await pipe.execute()
+
+        return rows
+
+    async def set_days(
+        self, redis_client: Optional[redis.Redis], totals: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Overwrite users' day totals in the live buckets.
+
+        Args:
+            redis_client: Redis client
+            totals: Per-user day totals as for ``rebuild_days``
+        """
+        if not redis_client:
+            return
+
+        try:
+            await self._write_days(redis_client, totals)
+        except Exception as e:
+            print(f"Redis leaderboard update error: {e}")
+
+    async def _write_days(self, redis_client, totals, suffix: str = "") -> None:
+        """Write day totals in pipelined chunks, leaving zero totals out as settlement does"""
+        totals = list(totals)
+        for start in range(0, len(totals), _PIPELINE_CHUNK):
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for row in totals[start:start + _PIPELINE_CHUNK]:
+                    member = str(row["user_id"])
+                    for metric in _DAY_METRICS:
+                        if row[metric]:
+                            key = _day_key(row["day"], metric) + suffix
+                            pipe.zadd(key, {member: int(row[metric])})
+                            pipe.expireat(key, _bucket_expiry(row["day"]))
+                await pipe.execute()
+
+    async def _window(self, redis_client: redis.Redis, window: str, today: date) -> Dict[str, str]:
+        """
+        Get the keys of a window's boards, building them if not cached.
+
+        The window's day buckets are summed with one ZUNIONSTORE per metric;
+        window accuracy is then derived for users with enough participations.
+        Results are cached for LEADERBOARD_WINDOW_CACHE_SECONDS.
+        """
+        keys = {metric: _window_key(window, today, metric) for metric in (*_DAY_METRICS, "accuracy")}
+        if await redis_client.exists(*keys.values()) == len(keys):
+            return keys
+
+        days = [today - timedelta(days=offset) for offset in range(WINDOWS[window])]
+        ttl = settings.LEADERBOARD_WINDOW_CACHE_SECONDS
+
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for metric in _DAY_METRICS:
+                pipe.zunionstore(keys[metric], [_day_key(day, metric) for day in days])
+                pipe.expire(keys[metric], ttl)
+            await pipe.execute()
+
+        qualified = await redis_client.zrangebyscore(
+            keys["participations"], LEADERBOARD_MIN_PARTICIPATIONS, "+inf", withscores=True
+        )
+        accuracy = {}
+        for start in range(0, len(qualified), _PIPELINE_CHUNK):
+            chunk = qualified[start:start + _PIPELINE_CHUNK]
+            correct = await redis_client.zmscore(keys["correct"], [m for m, _ in chunk])
+            for (member, participations), correct_count in zip(chunk, correct):
+                rate = Decimal(str((correct_count or 0) * 100 / participations)).quantize(Decimal("0.01"))
+                accuracy[member] = accuracy_score(rate, int(participations))
+
+        # All keys are completed and expired together, so a window is only
+        # reused while every key of it is cached
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(keys["accuracy"])
+            if accuracy:
+                pipe.zadd(keys["accuracy"], accuracy)
+            for key in keys.values():
+                # Placeholder below every board so empty keys are cached too
+                pipe.zadd(key, {"": -1})
+                pipe.expire(key, ttl)
+            await pipe.execute()
+
+        return keys
+
+    def _window_board_key(self, keys: Dict[str, str], board: str) -> str:
+        return keys["accuracy"] if board == "accuracy" else keys["points"]
+
+    async def window_top(
+        self, redis_client: redis.Redis, board: str, window: str, limit: int, today: date
+    ) -> List[Tuple[UUID, float]]:
+        """
+        Get the best users of a windowed board.
+
+        Args:
+            redis_client: Redis client
+            board: accuracy or score
+            window: daily, weekly or monthly
+            limit: Number of users
+            today: Last day of the window (UTC)
+
+        Returns:
+            (user_id, score) from the first place down
+        """
+        keys = await self._window(redis_client, window, today)
+        members = await redis_client.zrevrangebyscore(
+            self._window_board_key(keys, board), "+inf", 0, start=0, num=limit, withscores=True
+        )
+        return [(_member(member), score) for member, score in members]
+
+    async def window_rank(
+        self, redis_client: redis.Redis, board: str, window: str, user_id: UUID, today: date
+    ) -> Optional[int]:
+        """Get a user's 1-based rank on a windowed board, None if not ranked"""
+        keys = await self._window(redis_client, window, today)
+        rank = await redis_client.zrevrank(self._window_board_key(keys, board), str(user_id))
+        return rank + 1 if rank is not None else None
+
+    async def window_stats(
+        self, redis_client: redis.Redis, window: str, user_ids: List[UUID], today: date
+    ) -> Dict[UUID, Tuple[int, int]]:
+        """
+        Get users' (participations, correct) within a window.
+
+        Args:
+            redis_client: Redis client
+            window: daily, weekly or monthly
+            user_ids: Users
+            today: Last day of the window (UTC)
+
+        Returns:
+            (participations, correct) per user
+        """
+        if not user_ids:
+            return {}
+
+        keys = await self._window(redis_client, window, today)
+        members = [str(user_id) for user_id in user_ids]
+        participations = await redis_client.zmscore(keys["participations"], members)
+        correct = await redis_client.zmscore(keys["correct"], members)
+        return {
+            user_id: (int(p or 0), int(c or 0))
+            for user_id, p, c in zip(user_ids, participations, correct)
+        }
+
+
+# Global leaderboard instance
+leaderboard = Leaderboard()
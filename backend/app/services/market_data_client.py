@@ -4,16 +4,32 @@ from typing import Dict, List, Optional
 from datetime import datetime
 import httpx
 from app.core.config import settings
+from app.services.circuit_breaker import CircuitBreaker
 
 
 class MarketDataClient:
-    """Client for fetching market data from Twelve Data API"""
+    """
+    Client for fetching market data from Twelve Data API
+
+    Calls go through a circuit breaker. While the provider is failing, quote
+    requests are answered from the last known quote (marked ``is_stale``)
+    instead of waiting for the HTTP timeout, and the quote is refreshed in
+    the background once the breaker lets a trial call through.
+    """
 
     def __init__(self):
         self.base_url = settings.MARKET_DATA_BASE_URL
         self.api_key = settings.MARKET_DATA_API_KEY
         self.rate_limit = settings.MARKET_DATA_RATE_LIMIT
         self._semaphore = asyncio.Semaphore(self.rate_limit)
+        self.breaker = CircuitBreaker(
+            "market_data",
+            failure_threshold=settings.MARKET_DATA_BREAKER_FAILURE_THRESHOLD,
+            base_backoff_seconds=settings.MARKET_DATA_BREAKER_BASE_BACKOFF,
+            max_backoff_seconds=settings.MARKET_DATA_BREAKER_MAX_BACKOFF,
+        )
+        self._last_quotes: Dict[str, Dict] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
 
     async def get_quote(self, symbol: str) -> Optional[Dict]:
         """
@@ -23,8 +39,66 @@ class MarketDataClient:
             symbol: Symbol code (e.g., "XAUUSD", "EURUSD")
 
         Returns:
-            Quote data or None if failed
+            Quote data, the last known quote marked stale if the provider
+            is unavailable, or None if no quote is known
+        """
+        if not self.breaker.allow_request():
+            return self._serve_stale(symbol)
+
+        quote = await self._fetch_quote(symbol)
+        if quote:
+            self.breaker.record_success()
+            self._last_quotes[symbol] = quote
+            return quote
+
+        self.breaker.record_failure()
+        return self._serve_stale(symbol)
+
+    async def get_latest_quote(self, symbol: str) -> Optional[Dict]:
+        """
+        Get the latest quote for the price fetcher
+
+        Args:
+            symbol: Symbol code
+
+        Returns:
+            Quote data (possibly marked ``is_stale``) or None
         """
+        return await self.get_quote(symbol)
+
+    def _serve_stale(self, symbol: str) -> Optional[Dict]:
+        """Return the last known quote marked stale and schedule a refresh"""
+        last_quote = self._last_quotes.get(symbol)
+        if not last_quote:
+            return None
+
+        self._schedule_refresh(symbol)
+        return {**last_quote, "is_stale": True}
+
+    def _schedule_refresh(self, symbol: str) -> None:
+        """Start a single background refresh per symbol"""
+        task = self._refresh_tasks.get(symbol)
+        if task and not task.done():
+            return
+
+        self._refresh_tasks[symbol] = asyncio.create_task(self._refresh_quote(symbol))
+
+    async def _refresh_quote(self, symbol: str) -> None:
+        """Refresh a quote in the background once the breaker allows a call"""
+        await asyncio.sleep(self.breaker.retry_after())
+
+        if not self.breaker.allow_request():
+            return
+
+        quote = await self._fetch_quote(symbol)
+        if quote:
+            self.breaker.record_success()
+            self._last_quotes[symbol] = quote
+        else:
+            self.breaker.record_failure()
+
+    async def _fetch_quote(self, symbol: str) -> Optional[Dict]:
+        """Fetch a quote from the provider without breaker handling"""
         async with self._semaphore:
             try:
                 async with httpx.AsyncClient() as client:
@@ -34,7 +108,7 @@ class MarketDataClient:
                             "symbol": symbol,
                             "apikey": self.api_key
                         },
-                        timeout=10.0
+                        timeout=settings.MARKET_DATA_TIMEOUT
                     )
 
                     if response.status_code == 200:
@@ -83,6 +157,9 @@ class MarketDataClient:
         Returns:
             List of OHLCV data points or None if failed
         """
+        if not self.breaker.allow_request():
+            return None
+
         async with self._semaphore:
             try:
                 async with httpx.AsyncClient() as client:
@@ -92,6 +169,7 @@ class MarketDataClient:
                             "symbol": symbol,
                             "interval": interval,
                             "outputsize": outputsize,
+                            "timezone": "UTC",
                             "apikey": self.api_key
                         },
                         timeout=15.0
@@ -99,11 +177,14 @@ class MarketDataClient:
 
                     if response.status_code == 200:
                         data = response.json()
+                        self.breaker.record_success()
                         return self._parse_time_series(data)
 
+                    self.breaker.record_failure()
                     return None
             except Exception as e:
                 print(f"Error fetching time series for {symbol}: {e}")
+                self.breaker.record_failure()
                 return None
 
     def _parse_quote(self, symbol: str, data: Dict) -> Dict:
@@ -39,7 +39,8 @@ class MarketDataService:
         # Fetch from external API
         quote_data = await market_data_client.get_quote(symbol_code)
 
-        if quote_data:
+        # Stale quotes (provider unavailable) are served but never persisted
+        if quote_data and not quote_data.get("is_stale"):
             # Store in cache
             if self.redis:
                 await self._store_in_cache(symbol_code, quote_data)
@@ -80,6 +81,9 @@ class MarketDataService:
             for symbol, quote_data in fresh_quotes.items():
                 quotes[symbol] = quote_data
 
+                if quote_data.get("is_stale"):
+                    continue
+
                 # Store in cache
                 if self.redis:
                     await self._store_in_cache(symbol, quote_data)
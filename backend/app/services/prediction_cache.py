@@ -0,0 +1,155 @@
+"""Shared prediction documents and per-user vote overlays in Redis"""
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.schemas.prediction import PredictionDocument
+
+# Cached in the overlay for predictions the user has not voted on
+NOT_VOTED = "-"
+
+
+def _document_key(prediction_id: UUID) -> str:
+    return f"prediction:doc:{prediction_id}"
+
+
+def _overlay_key(user_id: UUID) -> str:
+    return f"prediction:votes:{user_id}"
+
+
+async def get_documents(
+    redis_client: Optional[redis.Redis], prediction_ids: List[UUID]
+) -> Dict[UUID, PredictionDocument]:
+    """
+    Get cached shared documents.
+
+    Args:
+        redis_client: Redis client (nothing is cached when None)
+        prediction_ids: Prediction IDs
+
+    Returns:
+        Documents found in the cache
+    """
+    if not redis_client or not prediction_ids:
+        return {}
+
+    try:
+        cached = await redis_client.mget([_document_key(i) for i in prediction_ids])
+    except Exception as e:
+        print(f"Redis get error: {e}")
+        return {}
+
+    return {
+        prediction_id: PredictionDocument.model_validate_json(raw)
+        for prediction_id, raw in zip(prediction_ids, cached)
+        if raw is not None
+    }
+
+
+async def set_documents(
+    redis_client: Optional[redis.Redis], documents: Iterable[PredictionDocument]
+) -> None:
+    """
+    Cache shared documents for PREDICTION_CACHE_SECONDS.
+
+    Args:
+        redis_client: Redis client
+        documents: Documents to cache
+    """
+    if not redis_client:
+        return
+
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for document in documents:
+                pipe.setex(
+                    _document_key(document.id),
+                    settings.PREDICTION_CACHE_SECONDS,
+                    document.model_dump_json(),
+                )
+            await pipe.execute()
+    except Exception as e:
+        print(f"Redis set error: {e}")
+
+
+async def invalidate_documents(
+    redis_client: Optional[redis.Redis], prediction_ids: List[UUID]
+) -> None:
+    """
+    Drop cached documents after a vote or settlement changed them.
+
+    Args:
+        redis_client: Redis client
+        prediction_ids: Changed predictions
+    """
+    if not redis_client or not prediction_ids:
+        return
+
+    try:
+        await redis_client.delete(*[_document_key(i) for i in prediction_ids])
+    except Exception as e:
+        print(f"Redis delete error: {e}")
+
+
+async def get_user_votes(
+    redis_client: Optional[redis.Redis], user_id: UUID, prediction_ids: List[UUID]
+) -> Dict[UUID, Optional[str]]:
+    """
+    Get a user's cached votes.
+
+    Args:
+        redis_client: Redis client
+        user_id: User ID
+        prediction_ids: Prediction IDs
+
+    Returns:
+        Voted option, or None when known not to have voted; predictions
+        missing from the result are not cached
+    """
+    if not redis_client or not prediction_ids:
+        return {}
+
+    try:
+        cached = await redis_client.hmget(
+            _overlay_key(user_id), [str(i) for i in prediction_ids]
+        )
+    except Exception as e:
+        print(f"Redis get error: {e}")
+        return {}
+
+    votes = {}
+    for prediction_id, raw in zip(prediction_ids, cached):
+        if raw is None:
+            continue
+        option = raw.decode() if isinstance(raw, bytes) else raw
+        votes[prediction_id] = None if option == NOT_VOTED else option
+    return votes
+
+
+async def set_user_votes(
+    redis_client: Optional[redis.Redis], user_id: UUID, votes: Dict[UUID, Optional[str]]
+) -> None:
+    """
+    Cache a user's votes (None for not voted) for PREDICTION_OVERLAY_CACHE_SECONDS.
+
+    Args:
+        redis_client: Redis client
+        user_id: User ID
+        votes: Option per prediction
+    """
+    if not redis_client or not votes:
+        return
+
+    key = _overlay_key(user_id)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping={
+                str(prediction_id): option or NOT_VOTED
+                for prediction_id, option in votes.items()
+            })
+            pipe.expire(key, settings.PREDICTION_OVERLAY_CACHE_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        print(f"Redis set error: {e}")
@@ -0,0 +1,63 @@
+"""Prediction events published to background jobs via Redis pub/sub"""
+import json
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+
+# Deadline changes consumed by PredictionVerifierJob
+DEADLINE_CHANNEL = "predictions:deadlines"
+
+
+async def publish_deadline(
+    redis_client: Optional[redis.Redis],
+    prediction_id: UUID,
+    verify_time: Optional[datetime],
+) -> None:
+    """
+    Announce a new deadline, or a cancelled one when ``verify_time`` is None.
+
+    Delivery is best effort: the verifier's reconcile scan picks up anything
+    that was missed, so failures never fail the request.
+
+    Args:
+        redis_client: Redis client
+        prediction_id: Prediction ID
+        verify_time: Naive UTC verification time, None when cancelled
+    """
+    if not redis_client:
+        return
+
+    if verify_time and verify_time.tzinfo:
+        verify_time = verify_time.astimezone(timezone.utc).replace(tzinfo=None)
+
+    message = {
+        "prediction_id": str(prediction_id),
+        "verify_time": verify_time.isoformat() if verify_time else None,
+    }
+    try:
+        await redis_client.publish(DEADLINE_CHANNEL, json.dumps(message))
+    except Exception as e:
+        print(f"Redis publish error: {e}")
+
+
+def parse_deadline(data) -> tuple:
+    """
+    Parse a message published by ``publish_deadline``.
+
+    Args:
+        data: Raw message payload (bytes or str)
+
+    Returns:
+        (prediction_id, verify_time or None when cancelled)
+
+    Raises:
+        ValueError: If the message is malformed
+    """
+    message = json.loads(data)
+    verify_time = message.get("verify_time")
+    return (
+        UUID(message["prediction_id"]),
+        datetime.fromisoformat(verify_time) if verify_time else None,
+    )
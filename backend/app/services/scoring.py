@@ -0,0 +1,81 @@
+"""Prediction scoring and rank title rules (PRD 4.5.7)"""
+from typing import List, Tuple
+
+from sqlalchemy import case
+
+# Points
+SCORE_CREATE_PREDICTION = 5
+SCORE_VOTE = 1
+SCORE_CORRECT = 10
+SCORE_STREAK_2_BONUS = 5  # Second correct answer in a row
+SCORE_STREAK_3_PLUS_BONUS = 10  # Every correct answer from the third in a row
+SCORE_POPULAR_PREDICTION = 20  # Own prediction reached 100 participants
+POPULAR_PREDICTION_PARTICIPANTS = 100
+
+# Minimum participations to appear on the accuracy leaderboard
+LEADERBOARD_MIN_PARTICIPATIONS = 10
+
+DEFAULT_RANK_TITLE = "预测新手"
+
+# (min participations, min accuracy %, title), checked from the highest rank
+RANK_TITLES: List[Tuple[int, float, str]] = [
+    (200, 80, "预测宗师"),
+    (100, 75, "预测大师"),
+    (50, 70, "预测专家"),
+    (30, 60, "预测达人"),
+    (10, 0, "预测爱好者"),
+]
+
+
+def streak_bonus(streak: int) -> int:
+    """
+    Extra points for a correct answer that extends a streak.
+
+    Args:
+        streak: Streak length including this correct answer
+
+    Returns:
+        Bonus points on top of SCORE_CORRECT
+    """
+    if streak >= 3:
+        return SCORE_STREAK_3_PLUS_BONUS
+    if streak == 2:
+        return SCORE_STREAK_2_BONUS
+    return 0
+
+
+def rank_title(participations: int, accuracy_rate: float) -> str:
+    """
+    Get the rank title for a user's statistics.
+
+    Args:
+        participations: Number of settled predictions the user voted on
+        accuracy_rate: Accuracy in percent
+
+    Returns:
+        Rank title
+    """
+    for min_participations, min_accuracy, title in RANK_TITLES:
+        if participations >= min_participations and accuracy_rate >= min_accuracy:
+            return title
+    return DEFAULT_RANK_TITLE
+
+
+def streak_bonus_sql(streak):
+    """SQL expression equivalent of ``streak_bonus``"""
+    return case(
+        (streak >= 3, SCORE_STREAK_3_PLUS_BONUS),
+        (streak == 2, SCORE_STREAK_2_BONUS),
+        else_=0,
+    )
+
+
+def rank_title_sql(participations, accuracy_rate):
+    """SQL expression equivalent of ``rank_title``"""
+    return case(
+        *[
+            ((participations >= min_participations) & (accuracy_rate >= min_accuracy), title)
+            for min_participations, min_accuracy, title in RANK_TITLES
+        ],
+        else_=DEFAULT_RANK_TITLE,
+    )
@@ -0,0 +1,140 @@
+"""Vectorized recomputation of user prediction statistics from settled votes"""
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.scoring import (
+    SCORE_CORRECT,
+    SCORE_STREAK_2_BONUS,
+    SCORE_STREAK_3_PLUS_BONUS,
+    rank_title,
+)
+
+
+def run_lengths(correct: np.ndarray, starts: np.ndarray, carry: int = 0) -> np.ndarray:
+    """
+    Length of the run of correct answers ending at each vote.
+
+    Args:
+        correct: 0/1 per vote, grouped by user and in settlement order
+        starts: True where a new user's votes begin
+        carry: Streak the first user brings in from earlier votes
+
+    Returns:
+        Streak including each vote (0 for incorrect votes)
+    """
+    index = np.arange(len(correct))
+    # Position of the last streak break at or before each vote: an incorrect
+    # vote, or just before the first vote of a user
+    breaks = np.where(correct == 0, index, -1)
+    breaks = np.where(starts & (correct == 1), index - 1, breaks)
+    last_break = np.maximum.accumulate(breaks)
+    streaks = index - last_break
+
+    if carry:
+        # The first user's votes before any break extend the carried streak
+        streaks = streaks + np.where(last_break == -1, carry, 0)
+    return streaks
+
+
+def _points(streaks: np.ndarray) -> np.ndarray:
+    """Points of each vote given its streak (``SCORE_CORRECT`` + ``streak_bonus``)"""
+    bonus = np.select(
+        [streaks >= 3, streaks == 2],
+        [SCORE_STREAK_3_PLUS_BONUS, SCORE_STREAK_2_BONUS],
+        default=0,
+    )
+    return np.where(streaks > 0, SCORE_CORRECT + bonus, 0)
+
+
+def stats_row(
+    user_id, participations: int, correct_count: int, current_streak: int, max_streak: int, score: int
+) -> Dict[str, Any]:
+    """Stats table values for one user's totals"""
+    accuracy_rate = (
+        (Decimal(correct_count * 100) / participations).quantize(Decimal("0.01"))
+        if participations else Decimal("0.00")
+    )
+    return {
+        "user_id": user_id,
+        "total_participations": participations,
+        "correct_count": correct_count,
+        "accuracy_rate": accuracy_rate,
+        "current_streak": current_streak,
+        "max_streak": max_streak,
+        "prediction_score": score,
+        "rank_title": rank_title(participations, float(accuracy_rate)),
+    }
+
+
+class StatsAccumulator:
+    """
+    Folds chunks of settled votes into per-user statistics.
+
+    Votes must arrive grouped by user and, per user, in settlement order.
+    Each chunk is processed with array operations; only the last user of a
+    chunk is held back (their votes may continue in the next chunk), so
+    memory stays bounded by the chunk size.
+    """
+
+    def __init__(self):
+        self._carry: Optional[Dict[str, Any]] = None
+
+    def add(self, user_ids: Sequence, correct: Sequence[bool]) -> List[Dict[str, Any]]:
+        """
+        Process a chunk of votes.
+
+        Args:
+            user_ids: Voter of each vote
+            correct: Whether each vote was correct
+
+        Returns:
+            Stats rows of the users whose votes are complete
+        """
+        if not len(user_ids):
+            return []
+
+        users = np.asarray(user_ids, dtype=object)
+        correct = np.asarray(correct, dtype=np.int64)
+        starts = np.ones(len(users), dtype=bool)
+        starts[1:] = users[1:] != users[:-1]
+
+        carry = self._carry
+        continues = carry is not None and users[0] == carry["user_id"]
+        streaks = run_lengths(correct, starts, carry["current_streak"] if continues else 0)
+
+        offsets = np.flatnonzero(starts)
+        ends = np.append(offsets[1:], len(users)) - 1
+        participations = np.diff(np.append(offsets, len(users)))
+        correct_counts = np.add.reduceat(correct, offsets)
+        scores = np.add.reduceat(_points(streaks), offsets)
+        max_streaks = np.maximum.reduceat(streaks, offsets)
+        current_streaks = streaks[ends]
+
+        totals = [
+            [users[offset], int(p), int(c), int(cur), int(best), int(score)]
+            for offset, p, c, cur, best, score in zip(
+                offsets, participations, correct_counts, current_streaks, max_streaks, scores
+            )
+        ]
+
+        rows = []
+        if carry is not None:
+            if continues:
+                first = totals[0]
+                first[1] += carry["total_participations"]
+                first[2] += carry["correct_count"]
+                first[4] = max(first[4], carry["max_streak"])
+                first[5] += carry["prediction_score"]
+            else:
+                rows.append(carry)
+
+        rows.extend(stats_row(*t) for t in totals[:-1])
+        self._carry = stats_row(*totals[-1])
+        return rows
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """Stats row of the last user, once all chunks were added"""
+        carry, self._carry = self._carry, None
+        return [carry] if carry is not None else []
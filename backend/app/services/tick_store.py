@@ -0,0 +1,149 @@
+"""Latest-tick store used for price anchors"""
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.services.trading_calendar import TradingCalendar, trading_calendar
+
+
+@dataclass(frozen=True)
+class Tick:
+    """Latest known price of a symbol"""
+
+    symbol_code: str
+    price: Decimal
+    timestamp: datetime  # UTC time the price was observed
+    market: Optional[str] = None
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the tick was observed"""
+        return (datetime.utcnow() - self.timestamp).total_seconds()
+
+
+class TickStore:
+    """
+    Latest tick per symbol, fed by PriceFetcherJob.
+
+    Ticks live in process memory and in a Redis hash per symbol
+    (``tick:{symbol}``). A process that runs the price fetcher reads its own
+    memory; API workers fed by a separate job worker read the Redis hash.
+    Either way an anchor lookup is O(1) and never calls the provider.
+    """
+
+    KEY_PREFIX = "tick:"
+
+    def __init__(self, calendar: Optional[TradingCalendar] = None):
+        self.calendar = calendar or trading_calendar
+        self._ticks: Dict[str, Tick] = {}
+        self._fed_locally = False
+
+    async def update(
+        self,
+        symbol_code: str,
+        price_data: dict,
+        redis_client: Optional[redis.Redis] = None,
+        market: Optional[str] = None,
+    ) -> Tick:
+        """
+        Record the latest price of a symbol.
+
+        Args:
+            symbol_code: Symbol code
+            price_data: Quote data with "price" and optionally "timestamp"
+            redis_client: Redis client to share the tick with other processes
+            market: Symbol.market, used to relax freshness while closed
+
+        Returns:
+            The stored tick
+        """
+        timestamp = price_data.get("timestamp") or datetime.utcnow()
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+
+        tick = Tick(
+            symbol_code=symbol_code,
+            price=Decimal(str(price_data["price"])),
+            timestamp=timestamp,
+            market=market,
+        )
+        self._ticks[symbol_code] = tick
+        self._fed_locally = True
+
+        if redis_client:
+            key = f"{self.KEY_PREFIX}{symbol_code}"
+            mapping = {"price": str(tick.price), "timestamp": tick.timestamp.isoformat()}
+            if market:
+                mapping["market"] = market
+            await redis_client.hset(key, mapping=mapping)
+            await redis_client.expire(key, settings.TICK_TTL_SECONDS)
+
+        return tick
+
+    async def get(
+        self, symbol_code: str, redis_client: Optional[redis.Redis] = None
+    ) -> Optional[Tick]:
+        """
+        Get the latest tick of a symbol regardless of its age.
+
+        Args:
+            symbol_code: Symbol code
+            redis_client: Redis client used when this process is not fed locally
+
+        Returns:
+            Latest tick or None if unknown
+        """
+        if self._fed_locally or redis_client is None:
+            return self._ticks.get(symbol_code)
+
+        data = await redis_client.hgetall(f"{self.KEY_PREFIX}{symbol_code}")
+        if not data:
+            return None
+
+        data = {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in data.items()
+        }
+        return Tick(
+            symbol_code=symbol_code,
+            price=Decimal(data["price"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            market=data.get("market"),
+        )
+
+    async def get_anchor(
+        self, symbol_code: str, redis_client: Optional[redis.Redis] = None
+    ) -> Optional[Tick]:
+        """
+        Get a tick that is fresh enough to anchor a comment, prediction or vote.
+
+        While the symbol's market is open the tick must be younger than
+        PRICE_ANCHOR_MAX_AGE_SECONDS. While it is closed the last tick is the
+        closing price and stays valid.
+
+        Args:
+            symbol_code: Symbol code
+            redis_client: Redis client used when this process is not fed locally
+
+        Returns:
+            Fresh tick or None if no fresh price is known
+        """
+        tick = await self.get(symbol_code, redis_client)
+        if tick is None:
+            return None
+
+        if tick.market and not self.calendar.is_open(tick.market):
+            return tick
+
+        if tick.age_seconds > settings.PRICE_ANCHOR_MAX_AGE_SECONDS:
+            return None
+
+        return tick
+
+
+# Global instance
+tick_store = TickStore()
@@ -0,0 +1,153 @@
+"""Trading calendar for market session awareness"""
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+
+class MarketStatus(str, Enum):
+    """Market status reported alongside quotes"""
+
+    TRADING = "trading"
+    CLOSED = "closed"
+
+
+# A session is (weekday, start, end) in the market's local time, Monday = 0.
+# Sessions crossing midnight are split into two entries.
+Session = Tuple[int, time, time]
+
+_MIDNIGHT = time(0, 0)
+_END_OF_DAY = time(23, 59, 59, 999999)
+
+_NEW_YORK = ZoneInfo("America/New_York")
+_SHANGHAI = timezone(timedelta(hours=8))  # China does not observe DST
+
+
+def _weekly(days: Iterable[int], start: time, end: time) -> List[Session]:
+    return [(day, start, end) for day in days]
+
+
+# FX trades continuously from Sunday 17:00 to Friday 17:00 New York time
+_FOREX_SESSIONS: List[Session] = (
+    _weekly([6], time(17, 0), _END_OF_DAY)
+    + _weekly(range(0, 4), _MIDNIGHT, _END_OF_DAY)
+    + _weekly([4], _MIDNIGHT, time(17, 0))
+)
+
+# Spot metals (LBMA) and COMEX futures trade Sunday 18:00 to Friday 17:00
+# New York time with a daily one-hour break at 17:00
+_METALS_SESSIONS: List[Session] = (
+    _weekly([6], time(18, 0), _END_OF_DAY)
+    + _weekly(range(0, 4), _MIDNIGHT, time(17, 0))
+    + _weekly(range(0, 4), time(18, 0), _END_OF_DAY)
+    + _weekly([4], _MIDNIGHT, time(17, 0))
+)
+
+# Shanghai Gold Exchange: day session 09:00-11:30 / 13:30-15:30 and night
+# session 20:00-02:30 (next day), Monday to Friday
+_SGE_SESSIONS: List[Session] = (
+    _weekly(range(0, 5), time(9, 0), time(11, 30))
+    + _weekly(range(0, 5), time(13, 30), time(15, 30))
+    + _weekly(range(0, 5), time(20, 0), _END_OF_DAY)
+    + _weekly(range(1, 6), _MIDNIGHT, time(2, 30))
+)
+
+# market -> (timezone, sessions); None sessions means the market never closes
+MARKET_SESSIONS: Dict[str, Tuple[object, Optional[List[Session]]]] = {
+    "FOREX": (_NEW_YORK, _FOREX_SESSIONS),
+    "LBMA": (_NEW_YORK, _METALS_SESSIONS),
+    "COMEX": (_NEW_YORK, _METALS_SESSIONS),
+    "SGE": (_SHANGHAI, _SGE_SESSIONS),
+    "CRYPTO": (timezone.utc, None),
+}
+
+# Holidays observed every year, as (month, day) in market local time
+RECURRING_HOLIDAYS: Dict[str, Set[Tuple[int, int]]] = {
+    "FOREX": {(1, 1), (12, 25)},
+    "LBMA": {(1, 1), (12, 25)},
+    "COMEX": {(1, 1), (12, 25)},
+    "SGE": {(1, 1)},
+}
+
+
+class TradingCalendar:
+    """
+    Decides whether a market is in session at a given time.
+
+    Sessions are defined per ``Symbol.market`` in the market's local time
+    zone. Unknown markets are treated as always open so that polling and
+    quotes never stop because of missing calendar data.
+    """
+
+    def __init__(self, holidays: Optional[Dict[str, Iterable[date]]] = None):
+        """
+        Initialize the calendar.
+
+        Args:
+            holidays: Extra non-recurring holiday dates per market
+                (e.g. Chinese New Year for SGE), in market local time
+        """
+        self.holidays: Dict[str, Set[date]] = {
+            market.upper(): set(dates) for market, dates in (holidays or {}).items()
+        }
+
+    def is_open(self, market: str, at: Optional[datetime] = None) -> bool:
+        """
+        Check whether a market is in session.
+
+        Args:
+            market: Market code (FOREX, LBMA, COMEX, SGE, CRYPTO)
+            at: Point in time (naive values are taken as UTC); defaults to now
+
+        Returns:
+            True if the market is trading
+        """
+        market = (market or "").upper()
+        if market not in MARKET_SESSIONS:
+            return True
+
+        tz, sessions = MARKET_SESSIONS[market]
+        if sessions is None:
+            return True
+
+        if at is None:
+            at = datetime.now(timezone.utc)
+        elif at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+
+        local = at.astimezone(tz)
+        if self._is_holiday(market, local.date()):
+            return False
+
+        weekday = local.weekday()
+        now = local.time()
+        return any(
+            day == weekday and start <= now < end
+            for day, start, end in sessions
+        )
+
+    def market_status(self, market: str, at: Optional[datetime] = None) -> str:
+        """
+        Get the market status string used in quote responses.
+
+        Args:
+            market: Market code
+            at: Point in time; defaults to now
+
+        Returns:
+            "trading" or "closed"
+        """
+        if self.is_open(market, at):
+            return MarketStatus.TRADING.value
+        return MarketStatus.CLOSED.value
+
+    def _is_holiday(self, market: str, local_date: date) -> bool:
+        if (local_date.month, local_date.day) in RECURRING_HOLIDAYS.get(market, set()):
+            return True
+        return local_date in self.holidays.get(market, set())
+
+
+# Global instance
+trading_calendar = TradingCalendar(holidays=settings.MARKET_HOLIDAYS)
@@ -0,0 +1,76 @@
+"""Backtest auto-verification condition templates over historical candles
+
+Usage:
+    python scripts/backtest.py XAUUSD --horizon 60 \
+        --condition "A=price_change_percent >= 0.5" \
+        --condition "B=-0.5 < price_change_percent < 0.5" \
+        --condition "C=price_change_percent <= -0.5"
+
+    python scripts/backtest.py XAUUSD --templates templates.json
+
+A templates file holds a list of {"conditions": {"A": "..."}, "horizon_minutes": 60}.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from app.services.backtest import INTERVAL_SECONDS, MAX_CANDLES, backtest_template, load_candles
+from app.services.conditions import ConditionError
+from app.services.market_data_client import market_data_client
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Backtest prediction condition templates")
+    parser.add_argument("symbol", help="Symbol code, e.g. XAUUSD")
+    parser.add_argument("--interval", default="1min", choices=sorted(INTERVAL_SECONDS))
+    parser.add_argument("--outputsize", type=int, default=MAX_CANDLES)
+    parser.add_argument("--step", type=int, default=1, help="Start a window every N candles")
+    parser.add_argument("--horizon", type=int, help="Minutes from creation to verification")
+    parser.add_argument("--condition", action="append", default=[], help="KEY=condition")
+    parser.add_argument("--templates", help="JSON file with a list of templates")
+    return parser.parse_args()
+
+
+def load_templates(args):
+    if args.templates:
+        with open(args.templates) as f:
+            return json.load(f)
+
+    if not args.condition or not args.horizon:
+        raise SystemExit("Give --horizon and --condition, or --templates")
+    conditions = dict(c.split("=", 1) for c in args.condition)
+    return [{"conditions": conditions, "horizon_minutes": args.horizon}]
+
+
+async def run_backtest():
+    args = parse_args()
+    templates = load_templates(args)
+
+    candles = await load_candles(market_data_client, args.symbol, args.interval, args.outputsize)
+    if not len(candles):
+        print(f"✗ No historical data for {args.symbol}")
+        return
+
+    started = time.perf_counter()
+    results = []
+    for template in templates:
+        try:
+            results.append(backtest_template(
+                candles, template["conditions"], template["horizon_minutes"] * 60, args.step
+            ))
+        except ConditionError as e:
+            print(f"✗ Invalid template {template['conditions']}: {e}")
+            return
+    elapsed = time.perf_counter() - started
+
+    scenarios = sum(r["windows"] for r in results)
+    print(json.dumps(results, indent=2))
+    print(
+        f"\n✓ {len(templates)} templates, {scenarios} scenarios over {len(candles)} candles "
+        f"in {elapsed * 1000:.1f}ms ({scenarios / elapsed if elapsed else 0:.0f} scenarios/sec)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_backtest())
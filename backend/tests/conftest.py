@@ -2,6 +2,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.services.feed_cache import comment_feed, prediction_feed
 
 
 @pytest.fixture
@@ -9,3 +10,10 @@ def client():
     """Test client fixture"""
     return TestClient(app)
 
+
+
+@pytest.fixture(autouse=True)
+def clear_feed_caches():
+    """Start every test with empty in-process feed caches"""
+    comment_feed.clear_local()
+    prediction_feed.clear_local()
@@ -0,0 +1,201 @@
+"""Tests for the condition backtest engine"""
+import pytest
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+from fastapi import HTTPException
+
+from app.api.v1.admin import backtest_predictions
+from app.core.deps import get_admin_user
+from app.schemas.backtest import PredictionBacktestRequest
+from app.services.backtest import Candles, backtest_template, resolve_predictions
+from app.services.conditions import compile_conditions
+
+START = datetime(2024, 3, 1, 9, 0)
+
+
+def minute_candles(closes):
+    """1min candles opening at START, newest first like the provider"""
+    series = [
+        {"timestamp": START + timedelta(minutes=i), "close": close}
+        for i, close in enumerate(closes)
+    ]
+    return Candles.from_series(list(reversed(series)), "1min")
+
+
+class TestCandles:
+    """Tests for Candles"""
+
+    def test_price_is_last_close_before_time(self):
+        """Test the verifier's pricing rule and coverage"""
+        candles = minute_candles([100.0, 101.0, 102.0])
+        seconds = np.array([START, START + timedelta(seconds=90), START + timedelta(minutes=3),
+                            START + timedelta(minutes=4)], dtype="datetime64[s]").astype(np.int64)
+
+        prices = candles.prices_at(seconds)
+
+        assert np.isnan(prices[0])  # Before the first candle closed
+        assert prices[1] == 100.0
+        assert prices[2] == 102.0
+        assert np.isnan(prices[3])  # After the history ends
+
+
+class TestBacktestTemplate:
+    """Tests for backtest_template"""
+
+    def test_outcomes_over_all_windows(self):
+        """Test that every complete window is resolved to its option"""
+        candles = minute_candles([100.0, 102.0, 101.0, 99.0, 99.0])
+        conditions = {
+            "A": "price_change_percent > 0",
+            "B": "price_change_percent < 0",
+        }
+
+        result = backtest_template(candles, conditions, horizon_seconds=60)
+
+        # Changes: +2%, -0.98%, -1.98%, 0%; the last start has no exit
+        assert result["windows"] == 4
+        assert result["unresolved"] == 1
+        assert result["no_match"] == 1
+        assert result["options"]["A"] == {"count": 1, "frequency": 0.25}
+        assert result["options"]["B"]["count"] == 2
+
+    def test_first_matching_option_wins(self):
+        """Test option order for overlapping conditions, like the verifier"""
+        candles = minute_candles([100.0, 102.0, 102.51, 101.49])
+        conditions = {
+            "A": "price_change_percent >= 0.5",
+            "B": "price_change_percent >= 0",
+        }
+
+        result = backtest_template(candles, conditions, horizon_seconds=60)
+
+        # Changes: +2% (A and B hold), +0.5% (A, closed bound), -1% (none)
+        assert result["windows"] == 3
+        assert result["options"]["A"]["count"] == 2
+        assert result["options"]["B"]["count"] == 0
+        assert result["no_match"] == 1
+
+
+class TestResolvePredictions:
+    """Tests for resolve_predictions"""
+
+    def test_flags_predictions_that_resolve_differently(self):
+        """Test re-resolution against stored anchors and outcomes"""
+        candles = minute_candles([100.0, 101.0, 102.0])
+        conditions = compile_conditions({"A": "price_change_percent > 0", "B": "price_change_percent <= 0"})
+        disputed, confirmed, uncovered = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        predictions = [
+            {"id": disputed, "price_at_create": Decimal("100"), "verify_time": START + timedelta(minutes=3),
+             "auto_verify_conditions": conditions, "correct_option": "B"},
+            {"id": confirmed, "price_at_create": Decimal("103"), "verify_time": START + timedelta(minutes=2),
+             "auto_verify_conditions": conditions, "correct_option": "B"},
+            {"id": uncovered, "price_at_create": Decimal("100"), "verify_time": START + timedelta(hours=1),
+             "auto_verify_conditions": conditions, "correct_option": "A"},
+        ]
+
+        results = {r["prediction_id"]: r for r in resolve_predictions(candles, predictions)}
+
+        assert results[disputed]["correct_option"] == "A"
+        assert results[disputed]["price_at_verify"] == Decimal("102.0")
+        assert results[disputed]["differs"] is True
+        assert results[confirmed]["differs"] is False
+        assert results[uncovered]["price_at_verify"] is None
+        assert results[uncovered]["differs"] is False
+
+    def test_stored_ticks_win_over_candles(self):
+        """Test that a stored tick at the deadline is used before candles"""
+        candles = minute_candles([100.0, 101.0, 102.0])
+        conditions = compile_conditions({"A": "price_change_percent > 0", "B": "price_change_percent <= 0"})
+        ticked, candled = uuid.uuid4(), uuid.uuid4()
+        predictions = [
+            {"id": ticked, "price_at_create": Decimal("100"), "verify_time": START + timedelta(minutes=3),
+             "auto_verify_conditions": conditions, "correct_option": "A"},
+            {"id": candled, "price_at_create": Decimal("100"), "verify_time": START + timedelta(minutes=3),
+             "auto_verify_conditions": conditions, "correct_option": "A"},
+        ]
+
+        results = {
+            r["prediction_id"]: r
+            for r in resolve_predictions(candles, predictions, [Decimal("99.5"), None])
+        }
+
+        assert results[ticked]["price_at_verify"] == Decimal("99.5")
+        assert results[ticked]["correct_option"] == "B"
+        assert results[candled]["price_at_verify"] == Decimal("102.0")
+
+
+class TestBacktestPredictions:
+    """Tests for POST /admin/backtest/predictions"""
+
+    @pytest.mark.asyncio
+    async def test_apply_requires_minute_candles(self):
+        """Test that re-settling from coarse candles is rejected before any lookup"""
+        db = AsyncMock()
+        request = PredictionBacktestRequest(prediction_ids=[uuid.uuid4()], interval="1day", apply=True)
+
+        with pytest.raises(HTTPException) as exc:
+            await backtest_predictions(
+                request, admin=None, db=db, redis_client=None,
+                settlement_repository=AsyncMock(), quote_repository=AsyncMock(),
+            )
+
+        assert exc.value.status_code == 400
+        assert not db.execute.called
+
+    @pytest.mark.asyncio
+    async def test_malformed_legacy_condition_is_reported_unresolved(self, monkeypatch):
+        """Test that one stored condition that no longer compiles does not fail the batch"""
+        conditions = compile_conditions({"A": "price_change_percent > 0", "B": "price_change_percent <= 0"})
+        broken, valid = uuid.uuid4(), uuid.uuid4()
+        rows = [
+            {"id": broken, "symbol_code": "XAUUSD", "price_at_create": Decimal("100"),
+             "verify_time": START + timedelta(minutes=3),
+             "auto_verify_conditions": {"A": {"condition": "__import__(1)"}},
+             "correct_option": "A", "status": "ended"},
+            {"id": valid, "symbol_code": "XAUUSD", "price_at_create": Decimal("100"),
+             "verify_time": START + timedelta(minutes=3), "auto_verify_conditions": conditions,
+             "correct_option": "B", "status": "ended"},
+        ]
+        db = AsyncMock()
+        db.execute.return_value = MagicMock()
+        db.execute.return_value.mappings.return_value.all.return_value = rows
+        quote_repository = AsyncMock()
+        quote_repository.prices_at.return_value = [None, None]
+        settlement_repository = AsyncMock()
+        settlement_repository.resettle.return_value = 1
+
+        async def candles(*args):
+            return minute_candles([100.0, 101.0, 102.0])
+
+        monkeypatch.setattr("app.api.v1.admin.load_candles", candles)
+        request = PredictionBacktestRequest(prediction_ids=[broken, valid], interval="1min", apply=True)
+
+        response = await backtest_predictions(
+            request, admin=None, db=db, redis_client=None,
+            settlement_repository=settlement_repository, quote_repository=quote_repository,
+        )
+
+        results = {r.prediction_id: r for r in response.results}
+        assert results[broken].correct_option is None
+        assert results[broken].differs is False and results[broken].resettled is False
+        assert results[valid].correct_option == "A" and results[valid].resettled is True
+        settlement_repository.resettle.assert_awaited_once_with(valid, Decimal("102.0"), "A")
+
+
+class TestAdminAccess:
+    """Tests for the moderator dependency"""
+
+    @pytest.mark.asyncio
+    async def test_only_listed_usernames_are_admins(self, monkeypatch):
+        """Test that non-moderators are rejected"""
+        monkeypatch.setattr("app.core.deps.settings.ADMIN_USERNAMES", ["moderator"])
+
+        assert (await get_admin_user(SimpleNamespace(username="moderator"))).username == "moderator"
+        with pytest.raises(HTTPException) as exc:
+            await get_admin_user(SimpleNamespace(username="trader"))
+        assert exc.value.status_code == 403
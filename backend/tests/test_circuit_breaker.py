@@ -0,0 +1,113 @@
+"""Tests for the circuit breaker and stale quote serving"""
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.circuit_breaker import CircuitBreaker, CircuitState
+from app.services.market_data_client import MarketDataClient
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker"""
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit"""
+        breaker = CircuitBreaker("test", failure_threshold=3, jitter=0, clock=FakeClock())
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+    def test_half_open_allows_single_trial(self):
+        """Test that only one trial call is let through after the backoff"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "test", failure_threshold=1, base_backoff_seconds=2, jitter=0, clock=clock
+        )
+        breaker.record_failure()
+
+        clock.now = 2.0
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_backoff_grows_exponentially(self):
+        """Test that each re-open doubles the backoff up to the cap"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "test",
+            failure_threshold=1,
+            base_backoff_seconds=1,
+            max_backoff_seconds=3,
+            jitter=0,
+            clock=clock,
+        )
+
+        breaker.record_failure()
+        assert breaker.retry_after() == 1
+
+        clock.now = 1.0
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.retry_after() == 2
+
+        clock.now = 3.0
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.retry_after() == 3  # Capped
+
+
+class TestMarketDataClientBreaker:
+    """Tests for stale-while-revalidate in MarketDataClient"""
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_quote_when_open(self):
+        """Test that the last known quote is served while the breaker is open"""
+        client = MarketDataClient()
+        client.breaker = CircuitBreaker("test", failure_threshold=1, jitter=0)
+        client._fetch_quote = AsyncMock(return_value={"symbol_code": "XAUUSD", "price": 2650.0})
+
+        fresh = await client.get_quote("XAUUSD")
+        assert fresh["price"] == 2650.0
+        assert "is_stale" not in fresh
+
+        client._fetch_quote.return_value = None
+        stale = await client.get_quote("XAUUSD")
+        assert stale["price"] == 2650.0
+        assert stale["is_stale"] is True
+        assert client.breaker.state == CircuitState.OPEN
+
+        # Open breaker: no provider call on the request path
+        client._fetch_quote.reset_mock()
+        stale = await client.get_quote("XAUUSD")
+        assert stale["is_stale"] is True
+        assert not client._fetch_quote.called
+
+        for task in client._refresh_tasks.values():
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_without_known_quote(self):
+        """Test that unknown symbols fail fast while the breaker is open"""
+        client = MarketDataClient()
+        client.breaker = CircuitBreaker("test", failure_threshold=1, jitter=0)
+        client.breaker.record_failure()
+        client._fetch_quote = AsyncMock()
+
+        assert await client.get_quote("EURUSD") is None
+        assert not client._fetch_quote.called
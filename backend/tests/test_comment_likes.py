@@ -0,0 +1,282 @@
+"""Tests for Redis comment likes with write-behind"""
+import pytest
+import uuid
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.comments import like_comment
+from app.models import User
+from app.services.comment_likes import CommentLikes
+
+
+class FakeRedis:
+    """In-memory sets and hashes; eval runs the toggle script's logic"""
+
+    def __init__(self):
+        self.sets = {}
+        self.hashes = {}
+        self.evals = 0
+
+    async def eval(self, script, numkeys, set_key, pending_key, member, field, ttl):
+        self.evals += 1
+        if set_key not in self.sets:
+            return -1
+        members = self.sets[set_key]
+        liked = 0 if member in members else 1
+        (members.add if liked else members.discard)(member)
+        self.hashes.setdefault(pending_key, {})[field.encode()] = str(liked).encode()
+        return liked
+
+    async def scard(self, key):
+        return len(self.sets.get(key, ()))
+
+    async def exists(self, key):
+        return int(key in self.sets or key in self.hashes)
+
+    async def rename(self, key, new_key):
+        self.hashes[new_key] = self.hashes.pop(key)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.sets.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __init__(self):
+                self.replies = []
+
+            def sadd(self, key, *members):
+                redis.sets.setdefault(key, set()).update(members)
+
+            def expire(self, key, ttl):
+                pass
+
+            def scard(self, key):
+                self.replies.append(len(redis.sets.get(key, ())))
+
+            def sismember(self, key, member):
+                self.replies.append(int(member in redis.sets.get(key, ())))
+
+            async def execute(self):
+                return self.replies
+
+        return Pipeline()
+
+
+class DownRedis(FakeRedis):
+    """FakeRedis whose toggle fails, as when Redis is unreachable"""
+
+    async def eval(self, *args):
+        raise ConnectionError("Redis unavailable")
+
+
+class CountFailsRedis(FakeRedis):
+    """FakeRedis that toggles but fails to count"""
+
+    async def scard(self, key):
+        raise ConnectionError("Redis unavailable")
+
+    async def mget(self, keys):
+        return [None] * len(keys)
+
+
+class WriteThroughSession:
+    """Fake AsyncSession for the PostgreSQL path: nothing to unlike, the like is inserted"""
+
+    def __init__(self, comment_id, total):
+        self.comment_id = comment_id
+        self.total = total
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        result = MagicMock()
+        result.first.return_value = None if sql.startswith("DELETE") else (uuid.uuid4(),)
+        result.scalar_one_or_none.return_value = self.comment_id
+        result.all.return_value = [(self.comment_id, self.total)]
+        return result
+
+    async def commit(self):
+        self.commits += 1
+
+
+class LikeSession:
+    """Fake AsyncSession answering like queries and recording their SQL"""
+
+    def __init__(self, likers=(), comment_exists=True):
+        self.likers = list(likers)
+        self.comment_exists = comment_exists
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        self.statements.append(sql)
+        result = MagicMock()
+        if sql.startswith("SELECT comment_likes.user_id"):
+            result.scalars.return_value.all.return_value = self.likers
+        elif sql.startswith("SELECT comments.id"):
+            result.scalar_one_or_none.return_value = uuid.uuid4() if self.comment_exists else None
+            result.scalars.return_value.all.return_value = [
+                v for k, v in params.items() if k.startswith("id_")
+            ][0] if self.comment_exists else []
+        elif sql.startswith("INSERT INTO comment_likes"):
+            result.scalars.return_value.all.return_value = [
+                v for k, v in params.items() if k.startswith("comment_id")
+            ]
+        elif sql.startswith("DELETE FROM comment_likes"):
+            result.scalars.return_value.all.return_value = [pair[0] for pair in self.unliked(params)]
+        return result
+
+    @staticmethod
+    def unliked(params):
+        return [v for k, v in params.items() if k.startswith("param")][0]
+
+    async def commit(self):
+        self.commits += 1
+
+
+def make_user() -> User:
+    return User(id=uuid.uuid4(), username="trader", email="t@example.com", password_hash="x", is_active=True)
+
+
+class TestLikeComment:
+    """Tests for POST /comments/{id}/like"""
+
+    @pytest.mark.asyncio
+    async def test_taps_only_touch_redis_once_loaded(self):
+        """Test that only the first tap on a comment reads PostgreSQL"""
+        redis_client = FakeRedis()
+        comment_id = uuid.uuid4()
+        earlier = uuid.uuid4()
+        session = LikeSession(likers=[earlier])
+
+        first = await like_comment(comment_id, make_user(), session, redis_client)
+        queries_after_first = len(session.statements)
+        second = await like_comment(comment_id, make_user(), session, redis_client)
+
+        # Existence check and loading the likers, then nothing
+        assert queries_after_first == 2
+        assert len(session.statements) == 2
+        assert session.commits == 0
+        assert (first.user_liked, first.likes_count) == (True, 2)
+        assert second.likes_count == 3
+
+    @pytest.mark.asyncio
+    async def test_double_tap_toggles_back(self):
+        """Test that a second tap by the same user unlikes"""
+        redis_client = FakeRedis()
+        comment_id = uuid.uuid4()
+        user = make_user()
+        session = LikeSession()
+
+        await like_comment(comment_id, user, session, redis_client)
+        response = await like_comment(comment_id, user, session, redis_client)
+
+        assert (response.user_liked, response.likes_count) == (False, 0)
+        # Only the last state is pending
+        assert list(redis_client.hashes["comment:likes:pending"].values()) == [b"0"]
+
+
+    @pytest.mark.asyncio
+    async def test_failed_toggle_drops_the_set_and_writes_through(self):
+        """Test that a Redis failure falls back to PostgreSQL and drops the stale set"""
+        redis_client = DownRedis()
+        comment_id = uuid.uuid4()
+        redis_client.sets[f"comment:likes:{comment_id}"] = {""}
+        session = WriteThroughSession(comment_id, total=1)
+
+        response = await like_comment(comment_id, make_user(), session, redis_client)
+
+        assert (response.user_liked, response.likes_count) == (True, 1)
+        assert f"comment:likes:{comment_id}" not in redis_client.sets
+        assert any(s.startswith("INSERT INTO comment_likes") for s in session.statements)
+        assert session.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_count_failure_after_toggle_is_not_an_error(self):
+        """Test that a toggled like is answered with the counter total if counting fails"""
+        redis_client = CountFailsRedis()
+        comment_id = uuid.uuid4()
+        redis_client.sets[f"comment:likes:{comment_id}"] = {""}
+        session = WriteThroughSession(comment_id, total=4)
+
+        response = await like_comment(comment_id, make_user(), session, redis_client)
+
+        assert (response.user_liked, response.likes_count) == (True, 4)
+        # The tap stays pending in Redis; nothing is written through
+        assert session.commits == 0
+        assert len(redis_client.hashes["comment:likes:pending"]) == 1
+
+
+class TestCommentLikesCounts:
+    """Tests for reading likes of whole pages"""
+
+    @pytest.mark.asyncio
+    async def test_counts_and_user_liked_of_loaded_sets(self):
+        """Test that loaded sets answer in one pipeline and unloaded ones are left out"""
+        redis_client = FakeRedis()
+        likes = CommentLikes()
+        viewer = uuid.uuid4()
+        liked, other, unloaded = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        redis_client.sets[f"comment:likes:{liked}"] = {"", str(viewer), str(uuid.uuid4())}
+        redis_client.sets[f"comment:likes:{other}"] = {""}
+
+        counts, user_liked = await likes.counts(redis_client, [liked, other, unloaded], viewer)
+
+        assert counts == {liked: 2, other: 0}
+        assert user_liked == {liked: True, other: False}
+        assert await likes.counts(redis_client, [liked]) == ({liked: 2}, {})
+        assert await likes.is_liked(redis_client, unloaded, viewer) is None
+
+
+class TestCommentLikesFlush:
+    """Tests for the write-behind flush"""
+
+    @pytest.mark.asyncio
+    async def test_flush_batches_changes_and_counter_deltas(self):
+        """Test that pending changes become one insert, one delete and net counter updates"""
+        redis_client = FakeRedis()
+        likes = CommentLikes()
+        comment_id = uuid.uuid4()
+        fan, critic = uuid.uuid4(), uuid.uuid4()
+        redis_client.sets[f"comment:likes:{comment_id}"] = {"", str(critic)}
+
+        await likes.toggle(redis_client, comment_id, fan)
+        await likes.toggle(redis_client, comment_id, critic)
+        session = LikeSession()
+
+        assert await likes.flush(session, redis_client) == (1, 1)
+
+        inserts = [s for s in session.statements if s.startswith("INSERT INTO comment_likes")]
+        deletes = [s for s in session.statements if s.startswith("DELETE FROM comment_likes")]
+        assert len(inserts) == 1 and "ON CONFLICT (comment_id, user_id) DO NOTHING" in inserts[0]
+        assert len(deletes) == 1
+        # +1 -1 nets to no counter write
+        assert not any(s.startswith("INSERT INTO counter_shards") for s in session.statements)
+        assert session.commits == 1
+        assert await redis_client.exists("comment:likes:flushing") == 0
+
+    @pytest.mark.asyncio
+    async def test_nothing_pending(self):
+        """Test that an idle flush runs no queries"""
+        session = LikeSession()
+
+        assert await CommentLikes().flush(session, FakeRedis()) == (0, 0)
+        assert session.statements == []
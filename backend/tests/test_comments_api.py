@@ -0,0 +1,164 @@
+"""Tests for comment API query patterns"""
+import pytest
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.comments import PREVIEW_REPLIES, get_comments
+from app.models import Comment, User
+from app.services.feed_cache import comment_feed
+
+
+def make_user() -> User:
+    return User(
+        id=uuid.uuid4(),
+        username=f"trader{uuid.uuid4().hex[:6]}",
+        email="trader@example.com",
+        password_hash="x",
+        created_at=datetime.utcnow(),
+        is_active=True,
+    )
+
+
+def make_comment(author: User, parent: Comment = None, minutes: int = 0) -> Comment:
+    return Comment(
+        id=uuid.uuid4(),
+        user_id=author.id,
+        user=author,
+        symbol_code="XAUUSD",
+        content="Gold looks strong",
+        price_at_comment=2658.5,
+        parent_id=parent.id if parent else None,
+        likes_count=0,
+        replies_count=0,
+        created_at=datetime.utcnow() + timedelta(minutes=minutes),
+        is_deleted=False,
+    )
+
+
+class CommentSession:
+    """Fake AsyncSession answering comment list queries and recording their SQL"""
+
+    def __init__(self, comments, replies, liked=()):
+        self.comments = comments
+        self.replies = replies
+        self.liked = list(liked)
+        self.statements = []
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        result = MagicMock()
+
+        if "row_number()" in sql:
+            result.scalars.return_value.all.return_value = self.replies
+        elif sql.startswith("SELECT comments.id, comments.user_id"):
+            result.scalars.return_value.all.return_value = self.comments
+        elif "counter_shards" in sql:
+            result.all.return_value = []
+        elif sql.startswith("SELECT comment_likes.comment_id"):
+            result.scalars.return_value.all.return_value = self.liked
+        else:
+            raise AssertionError(f"Unexpected query: {sql}")
+
+        return result
+
+    async def refresh(self, *args, **kwargs):
+        raise AssertionError("Relationships must be loaded eagerly")
+
+
+class TestGetComments:
+    """Tests for GET /comments"""
+
+    @pytest.mark.asyncio
+    async def test_query_count_is_constant(self):
+        """Test that a full page with replies costs three queries"""
+        comments = [make_comment(make_user(), minutes=-i) for i in range(20)]
+        replies = [
+            make_comment(make_user(), parent=comment, minutes=j)
+            for comment in comments
+            for j in range(PREVIEW_REPLIES)
+        ]
+        session = CommentSession(comments, replies)
+
+        response = await get_comments(
+            symbol="XAUUSD", user_id=None, cursor=None, page=1, limit=20,
+            include_total=False, current_user=None, db=session, redis_client=None
+        )
+
+        # Page with authors, reply previews with authors, like totals
+        assert len(session.statements) == 3
+        assert "LEFT OUTER JOIN users" in session.statements[0]
+        assert "PARTITION BY comments.parent_id" in session.statements[1]
+        assert "LEFT OUTER JOIN users" in session.statements[1]
+        assert len(response.comments) == 20
+        assert all(len(c.replies) == PREVIEW_REPLIES for c in response.comments)
+        assert response.comments[0].replies[0].parent_id == comments[0].id
+
+    @pytest.mark.asyncio
+    async def test_empty_page_skips_reply_query(self):
+        """Test that no reply or like queries run for an empty page"""
+        session = CommentSession([], [])
+
+        response = await get_comments(
+            symbol=None, user_id=None, cursor=None, page=1, limit=20,
+            include_total=False, current_user=None, db=session, redis_client=None
+        )
+
+        assert len(session.statements) == 1
+        assert response.comments == []
+
+    @pytest.mark.asyncio
+    async def test_cached_first_page_only_queries_likes(self):
+        """Test that the cached first page keeps replies and refreshes like counts"""
+        comments = [make_comment(make_user(), minutes=-i) for i in range(3)]
+        replies = [make_comment(make_user(), parent=comments[0])]
+        session = CommentSession(comments, replies)
+
+        async def fetch(limit=20):
+            return await get_comments(
+                symbol="XAUUSD", user_id=None, cursor=None, page=1, limit=limit,
+                include_total=False, current_user=None, db=session, redis_client=None
+            )
+
+        await fetch()
+        session.statements = []
+
+        response = await fetch()
+        assert len(session.statements) == 1
+        assert "counter_shards" in session.statements[0]
+        assert [c.id for c in response.comments] == [c.id for c in comments]
+        assert response.comments[0].replies[0].id == replies[0].id
+
+        # Other page sizes and invalidated symbols are queried again
+        session.statements = []
+        await fetch(limit=10)
+        assert len(session.statements) == 3
+        await comment_feed.invalidate(None, ["XAUUSD"])
+        session.statements = []
+        await fetch()
+        assert len(session.statements) == 3
+
+    @pytest.mark.asyncio
+    async def test_signed_in_viewer_gets_user_liked(self):
+        """Test that comments and replies say whether the viewer liked them"""
+        comments = [make_comment(make_user(), minutes=-i) for i in range(2)]
+        replies = [make_comment(make_user(), parent=comments[0])]
+        session = CommentSession(comments, replies, liked=[replies[0].id])
+
+        response = await get_comments(
+            symbol="XAUUSD", user_id=None, cursor=None, page=1, limit=20,
+            include_total=False, current_user=make_user(), db=session, redis_client=None
+        )
+
+        assert "comment_likes.user_id = " in session.statements[-1]
+        assert [c.user_liked for c in response.comments] == [False, False]
+        assert response.comments[0].replies[0].user_liked is True
+
+        anonymous = await get_comments(
+            symbol="XAUUSD", user_id=None, cursor=None, page=1, limit=20,
+            include_total=False, current_user=None, db=session, redis_client=None
+        )
+        assert anonymous.comments[0].user_liked is None
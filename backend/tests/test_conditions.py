@@ -0,0 +1,95 @@
+"""Tests for compiled auto-verification conditions"""
+import math
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.prediction import AutoVerifyCondition
+from app.services.conditions import (
+    ConditionError,
+    compile_condition,
+    compile_conditions,
+    evaluate_batch,
+    matches,
+)
+
+
+def holds(condition: str, value: float) -> bool:
+    return matches(compile_condition(condition), value)
+
+
+class TestCompileCondition:
+    """Tests for compile_condition"""
+
+    @pytest.mark.parametrize("condition, value, expected", [
+        ("price_change_percent >= 1.0", 1.0, True),
+        ("price_change_percent >= 1.0", 0.99, False),
+        ("price_change_percent < -0.5", -0.5, False),
+        ("1 < price_change_percent", 1.5, True),
+        ("-1 <= price_change_percent < 1", -1.0, True),
+        ("-1 <= price_change_percent < 1", 1.0, False),
+        ("price_change_percent > 0 AND price_change_percent < 1.0", 0.5, True),
+        ("price_change_percent > 0 AND price_change_percent < 1.0", 0.0, False),
+        ("price_change_percent <= -2 or price_change_percent >= 2", -3, True),
+        ("not (price_change_percent > 0 and price_change_percent <= 1)", 1.0, False),
+        ("not (price_change_percent > 0 and price_change_percent <= 1)", 0.0, True),
+        ("price_change_percent != 0", 0.0, False),
+        ("price_change_percent == 0", 0.0, True),
+    ])
+    def test_matches_python_semantics(self, condition, value, expected):
+        """Test that compiled conditions agree with the comparison they describe"""
+        assert holds(condition, value) is expected
+
+    @pytest.mark.parametrize("condition", [
+        "__import__('os').system('true')",
+        "price_change_percent >= other",
+        "price_change_percent in (1, 2)",
+        "price_change_percent + 1 > 2",
+        "price_change_percent >=",
+        "",
+    ])
+    def test_rejects_invalid_conditions(self, condition):
+        """Test that anything but comparisons with numbers is rejected"""
+        with pytest.raises(ConditionError):
+            compile_condition(condition)
+
+    def test_schema_validates_condition(self):
+        """Test that invalid conditions fail request validation"""
+        with pytest.raises(ValidationError):
+            AutoVerifyCondition(condition="price_change_percent >= os.getpid()")
+
+    def test_stored_form_is_json(self):
+        """Test that the stored form keeps the source and plain-list intervals"""
+        stored = compile_conditions({"A": "price_change_percent >= 1.0"})
+        assert stored == {
+            "A": {"condition": "price_change_percent >= 1.0", "intervals": [[1.0, None, True, False]]}
+        }
+
+
+class TestEvaluateBatch:
+    """Tests for evaluate_batch"""
+
+    def test_first_matching_option_per_prediction(self):
+        """Test that each prediction gets its first matching option"""
+        conditions = compile_conditions({
+            "A": "price_change_percent >= 1.0",
+            "B": "price_change_percent > 0 AND price_change_percent < 1.0",
+            "C": "price_change_percent >= -0.5 AND price_change_percent <= 0",
+            "D": "price_change_percent < -0.5",
+        })
+        overlapping = compile_conditions({
+            "A": "price_change_percent > 0",
+            "B": "price_change_percent > -100",
+        })
+        legacy = {"A": {"condition": "price_change_percent > 0"}}
+
+        result = evaluate_batch(
+            [conditions, conditions, conditions, conditions, overlapping, legacy, None, conditions],
+            [1.13, 0.5, 0.0, -2.0, 5.0, -1.0, 1.0, math.nan],
+        )
+
+        assert result == ["A", "B", "C", "D", "A", None, None, None]
+
+    def test_empty_batch(self):
+        """Test that predictions without conditions match nothing"""
+        assert evaluate_batch([None, {}], [1.0, 2.0]) == [None, None]
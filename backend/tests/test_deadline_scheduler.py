@@ -0,0 +1,116 @@
+"""Tests for deadline-exact prediction verification"""
+import pytest
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from app.jobs.deadline_scheduler import DeadlineScheduler
+from app.jobs.prediction_verifier import PredictionVerifierJob
+
+
+class TestDeadlineScheduler:
+    """Tests for DeadlineScheduler"""
+
+    def test_pops_due_in_deadline_order(self):
+        """Test that only passed deadlines are popped, earliest first"""
+        now = datetime(2026, 10, 19, 12, 0)
+        scheduler = DeadlineScheduler()
+        scheduler.schedule("b", now - timedelta(seconds=5))
+        scheduler.schedule("c", now + timedelta(seconds=5))
+        scheduler.schedule("a", now - timedelta(seconds=10))
+
+        assert scheduler.pop_due(now) == ["a", "b"]
+        assert scheduler.next_deadline() == now + timedelta(seconds=5)
+        assert len(scheduler) == 1
+
+    def test_cancel_and_move(self):
+        """Test that cancelled and moved deadlines are skipped lazily"""
+        now = datetime(2026, 10, 19, 12, 0)
+        scheduler = DeadlineScheduler()
+        scheduler.schedule("a", now - timedelta(seconds=10))
+        scheduler.schedule("b", now - timedelta(seconds=5))
+        scheduler.cancel("a")
+        scheduler.schedule("b", now + timedelta(minutes=1))
+
+        assert scheduler.pop_due(now) == []
+        assert "a" not in scheduler
+        assert scheduler.next_deadline() == now + timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_earlier_deadline_wakes_waiter(self):
+        """Test that a waiter re-arms when an earlier deadline arrives"""
+        now = datetime.utcnow()
+        scheduler = DeadlineScheduler()
+        scheduler.schedule("late", now + timedelta(hours=1))
+
+        waiter = asyncio.create_task(scheduler.wait(now))
+        await asyncio.sleep(0)
+        scheduler.schedule("soon", now + timedelta(seconds=1))
+
+        await asyncio.wait_for(waiter, timeout=1)
+
+
+class TestDeadlineVerification:
+    """Tests for the verifier's deadline timer"""
+
+    @pytest.mark.asyncio
+    async def test_verifies_at_deadline(self):
+        """Test that a prediction is verified when its deadline passes"""
+        prediction_id = uuid.uuid4()
+        prediction = {
+            "id": prediction_id,
+            "symbol_code": "XAUUSD",
+            "price_at_create": 2650.00,
+            "verify_rule": "auto",
+            "auto_verify_conditions": {"A": {"condition": "price_change_percent >= 1.0"}},
+        }
+        prediction_repository = AsyncMock()
+        prediction_repository.find_by_criteria.side_effect = lambda criteria: (
+            [prediction] if "id__in" in criteria else []
+        )
+        market_data_service = AsyncMock()
+        market_data_service.get_latest_quote.return_value = {"price": 2680.00}
+
+        job = PredictionVerifierJob(
+            prediction_repository=prediction_repository,
+            market_data_service=market_data_service,
+        )
+        job.deadlines.schedule(prediction_id, datetime.utcnow() + timedelta(milliseconds=50))
+
+        job.start()
+        await asyncio.sleep(0.2)
+        await job.stop()
+
+        prediction_repository.find_by_criteria.assert_any_await(
+            {
+                "id__in": [prediction_id],
+                "status": "active",
+                "verify_rule": "auto",
+                "price_unresolved_at": None,
+            }
+        )
+        prediction_repository.update.assert_awaited_once()
+        assert len(job.deadlines) == 0
+
+    def test_deadline_events_feed_heap(self):
+        """Test that create and cancel events update the heap"""
+        job = PredictionVerifierJob()
+        prediction_id = uuid.uuid4()
+        verify_time = datetime.utcnow() + timedelta(minutes=10)
+
+        job._handle_deadline_event(json.dumps({
+            "prediction_id": str(prediction_id),
+            "verify_time": verify_time.isoformat(),
+        }))
+        assert job.deadlines.next_deadline() == verify_time
+
+        job._handle_deadline_event(json.dumps({
+            "prediction_id": str(prediction_id),
+            "verify_time": None,
+        }))
+        assert prediction_id not in job.deadlines
+
+        job._handle_deadline_event(b"not json")
+        assert len(job.deadlines) == 0
@@ -0,0 +1,216 @@
+"""Tests for the hot comments ranking"""
+import pytest
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.jobs.hot_comments import HotCommentsJob
+from app.services.hot_comments import (
+    HALF_LIFE_SECONDS,
+    TOP_K,
+    HotComments,
+    hot_score,
+    wilson_lower_bound,
+)
+
+
+class FakeRedis:
+    """In-memory sorted sets and dirty set covering the calls used by HotComments"""
+
+    def __init__(self):
+        self.zsets = {}
+        self.dirty = set()
+        self.symbols = set()
+
+    async def sadd(self, key, *members):
+        self.dirty.update(members)
+
+    async def smembers(self, key):
+        return {m.encode() for m in self.symbols}
+
+    async def spop(self, key, count):
+        popped = [self.dirty.pop() for _ in range(min(count, len(self.dirty)))]
+        return [m.encode() for m in popped]
+
+    async def zrevrange(self, key, start, end):
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda item: -item[1])
+        return [m.encode() for m, _ in ordered[start:end + 1]]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def delete(self, *keys):
+                for key in keys:
+                    redis.zsets.pop(key, None)
+                    if key == "comments:hot:symbols":
+                        redis.symbols.clear()
+
+            def sadd(self, key, *members):
+                redis.symbols.update(members)
+
+            def zadd(self, key, mapping):
+                redis.zsets.setdefault(key, {}).update(mapping)
+
+            def zrem(self, key, *members):
+                for member in members:
+                    redis.zsets.get(key, {}).pop(member, None)
+
+            def zremrangebyrank(self, key, start, end):
+                ordered = sorted(redis.zsets.get(key, {}).items(), key=lambda item: item[1])
+                for member, _ in ordered[start:len(ordered) + end + 1]:
+                    del redis.zsets[key][member]
+
+            async def execute(self):
+                pass
+
+        return Pipeline()
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class ScoringSession:
+    """Fake AsyncSession answering comment and like-counter queries"""
+
+    def __init__(self, comments, likes):
+        self.comments = comments
+        self.likes = likes
+        self.statements = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        if "counter_shards" in sql:
+            return FakeResult(list(self.likes.items()))
+        return FakeResult(self.comments)
+
+
+class TestHotScore:
+    """Tests for the Wilson score and time decay"""
+
+    def test_small_samples_are_damped(self):
+        """Test that a few likes rank below many at a similar rate"""
+        assert wilson_lower_bound(0, 0) == 0.0
+        assert wilson_lower_bound(2, 4) < wilson_lower_bound(50, 100)
+        assert wilson_lower_bound(5, 25) < wilson_lower_bound(6, 26)
+
+    def test_order_is_fixed_as_time_passes(self):
+        """Test that scores equal wilson decayed by age, up to a shared factor"""
+        created = datetime(2024, 3, 1, 12)
+        fresh = hot_score(3, 0, created)
+        day_old = hot_score(3, 0, created - timedelta(seconds=HALF_LIFE_SECONDS))
+
+        # Same engagement a half-life older weighs half
+        assert fresh - day_old == pytest.approx(0.6931, abs=1e-4)
+        # An older comment needs much more engagement to stay ahead
+        assert hot_score(40, 5, created - timedelta(seconds=HALF_LIFE_SECONDS)) > fresh
+        assert hot_score(0, 0, created) is None
+
+
+class TestHotComments:
+    """Tests for the Redis rankings"""
+
+    @pytest.mark.asyncio
+    async def test_update_ranks_per_symbol_and_overall(self):
+        """Test that updates land in both rankings and removals leave them"""
+        ranking = HotComments()
+        redis_client = FakeRedis()
+        gold, silver, gone = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        await ranking.update(redis_client, [
+            (gold, "XAUUSD", 2.0), (silver, "XAGUSD", 3.0), (gone, "XAUUSD", 4.0),
+        ])
+        await ranking.update(redis_client, [(gone, "XAUUSD", None)])
+
+        assert await ranking.top(redis_client, "XAUUSD", 10) == [gold]
+        assert await ranking.top(redis_client, None, 10) == [silver, gold]
+
+    @pytest.mark.asyncio
+    async def test_rankings_are_trimmed_to_top_k(self):
+        """Test that only the TOP_K hottest comments are kept"""
+        ranking = HotComments()
+        redis_client = FakeRedis()
+        ids = [uuid.uuid4() for _ in range(TOP_K + 5)]
+
+        await ranking.update(redis_client, [(i, "XAUUSD", float(n)) for n, i in enumerate(ids)])
+
+        top = await ranking.top(redis_client, "XAUUSD", TOP_K + 5)
+        assert len(top) == TOP_K
+        assert top[0] == ids[-1] and ids[0] not in top
+
+    @pytest.mark.asyncio
+    async def test_rebuild_drops_rankings_of_quiet_symbols(self):
+        """Test that a rebuild removes rankings of symbols without candidates"""
+        ranking = HotComments()
+        redis_client = FakeRedis()
+        gold, silver = uuid.uuid4(), uuid.uuid4()
+        await ranking.update(redis_client, [(gold, "XAUUSD", 2.0), (silver, "XAGUSD", 3.0)])
+
+        await ranking.update(redis_client, [(gold, "XAUUSD", 2.5)], rebuild=True)
+
+        assert await ranking.top(redis_client, "XAGUSD", 10) == []
+        assert await ranking.top(redis_client, None, 10) == [gold]
+        assert redis_client.symbols == {"XAUUSD"}
+
+        await ranking.update(redis_client, [], rebuild=True)
+        assert redis_client.zsets == {} and redis_client.symbols == set()
+
+
+class TestHotCommentsJob:
+    """Tests for HotCommentsJob"""
+
+    @pytest.mark.asyncio
+    async def test_rescores_dirty_comments_with_counter_likes(self):
+        """Test that queued comments are scored from the sharded like totals"""
+        redis_client = FakeRedis()
+        liked, quiet = uuid.uuid4(), uuid.uuid4()
+        created = datetime.utcnow()
+        session = ScoringSession(
+            comments=[
+                SimpleNamespace(id=liked, symbol_code="XAUUSD", replies_count=0, created_at=created),
+                SimpleNamespace(id=quiet, symbol_code="XAUUSD", replies_count=0, created_at=created),
+            ],
+            likes={liked: 3},
+        )
+        await HotComments().mark_dirty(redis_client, [liked, quiet])
+
+        job = HotCommentsJob(session_factory=lambda: session, redis_client=redis_client)
+        job._last_rebuild = datetime.utcnow()
+        await job.execute()
+
+        assert job.status_details() == {"rescored": 2}
+        assert redis_client.dirty == set()
+        assert await HotComments().top(redis_client, "XAUUSD", 10) == [liked]
+        assert redis_client.zsets["comments:hot:XAUUSD"][str(liked)] == hot_score(3, 0, created)
+        assert "comments.parent_id IS NULL" in session.statements[0]
+        assert "comments.is_deleted IS false" in session.statements[0]
+
+    def test_rebuild_considers_recent_engaged_comments(self):
+        """Test that the rebuild query skips replies, deleted and quiet comments"""
+        job = HotCommentsJob()
+
+        sql = str(job._candidates_stmt(datetime(2024, 3, 8)).compile(dialect=postgresql.dialect()))
+
+        assert "comments.created_at >= " in sql
+        assert "comments.likes_count > " in sql and "comments.replies_count > " in sql
+        assert "comments.parent_id IS NULL" in sql
@@ -0,0 +1,135 @@
+"""Tests for the hot predictions ranking"""
+import math
+import pytest
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects import postgresql
+
+from app.jobs.hot_predictions import HotPredictionsJob
+from app.services.hot_predictions import (
+    DECAY_RATE,
+    HALF_LIFE_SECONDS,
+    HotPredictions,
+    heat,
+    proximity,
+)
+
+
+class FakeRedis:
+    """In-memory sorted set and strings covering the calls used by HotPredictions"""
+
+    def __init__(self):
+        self.zsets = {}
+        self.strings = {}
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def zadd(self, key, mapping, xx=False, incr=False):
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if xx and member not in zset:
+                continue
+            zset[member] = zset.get(member, 0) + score if incr else score
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.zsets.pop(key, None)
+
+    async def zrevrange(self, key, start, end, withscores=False):
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda item: -item[1])
+        return [(m.encode(), s) for m, s in ordered[start:end + 1]]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def rename(self, key, new_key):
+                redis.zsets[new_key] = redis.zsets.pop(key)
+
+            def delete(self, *keys):
+                for key in keys:
+                    redis.zsets.pop(key, None)
+
+            def set(self, key, value):
+                redis.strings[key] = str(value).encode()
+
+            async def execute(self):
+                pass
+
+        return Pipeline()
+
+
+class TestHeat:
+    """Tests for the heat formula"""
+
+    def test_deadline_proximity_boost(self):
+        """Test that heat grows as the deadline approaches"""
+        now = datetime(2024, 3, 1, 12)
+
+        assert proximity(now + timedelta(days=7), now) == pytest.approx(1.0, abs=1e-6)
+        assert proximity(now, now) == 2.0
+        assert heat(4, 0, now + timedelta(hours=1), now) > heat(4, 0, now + timedelta(days=1), now)
+
+    def test_comments_count_less_than_votes(self):
+        """Test that symbol comments weigh less than votes"""
+        now = datetime(2024, 3, 1, 12)
+        far = now + timedelta(days=30)
+
+        assert heat(0, 2, far, now) < heat(2, 0, far, now)
+
+
+class TestHotPredictions:
+    """Tests for HotPredictions"""
+
+    @pytest.mark.asyncio
+    async def test_incremental_votes_match_recomputed_order(self):
+        """Test that a fresh vote outranks older, larger activity as decay says"""
+        redis_client = FakeRedis()
+        ranking = HotPredictions()
+        rebuilt_at = datetime(2024, 3, 1, 12)
+        deadline = rebuilt_at + timedelta(days=30)
+        old, fresh = uuid.uuid4(), uuid.uuid4()
+
+        await ranking.rebuild(redis_client, {old: 1.5, fresh: 0.0}, rebuilt_at)
+
+        # Two half-lives later the old activity is worth 0.375 votes
+        later = rebuilt_at + timedelta(seconds=2 * HALF_LIFE_SECONDS)
+        await ranking.record_vote(redis_client, fresh, deadline, later)
+
+        top = await ranking.top(redis_client, 10)
+        assert [prediction_id for prediction_id, _ in top] == [fresh, old]
+        assert top[0][1] == pytest.approx(math.exp(DECAY_RATE * 2 * HALF_LIFE_SECONDS), rel=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_votes_on_unranked_predictions_wait_for_rebuild(self):
+        """Test that only ranked, active predictions are incremented"""
+        redis_client = FakeRedis()
+        ranking = HotPredictions()
+        now = datetime(2024, 3, 1, 12)
+
+        await ranking.record_vote(redis_client, uuid.uuid4(), now + timedelta(hours=1), now)
+        await ranking.rebuild(redis_client, {}, now)
+        await ranking.record_vote(redis_client, uuid.uuid4(), now + timedelta(hours=1), now)
+
+        assert await ranking.top(redis_client, 10) == []
+
+
+class TestHotPredictionsJob:
+    """Tests for HotPredictionsJob"""
+
+    def test_only_active_predictions_with_recent_activity(self):
+        """Test the ranking query"""
+        now = datetime.utcnow()
+        sql = str(HotPredictionsJob()._predictions_stmt(now).compile(dialect=postgresql.dialect()))
+
+        assert "predictions.status = %(status_1)s AND predictions.verify_time >" in sql
+        assert "exp(" in sql and "EXTRACT(epoch FROM" in sql
+        assert "votes.voted_at >=" in sql
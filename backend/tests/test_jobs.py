@@ -2,13 +2,22 @@
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timedelta
 from decimal import Decimal
 
-from app.jobs.base import BaseJob
+from app.jobs.base import BaseJob, MissedTickPolicy
+from app.jobs.comment_like_flush import CommentLikeFlushJob
+from app.jobs.hot_comments import HotCommentsJob
+from app.jobs.counter_rollup import CounterRollupJob
+from app.jobs.hot_predictions import HotPredictionsJob
+from app.jobs.leaderboard_rebuild import LeaderboardRebuildJob
 from app.jobs.price_fetcher import PriceFetcherJob
 from app.jobs.news_fetcher import NewsFetcherJob
-from app.jobs.prediction_verifier import PredictionVerifierJob
+from app.jobs.prediction_verifier import MAX_CANDLES, PredictionVerifierJob
+from app.jobs.stats_recompute import StatsRecomputeJob
 from app.jobs.manager import JobManager
+from app.repositories.settlement_repository import SettlementResult
+from app.services.tick_store import TickStore
 
 
 class TestBaseJob:
@@ -51,6 +60,78 @@ class TestBaseJob:
 
         assert job.execute_count >= 2  # At least 2 executions
 
+    @pytest.mark.asyncio
+    async def test_fixed_rate_does_not_drift(self):
+        """Test that execution time does not stretch the period"""
+
+        class SlowJob(BaseJob):
+            def __init__(self):
+                super().__init__(interval_seconds=0.1)
+                self.execute_count = 0
+
+            async def execute(self):
+                self.execute_count += 1
+                await asyncio.sleep(0.05)
+
+        job = SlowJob()
+        job.start()
+        await asyncio.sleep(0.52)
+        await job.stop()
+
+        # Sleeping after each run would only fit ~4 runs (0.15s period)
+        assert job.execute_count >= 5
+
+    def test_skip_policy_realigns_schedule(self):
+        """Test that missed ticks are skipped and counted"""
+        job = self.DummyJob(interval_seconds=1)
+
+        next_run = job._next_run_time(scheduled=10.0, now=13.5)
+
+        assert next_run == 14.0
+        assert job.stats.skipped_ticks == 3
+
+    def test_catch_up_policy_runs_immediately(self):
+        """Test that catch-up keeps the original schedule"""
+        job = self.DummyJob(interval_seconds=1)
+        job.missed_tick_policy = MissedTickPolicy.CATCH_UP
+
+        next_run = job._next_run_time(scheduled=10.0, now=13.5)
+
+        assert next_run == 11.0
+        assert job.stats.skipped_ticks == 0
+
+    @pytest.mark.asyncio
+    async def test_max_runtime_timeout_records_failure(self):
+        """Test that a run exceeding max runtime is cancelled and recorded"""
+
+        class HangingJob(BaseJob):
+            async def execute(self):
+                await asyncio.sleep(10)
+
+        job = HangingJob(interval_seconds=1, max_runtime_seconds=0.05)
+
+        await job._run_once(lag=0.0)
+
+        assert job.stats.runs == 1
+        assert job.stats.timeouts == 1
+        assert job.stats.failures == 1
+        assert job.stats.last_duration < 1
+
+    @pytest.mark.asyncio
+    async def test_run_stats(self):
+        """Test that duration aggregates are recorded"""
+        job = self.DummyJob(interval_seconds=1)
+
+        for _ in range(3):
+            await job._run_once(lag=0.01)
+
+        stats = job.stats.to_dict()
+        assert stats["runs"] == 3
+        assert stats["failures"] == 0
+        assert stats["avg_duration_ms"] is not None
+        assert stats["p95_duration_ms"] is not None
+        assert stats["last_lag_ms"] == 10.0
+
 
 class TestPriceFetcherJob:
     """Tests for PriceFetcherJob"""
@@ -104,6 +185,52 @@ class TestPriceFetcherJob:
         # Verify TTL was set
         assert redis_client.expire.called
 
+    @pytest.mark.asyncio
+    async def test_closed_markets_polled_slowly(self):
+        """Test that symbols of closed markets are not polled every run"""
+        market_data_service = AsyncMock()
+        market_data_service.get_latest_quote.return_value = {"price": 1.08}
+
+        calendar = MagicMock()
+        calendar.is_open.side_effect = lambda market, at=None: market == "CRYPTO"
+
+        job = PriceFetcherJob(
+            market_data_service=market_data_service,
+            calendar=calendar,
+            closed_poll_seconds=300,
+        )
+
+        await job.execute()
+        assert market_data_service.get_latest_quote.call_count == len(job.symbols)
+
+        market_data_service.get_latest_quote.reset_mock()
+        await job.execute()
+
+        # Only the 24/7 symbol is polled again within the closed interval
+        fetched = [c.args[0] for c in market_data_service.get_latest_quote.call_args_list]
+        assert fetched == ["BTCUSD"]
+
+    @pytest.mark.asyncio
+    async def test_feeds_tick_store(self):
+        """Test that fresh quotes feed the tick store and stale ones do not"""
+        market_data_service = AsyncMock()
+        market_data_service.get_latest_quote.side_effect = lambda symbol: (
+            {"price": 2658.50, "is_stale": True} if symbol == "XAGUSD" else {"price": 2658.50}
+        )
+        tick_store = TickStore()
+
+        job = PriceFetcherJob(
+            market_data_service=market_data_service,
+            tick_store=tick_store,
+        )
+
+        await job.execute()
+
+        tick = await tick_store.get("XAUUSD")
+        assert tick.price == Decimal("2658.5")
+        assert tick.market == "LBMA"
+        assert await tick_store.get("XAGUSD") is None
+
 
 class TestNewsFetcherJob:
     """Tests for NewsFetcherJob"""
@@ -208,6 +335,201 @@ class TestPredictionVerifierJob:
         # Verify prediction was updated
         assert prediction_repository.update.called
 
+    @pytest.mark.asyncio
+    async def test_stale_quote_leaves_prediction_unsettled(self):
+        """Test that a quote replayed by the circuit breaker is never settled at"""
+        prediction_repository = AsyncMock()
+        prediction_repository.find_by_criteria.return_value = [
+            {
+                "id": "pred-123",
+                "symbol_code": "XAUUSD",
+                "price_at_create": 2650.00,
+                "verify_time": datetime.utcnow() - timedelta(seconds=5),
+                "verify_rule": "auto",
+                "auto_verify_conditions": {
+                    "A": {"condition": "price_change_percent >= 1.0"},
+                    "B": {"condition": "price_change_percent < 1.0"},
+                },
+            }
+        ]
+        quote_repository = AsyncMock()
+        quote_repository.prices_at.side_effect = lambda symbol, times, gap: [None for _ in times]
+        market_data_service = AsyncMock()
+        market_data_service.get_time_series.return_value = []
+        market_data_service.get_latest_quote.return_value = {"price": 2680.00, "is_stale": True}
+        settlement_repository = AsyncMock()
+
+        job = PredictionVerifierJob(
+            prediction_repository=prediction_repository,
+            market_data_service=market_data_service,
+            settlement_repository=settlement_repository,
+            quote_repository=quote_repository,
+        )
+
+        await job.execute()
+
+        assert market_data_service.get_latest_quote.called
+        assert not settlement_repository.settle.called
+        assert not prediction_repository.update.called
+
+    @pytest.mark.asyncio
+    async def test_settles_in_bulk_with_settlement_repository(self):
+        """Test that settlement replaces the per-vote repository calls"""
+        prediction_repository = AsyncMock()
+        prediction_repository.find_by_criteria.return_value = [
+            {
+                "id": "pred-123",
+                "symbol_code": "XAUUSD",
+                "price_at_create": 2650.00,
+                "verify_rule": "auto",
+                "auto_verify_conditions": {
+                    "A": {"condition": "price_change_percent >= 1.0"},
+                    "B": {"condition": "price_change_percent < 1.0"},
+                },
+            }
+        ]
+        vote_repository = AsyncMock()
+        settlement_repository = AsyncMock()
+        settlement_repository.settle.return_value = SettlementResult(
+            prediction_id="pred-123", votes_settled=50000, elapsed_seconds=0.5
+        )
+        market_data_service = AsyncMock()
+        market_data_service.get_latest_quote.return_value = {"price": 2680.00}
+
+        redis_client = AsyncMock()
+
+        job = PredictionVerifierJob(
+            prediction_repository=prediction_repository,
+            vote_repository=vote_repository,
+            market_data_service=market_data_service,
+            settlement_repository=settlement_repository,
+            redis_client=redis_client,
+        )
+
+        await job.execute()
+
+        settlement_repository.settle.assert_awaited_once_with(
+            "pred-123", Decimal("2680.0"), "A", return_votes=False
+        )
+        redis_client.delete.assert_any_await("prediction:doc:pred-123")
+        assert sorted(redis_client.delete.await_args.args) == [
+            "feed:predictions:*", "feed:predictions:XAUUSD"
+        ]
+        assert not vote_repository.update_correctness.called
+        assert not vote_repository.find_by_prediction.called
+        assert job.status_details()["votes_per_second"] == 100000.0
+
+    @pytest.mark.asyncio
+    async def test_backlog_uses_price_at_verify_time(self):
+        """Test that overdue predictions settle at their deadline price, per symbol"""
+        overdue = datetime.utcnow() - timedelta(hours=2)
+        conditions = {
+            "A": {"condition": "price_change_percent >= 1.0"},
+            "B": {"condition": "price_change_percent < 1.0"},
+        }
+        prediction_repository = AsyncMock()
+        prediction_repository.find_by_criteria.side_effect = [
+            [
+                {
+                    "id": f"pred-{i}",
+                    "symbol_code": "XAUUSD" if i < 2 else "XAGUSD",
+                    "price_at_create": 2650.00,
+                    "verify_time": overdue + timedelta(minutes=i),
+                    "verify_rule": "auto",
+                    "auto_verify_conditions": conditions,
+                }
+                for i in range(3)
+            ],
+            [],
+        ]
+        quote_repository = AsyncMock()
+        quote_repository.prices_at.side_effect = lambda symbol, times, gap: [
+            Decimal("2680.00") if symbol == "XAUUSD" else None for _ in times
+        ]
+        settlement_repository = AsyncMock()
+        settlement_repository.settle.return_value = SettlementResult(
+            prediction_id="pred", votes_settled=1, elapsed_seconds=0.1
+        )
+        market_data_service = AsyncMock()
+        market_data_service.get_time_series.return_value = [
+            {"timestamp": overdue + timedelta(minutes=2), "close": 2600.00},
+            {"timestamp": overdue + timedelta(minutes=1), "close": 2640.00},
+        ]
+
+        job = PredictionVerifierJob(
+            prediction_repository=prediction_repository,
+            vote_repository=AsyncMock(),
+            market_data_service=market_data_service,
+            settlement_repository=settlement_repository,
+            quote_repository=quote_repository,
+        )
+
+        await job.execute()
+
+        # One history lookup per symbol; the candle closing before the deadline wins
+        assert quote_repository.prices_at.await_count == 2
+        assert not market_data_service.get_latest_quote.called
+        settled = {c.args[0]: (c.args[1], c.args[2]) for c in settlement_repository.settle.call_args_list}
+        assert settled == {
+            "pred-0": (Decimal("2680.00"), "A"),
+            "pred-1": (Decimal("2680.00"), "A"),
+            "pred-2": (Decimal("2640.0"), "B"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_unpriced_deadlines_are_not_retried_per_prediction(self):
+        """Test that missing prices skip the prediction and old ones are flagged for review"""
+        now = datetime.utcnow()
+        prediction_repository = AsyncMock()
+        prediction_repository.find_by_criteria.side_effect = [
+            [
+                {
+                    "id": "pred-old",
+                    "symbol_code": "XAUUSD",
+                    "price_at_create": 2650.00,
+                    "verify_time": now - timedelta(minutes=MAX_CANDLES + 60),
+                    "verify_rule": "auto",
+                    "auto_verify_conditions": {"A": {"condition": "price_change_percent >= 1.0"}},
+                },
+                {
+                    "id": "pred-gap",
+                    "symbol_code": "XAUUSD",
+                    "price_at_create": 2650.00,
+                    "verify_time": now - timedelta(hours=1),
+                    "verify_rule": "auto",
+                    "auto_verify_conditions": {"A": {"condition": "price_change_percent >= 1.0"}},
+                },
+            ],
+            [],
+        ]
+        quote_repository = AsyncMock()
+        quote_repository.prices_at.side_effect = lambda symbol, times, gap: [None for _ in times]
+        market_data_service = AsyncMock()
+        market_data_service.get_time_series.return_value = []
+        settlement_repository = AsyncMock()
+
+        job = PredictionVerifierJob(
+            prediction_repository=prediction_repository,
+            market_data_service=market_data_service,
+            settlement_repository=settlement_repository,
+            quote_repository=quote_repository,
+        )
+
+        await job.execute()
+
+        # One lookup for the group, candles requested for the coverable deadline only
+        assert quote_repository.prices_at.await_count == 1
+        assert market_data_service.get_time_series.await_count == 1
+        assert market_data_service.get_time_series.await_args.kwargs["outputsize"] <= 62
+        assert not settlement_repository.settle.called
+        # Flagged for review; the author's rule is kept
+        prediction_repository.update.assert_awaited_once()
+        prediction_id, values = prediction_repository.update.await_args.args
+        assert prediction_id == "pred-old"
+        assert list(values) == ["price_unresolved_at"]
+        criteria = prediction_repository.find_by_criteria.await_args_list[0].args[0]
+        assert criteria["verify_rule"] == "auto" and criteria["price_unresolved_at"] is None
+
     def test_calculate_price_change(self):
         """Test price change calculation"""
         job = PredictionVerifierJob()
@@ -249,10 +571,16 @@ class TestJobManager:
         """Test that manager initializes all jobs"""
         manager = JobManager()
 
-        assert len(manager.jobs) == 3
+        assert len(manager.jobs) == 9
         assert isinstance(manager.jobs[0], PriceFetcherJob)
         assert isinstance(manager.jobs[1], NewsFetcherJob)
         assert isinstance(manager.jobs[2], PredictionVerifierJob)
+        assert isinstance(manager.jobs[3], CounterRollupJob)
+        assert isinstance(manager.jobs[4], LeaderboardRebuildJob)
+        assert isinstance(manager.jobs[5], StatsRecomputeJob)
+        assert isinstance(manager.jobs[6], HotPredictionsJob)
+        assert isinstance(manager.jobs[7], CommentLikeFlushJob)
+        assert isinstance(manager.jobs[8], HotCommentsJob)
 
     def test_start_all_starts_jobs(self):
         """Test that start_all starts all jobs"""
@@ -281,5 +609,6 @@ class TestJobManager:
 
         status = manager.get_job_status()
 
-        assert len(status) == 3
+        assert len(status) == 9
         assert all(job["running"] is True for job in status)
+        assert all("stats" in job for job in status)
@@ -0,0 +1,331 @@
+"""Tests for the Redis leaderboards"""
+import pytest
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from app.jobs.leaderboard_rebuild import LeaderboardRebuildJob
+from app.services.leaderboard import Leaderboard, accuracy_score, board_scores
+
+
+class FakeRedis:
+    """In-memory sorted sets covering the calls used by Leaderboard"""
+
+    def __init__(self):
+        self.zsets = {}
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def rename(self, key, new_key):
+        self.zsets[new_key] = self.zsets.pop(key)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.zsets.pop(key, None)
+
+    async def exists(self, *keys):
+        return sum(bool(self.zsets.get(key)) for key in keys)
+
+    def _ordered(self, key):
+        return sorted(self.zsets.get(key, {}).items(), key=lambda item: -item[1])
+
+    async def zrevrange(self, key, start, end, withscores=False):
+        return [(m.encode(), s) for m, s in self._ordered(key)[start:end + 1]]
+
+    async def zrevrank(self, key, member):
+        members = [m for m, _ in self._ordered(key)]
+        return members.index(member) if member in members else None
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __getattr__(self, name):
+                return getattr(redis, name)
+
+            def delete(self, *keys):
+                for key in keys:
+                    redis.zsets.pop(key, None)
+
+            async def execute(self):
+                pass
+
+        return Pipeline()
+
+
+def stats(participations, accuracy, score=0, streak=0):
+    return {
+        "user_id": uuid.uuid4(),
+        "total_participations": participations,
+        "accuracy_rate": Decimal(str(accuracy)),
+        "prediction_score": score,
+        "current_streak": streak,
+    }
+
+
+class TestLeaderboard:
+    """Tests for Leaderboard"""
+
+    def test_accuracy_ties_broken_by_participations(self):
+        """Test that equal accuracy ranks the more active user first"""
+        assert accuracy_score(Decimal("75.00"), 200) > accuracy_score(Decimal("75.00"), 12)
+        assert accuracy_score(Decimal("75.01"), 10) > accuracy_score(Decimal("75.00"), 9999)
+
+    def test_accuracy_board_requires_min_participations(self):
+        """Test the PRD rule of 10 participations for the accuracy board"""
+        assert board_scores(stats(9, 100))["accuracy"] is None
+        assert board_scores(stats(10, 100))["accuracy"] is not None
+        assert board_scores(stats(9, 100, score=40))["score"] == 40
+
+    @pytest.mark.asyncio
+    async def test_top_and_rank(self):
+        """Test that updates move users on the boards"""
+        redis_client = FakeRedis()
+        board = Leaderboard()
+        veteran, expert, newcomer = stats(120, 70), stats(40, 80), stats(3, 100)
+
+        await board.update_users(redis_client, [veteran, expert, newcomer])
+
+        top = await board.top(redis_client, "accuracy", 10)
+        assert [user_id for user_id, _ in top] == [expert["user_id"], veteran["user_id"]]
+        assert await board.rank(redis_client, "accuracy", newcomer["user_id"]) is None
+
+        # A settlement drops the expert below the veteran
+        await board.update_users(redis_client, [{**expert, "total_participations": 41, "accuracy_rate": Decimal("65")}])
+        assert await board.rank(redis_client, "accuracy", expert["user_id"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_rebuild_swaps_in_fresh_boards(self):
+        """Test that a rebuild replaces stale members"""
+        redis_client = FakeRedis()
+        board = Leaderboard()
+        stale, current = stats(50, 90), stats(50, 60, score=300)
+        await board.update_users(redis_client, [stale])
+
+        async def chunks():
+            yield [current]
+
+        assert await board.rebuild(redis_client, chunks()) == 1
+
+        top = await board.top(redis_client, "accuracy", 10)
+        assert [user_id for user_id, _ in top] == [current["user_id"]]
+        assert await board.rank(redis_client, "score", current["user_id"]) == 1
+
+
+class StreamSession:
+    """Fake AsyncSession streaming one batch of stats rows per statement"""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.statements = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def stream(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        rows = self.batches.pop(0)
+
+        class Result:
+            def mappings(self):
+                return self
+
+            async def partitions(self, size):
+                if rows:
+                    yield rows
+
+        return Result()
+
+
+class TestLeaderboardRebuildJob:
+    """Tests for LeaderboardRebuildJob"""
+
+    @pytest.mark.asyncio
+    async def test_settlements_during_the_stream_survive_the_swap(self):
+        """Test that rows updated since the rebuild started are re-applied"""
+        redis_client = WindowRedis()
+        snapshot = stats(50, 60, score=100)
+        settled_meanwhile = {**snapshot, "total_participations": 51, "prediction_score": 115}
+        today = datetime.utcnow().date()
+        day_totals = {"user_id": snapshot["user_id"], "day": today, "participations": 1, "correct": 1, "points": 10}
+        session = StreamSession(
+            [snapshot], [day_totals], [settled_meanwhile], [{**day_totals, "participations": 2, "points": 25}]
+        )
+
+        job = LeaderboardRebuildJob(session_factory=lambda: session, redis_client=redis_client)
+        await job.execute()
+
+        member = str(snapshot["user_id"])
+        assert redis_client.zsets["leaderboard:score"] == {member: 115}
+        assert redis_client.zsets[f"leaderboard:day:{today:%Y%m%d}:points"] == {member: 25}
+        assert "updated_at" not in session.statements[0]
+        assert "predictions.updated_at" not in session.statements[1]
+        assert "user_prediction_stats.updated_at >= " in session.statements[2]
+        assert "predictions.updated_at >= " in session.statements[3]
+        assert job.status_details() == {"users": 1, "user_days": 1}
+
+    def test_day_totals_carry_streaks_from_before_the_window(self):
+        """Test that streaks run over the whole history and only totals are windowed"""
+        sql = str(
+            LeaderboardRebuildJob()._day_totals_stmt(datetime(2024, 3, 1))
+            .compile(dialect=postgresql.dialect())
+        )
+
+        assert "count(*) FILTER (WHERE votes.is_correct IS false) OVER (PARTITION BY votes.user_id" in sql
+        assert "OVER (PARTITION BY anon_2.user_id, anon_2.breaks ORDER BY anon_2.verify_time" in sql
+        assert "WHERE anon_1.verify_time >= " in sql
+        assert "GROUP BY anon_1.user_id, CAST(anon_1.verify_time AS DATE)" in sql
+
+
+class WindowRedis(FakeRedis):
+    """FakeRedis with the calls used by the windowed boards"""
+
+    def __init__(self):
+        super().__init__()
+        self.expiries = {}
+
+    def zincrby(self, key, amount, member):
+        zset = self.zsets.setdefault(key, {})
+        zset[member] = zset.get(member, 0) + amount
+
+    def expireat(self, key, when):
+        self.expiries[key] = when
+
+    def expire(self, key, seconds):
+        self.expiries[key] = seconds
+
+    def rename(self, key, new_key):
+        super().rename(key, new_key)
+        self.expiries.pop(new_key, None)
+
+    def zunionstore(self, dest, keys):
+        union = {}
+        for key in keys:
+            for member, score in self.zsets.get(key, {}).items():
+                union[member] = union.get(member, 0) + score
+        self.zsets[dest] = union
+
+    async def zrangebyscore(self, key, low, high, withscores=False):
+        return [(m.encode(), s) for m, s in self.zsets.get(key, {}).items() if s >= low]
+
+    async def zmscore(self, key, members):
+        zset = self.zsets.get(key, {})
+        return [zset.get(m.decode() if isinstance(m, bytes) else m) for m in members]
+
+    async def zrevrangebyscore(self, key, high, low, start=0, num=None, withscores=False):
+        members = [(m if isinstance(m, bytes) else m.encode(), s) for m, s in self._ordered(key) if s >= low]
+        return members[start:start + num]
+
+
+def settled(user_id, correct, streak=0):
+    return {"user_id": user_id, "correct": correct, "current_streak": streak}
+
+
+class TestWindowedLeaderboard:
+    """Tests for the daily/weekly/monthly boards"""
+
+    @pytest.mark.asyncio
+    async def test_settlements_fill_expiring_day_buckets(self):
+        """Test that a settlement lands in its day's buckets, which expire"""
+        redis_client = WindowRedis()
+        user_id = uuid.uuid4()
+
+        await Leaderboard().record_settlement(
+            redis_client, [settled(user_id, 1, streak=1)], date(2024, 3, 1)
+        )
+
+        assert redis_client.zsets["leaderboard:day:20240301:participations"] == {str(user_id): 1}
+        assert redis_client.zsets["leaderboard:day:20240301:points"] == {str(user_id): 10}
+        assert redis_client.expiries["leaderboard:day:20240301:points"] == datetime(2024, 4, 1)
+
+    @pytest.mark.asyncio
+    async def test_window_only_counts_its_days(self):
+        """Test that the weekly board ignores settlements older than a week"""
+        redis_client = WindowRedis()
+        board = Leaderboard()
+        today = date(2024, 3, 31)
+        recent, old = uuid.uuid4(), uuid.uuid4()
+
+        await board.record_settlement(redis_client, [settled(recent, 1, 1)], today - timedelta(days=6))
+        await board.record_settlement(redis_client, [settled(old, 1, 1)], today - timedelta(days=7))
+
+        weekly = await board.window_top(redis_client, "score", "weekly", 10, today)
+        monthly = await board.window_top(redis_client, "score", "monthly", 10, today)
+        assert [user_id for user_id, _ in weekly] == [recent]
+        assert {user_id for user_id, _ in monthly} == {recent, old}
+        assert redis_client.expiries["leaderboard:window:weekly:20240331:points"] == 60
+
+    @pytest.mark.asyncio
+    async def test_window_accuracy_requires_min_participations(self):
+        """Test that window accuracy ranks qualified users by in-window results"""
+        redis_client = WindowRedis()
+        board = Leaderboard()
+        today = date(2024, 3, 31)
+        sharp, busy, casual = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        for i in range(10):
+            await board.record_settlement(
+                redis_client, [settled(sharp, int(i < 9)), settled(busy, int(i < 6))], today
+            )
+        await board.record_settlement(redis_client, [settled(casual, 1)], today)
+
+        top = await board.window_top(redis_client, "accuracy", "daily", 10, today)
+        assert [user_id for user_id, _ in top] == [sharp, busy]
+        assert await board.window_rank(redis_client, "accuracy", "daily", casual, today) is None
+        assert await board.window_stats(redis_client, "daily", [busy], today) == {busy: (10, 6)}
+
+    @pytest.mark.asyncio
+    async def test_rebuild_days_replaces_buckets(self):
+        """Test that rebuilt buckets replace counted ones and empty days are dropped"""
+        redis_client = WindowRedis()
+        board = Leaderboard()
+        today = date(2024, 3, 31)
+        user_id = uuid.uuid4()
+        # Counted twice, e.g. by a retried settlement
+        for _ in range(2):
+            await board.record_settlement(redis_client, [settled(user_id, 1, 1)], today)
+        await board.record_settlement(redis_client, [settled(user_id, 0)], today - timedelta(days=3))
+
+        async def chunks():
+            yield [{"user_id": user_id, "day": today, "participations": 1, "correct": 1, "points": 10}]
+
+        assert await board.rebuild_days(redis_client, chunks(), today) == 1
+
+        assert redis_client.zsets["leaderboard:day:20240331:points"] == {str(user_id): 10}
+        assert redis_client.expiries["leaderboard:day:20240331:points"] == datetime(2024, 5, 1)
+        assert "leaderboard:day:20240328:participations" not in redis_client.zsets
+        assert not [key for key in redis_client.zsets if key.endswith(":building")]
+
+    @pytest.mark.asyncio
+    async def test_window_is_rebuilt_unless_every_key_is_cached(self):
+        """Test that a window missing any key is rebuilt with one expiry for all"""
+        redis_client = WindowRedis()
+        board = Leaderboard()
+        today = date(2024, 3, 31)
+        user_id = uuid.uuid4()
+
+        assert await board.window_top(redis_client, "score", "daily", 10, today) == []
+        await board.record_settlement(redis_client, [settled(user_id, 1, 1)], today)
+        # Still cached: the empty window's keys all exist
+        assert await board.window_top(redis_client, "score", "daily", 10, today) == []
+
+        del redis_client.zsets["leaderboard:window:daily:20240331:correct"]
+        assert [u for u, _ in await board.window_top(redis_client, "score", "daily", 10, today)] == [user_id]
+        assert {
+            ttl for key, ttl in redis_client.expiries.items() if key.startswith("leaderboard:window:")
+        } == {60}
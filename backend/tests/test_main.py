@@ -19,3 +19,19 @@ def test_health_check(client):
     data = response.json()
     assert data["status"] == "healthy"
 
+
+def test_jobs_not_started_when_disabled(monkeypatch):
+    """API workers skip background jobs when a dedicated worker runs them"""
+    from fastapi.testclient import TestClient
+    from app import main
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "RUN_BACKGROUND_JOBS", False)
+    monkeypatch.setattr(main, "job_manager", None)
+
+    with TestClient(main.app) as client:
+        response = client.get("/jobs/status")
+
+    assert response.status_code == 200
+    assert main.job_manager is None
+    assert "worker" in response.json()["error"]
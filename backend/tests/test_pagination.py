@@ -0,0 +1,103 @@
+"""Tests for keyset pagination helpers"""
+import pytest
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import (
+    cached_total,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+    split_page,
+)
+from app.models import Comment
+
+
+class TestCursor:
+    """Tests for cursor encoding"""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the sort key it was built from"""
+        created_at = datetime(2026, 10, 19, 8, 30, 15, 123456)
+        id = uuid.uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, id)) == (created_at, id)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "Zm9vfGJhcg"])
+    def test_invalid_cursor(self, cursor):
+        """Test that malformed cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestKeysetPage:
+    """Tests for keyset page queries"""
+
+    def test_first_page_has_no_offset(self):
+        """Test that the first page only orders and limits"""
+        stmt = keyset_page(select(Comment), Comment.created_at, Comment.id, limit=20)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "ORDER BY comments.created_at DESC, comments.id DESC" in sql
+        assert "OFFSET" not in sql
+        assert stmt._limit_clause.value == 21
+
+    def test_cursor_page_seeks_past_last_row(self):
+        """Test that later pages use a row comparison instead of OFFSET"""
+        cursor = encode_cursor(datetime(2026, 10, 19), uuid.uuid4())
+        stmt = keyset_page(select(Comment), Comment.created_at, Comment.id, 20, cursor)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "(comments.created_at, comments.id) < (" in sql
+        assert "OFFSET" not in sql
+
+    def test_split_page(self):
+        """Test that the look-ahead row is dropped and becomes the cursor"""
+        rows = [
+            SimpleNamespace(id=uuid.uuid4(), created_at=datetime(2026, 10, 19, 8, i))
+            for i in range(3)
+        ]
+
+        page, next_cursor = split_page(rows, limit=2)
+        assert page == rows[:2]
+        assert decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+
+        page, next_cursor = split_page(rows, limit=3)
+        assert page == rows
+        assert next_cursor is None
+
+
+class TestCachedTotal:
+    """Tests for cached totals"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_count(self):
+        """Test that a cached total is served without counting"""
+        db = AsyncMock()
+        redis_client = AsyncMock()
+        redis_client.get.return_value = b"42"
+
+        total = await cached_total(db, redis_client, "comments:*:*", select(Comment))
+
+        assert total == 42
+        assert not db.execute.called
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_counts_and_stores(self):
+        """Test that a missing total is counted once and cached"""
+        result = MagicMock()
+        result.scalar.return_value = 7
+        db = AsyncMock()
+        db.execute.return_value = result
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+
+        total = await cached_total(db, redis_client, "comments:*:*", select(Comment))
+
+        assert total == 7
+        assert redis_client.setex.await_args.args[0] == "total:comments:*:*"
@@ -0,0 +1,390 @@
+"""Tests for prediction API query patterns"""
+import pytest
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.predictions import _cast_vote, get_predictions, vote_on_prediction
+from app.core.pagination import decode_cursor
+from app.models import Prediction, User
+from app.schemas.vote import VoteCreate
+from app.services.feed_cache import prediction_feed
+from app.services.tick_store import Tick
+
+
+def make_user() -> User:
+    return User(
+        id=uuid.uuid4(),
+        username="trader",
+        email="trader@example.com",
+        password_hash="x",
+        created_at=datetime.utcnow(),
+        is_active=True,
+    )
+
+
+def make_prediction(author: User) -> Prediction:
+    return Prediction(
+        id=uuid.uuid4(),
+        user_id=author.id,
+        user=author,
+        symbol_code="XAUUSD",
+        question="Where will gold close today?",
+        options=[{"key": "A", "text": "Up"}, {"key": "B", "text": "Down"}],
+        price_at_create=2658.5,
+        verify_time=datetime.utcnow() + timedelta(hours=1),
+        verify_rule="auto",
+        status="active",
+        participants_count=3,
+        comments_count=0,
+        created_at=datetime.utcnow(),
+    )
+
+
+class QueryCountingSession:
+    """Fake AsyncSession that answers prediction list queries and counts them"""
+
+    def __init__(self, predictions, vote_counts, user_votes):
+        self.predictions = predictions
+        self.vote_counts = vote_counts
+        self.user_votes = user_votes
+        self.queries = 0
+        self.refreshes = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        columns = [c["name"] for c in stmt.column_descriptions]
+        result = MagicMock()
+
+        if columns == ["count"]:
+            result.scalar.return_value = len(self.predictions)
+        elif columns == ["id", "created_at"]:
+            result.all.return_value = [
+                SimpleNamespace(id=p.id, created_at=p.created_at) for p in self.predictions
+            ]
+        elif columns == ["Prediction"]:
+            result.scalars.return_value.all.return_value = self.predictions
+        elif columns == ["prediction_id", "option_key", "count"]:
+            result.all.return_value = self.vote_counts
+        elif columns == ["prediction_id", "selected_option"]:
+            result.all.return_value = self.user_votes
+        else:
+            raise AssertionError(f"Unexpected query: {columns}")
+
+        return result
+
+    async def refresh(self, *args, **kwargs):
+        self.refreshes += 1
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis calls used by the prediction cache"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def hmget(self, key, fields):
+        return [self.data.get(key, {}).get(f) for f in fields]
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def setex(self, key, ttl, value):
+                redis.data[key] = value
+
+            def hset(self, key, field=None, value=None, mapping=None):
+                mapping = mapping or {field: value}
+                redis.data.setdefault(key, {}).update(
+                    {f: v.encode() for f, v in mapping.items()}
+                )
+
+            def expire(self, key, ttl):
+                pass
+
+            async def execute(self):
+                pass
+
+        return Pipeline()
+
+
+class TestGetPredictions:
+    """Tests for GET /predictions"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page_size", [1, 20, 100])
+    async def test_query_count_is_constant(self, page_size):
+        """Test that the number of queries does not grow with the page size"""
+        author = make_user()
+        caller = make_user()
+        predictions = [make_prediction(author) for _ in range(page_size)]
+        first = predictions[0].id
+        db = QueryCountingSession(
+            predictions,
+            vote_counts=[(first, "A", 2), (first, "B", 1)],
+            user_votes=[(first, "B")],
+        )
+
+        response = await get_predictions(
+            status_filter=None,
+            symbol=None,
+            cursor=None,
+            page=1,
+            limit=page_size,
+            include_total=False,
+            current_user=caller,
+            db=db,
+            redis_client=None,
+        )
+
+        # page IDs + documents (users joined) + vote counts + caller votes
+        assert db.queries == 4
+        assert db.refreshes == 0
+        assert len(response.predictions) == page_size
+
+        enriched = response.predictions[0]
+        assert enriched.user.username == "trader"
+        assert enriched.vote_distribution["A"].count == 2
+        assert enriched.vote_distribution["A"].percentage == 66.67
+        assert enriched.user_voted is True
+        assert enriched.user_vote == "B"
+
+    @pytest.mark.asyncio
+    async def test_anonymous_caller_skips_vote_lookup(self):
+        """Test that no caller vote query runs for anonymous requests"""
+        predictions = [make_prediction(make_user()) for _ in range(5)]
+        db = QueryCountingSession(predictions, vote_counts=[], user_votes=[])
+
+        response = await get_predictions(
+            status_filter=None,
+            symbol=None,
+            cursor=None,
+            page=1,
+            limit=20,
+            include_total=False,
+            current_user=None,
+            db=db,
+            redis_client=None,
+        )
+
+        assert db.queries == 3
+        assert all(not p.user_voted for p in response.predictions)
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_serves_first_page_without_queries(self):
+        """Test that the cached first page, documents and overlays are shared across requests"""
+        author = make_user()
+        caller = make_user()
+        predictions = [make_prediction(author) for _ in range(5)]
+        first = predictions[0].id
+        db = QueryCountingSession(
+            predictions, vote_counts=[(first, "A", 2)], user_votes=[(first, "A")]
+        )
+        redis_client = FakeRedis()
+
+        async def fetch(user):
+            return await get_predictions(
+                status_filter=None,
+                symbol=None,
+                cursor=None,
+                page=1,
+                limit=20,
+                include_total=False,
+                current_user=user,
+                db=db,
+                redis_client=redis_client,
+            )
+
+        await fetch(caller)
+        db.queries = 0
+
+        anonymous = await fetch(None)
+        assert db.queries == 0
+        assert anonymous.predictions[0].user_voted is False
+        assert anonymous.predictions[0].vote_distribution["A"].count == 2
+
+        db.queries = 0
+        personal = await fetch(caller)
+        assert db.queries == 0
+        assert personal.predictions[0].user_vote == "A"
+        assert personal.predictions[1].user_voted is False
+
+    @pytest.mark.asyncio
+    async def test_first_page_requeried_after_invalidation(self):
+        """Test that the Redis copy outlives the L1 until an event drops it"""
+        predictions = [make_prediction(make_user()) for _ in range(3)]
+        db = QueryCountingSession(predictions, vote_counts=[], user_votes=[])
+        redis_client = FakeRedis()
+
+        async def fetch():
+            return await get_predictions(
+                status_filter=None,
+                symbol="XAUUSD",
+                cursor=None,
+                page=1,
+                limit=20,
+                include_total=False,
+                current_user=None,
+                db=db,
+                redis_client=redis_client,
+            )
+
+        await fetch()
+        prediction_feed.clear_local()
+        db.queries = 0
+
+        cached = await fetch()
+        assert db.queries == 0
+        assert [p.id for p in cached.predictions] == [p.id for p in predictions]
+
+        await prediction_feed.invalidate(redis_client, ["XAUUSD"])
+        await fetch()
+        assert db.queries == 1
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_from_look_ahead_row(self):
+        """Test that the extra fetched row produces a cursor and is dropped"""
+        predictions = [make_prediction(make_user()) for _ in range(3)]
+        db = QueryCountingSession(predictions, vote_counts=[], user_votes=[])
+
+        response = await get_predictions(
+            status_filter=None,
+            symbol=None,
+            cursor=None,
+            page=1,
+            limit=2,
+            include_total=False,
+            current_user=None,
+            db=db,
+            redis_client=None,
+        )
+
+        assert len(response.predictions) == 2
+        assert response.pagination["has_more"] is True
+        assert decode_cursor(response.pagination["next_cursor"]) == (
+            predictions[1].created_at, predictions[1].id
+        )
+        assert response.pagination["total"] is None
+
+
+class VoteSession:
+    """Fake AsyncSession answering the vote endpoint's statements in order"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        rows = self.results.pop(0)
+        result.one_or_none.return_value = rows
+        result.all.return_value = rows
+        if isinstance(rows, list):
+            result.first.return_value = rows[0] if rows else None
+        return result
+
+    async def commit(self):
+        self.commits += 1
+
+
+def vote_rows(counts, voted):
+    return [SimpleNamespace(option_key=key, count=count, voted=voted) for key, count in counts.items()]
+
+
+class TestCastVote:
+    """Tests for atomic vote casting"""
+
+    def test_vote_is_one_statement(self):
+        """Test that insert, counters and distribution form a single statement"""
+        stmt = _cast_vote(uuid.uuid4(), uuid.uuid4(), "A", Decimal("2658.5"), None, datetime.utcnow())
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH new_vote AS")
+        assert "ON CONFLICT (prediction_id, user_id) DO NOTHING" in sql
+        assert "ON CONFLICT (prediction_id, option_key, shard) DO UPDATE" in sql
+        # Votes never lock the prediction row
+        assert "UPDATE predictions" not in sql
+
+    @pytest.mark.asyncio
+    async def test_vote_returns_distribution_from_same_statement(self):
+        """Test that a vote needs one read and one write statement"""
+        author = make_user()
+        prediction = make_prediction(author)
+        session = VoteSession(
+            SimpleNamespace(
+                symbol_code=prediction.symbol_code,
+                options=prediction.options,
+                status="active",
+                verify_time=prediction.verify_time,
+            ),
+            vote_rows({"A": 3, "B": 1}, voted=True),
+        )
+        tick = Tick(symbol_code="XAUUSD", price=Decimal("2658.5"), timestamp=datetime.utcnow())
+
+        caller = make_user()
+        redis_client = FakeRedis()
+        redis_client.data[f"prediction:doc:{prediction.id}"] = "{}"
+
+        with patch("app.api.v1.predictions.tick_store.get_anchor", AsyncMock(return_value=tick)):
+            response = await vote_on_prediction(
+                prediction.id, VoteCreate(selected_option="A"), caller, session, redis_client
+            )
+
+        assert len(session.statements) == 2
+        assert session.commits == 1
+        assert response.participants_count == 4
+        assert response.vote_distribution["A"]["count"] == 3
+        assert response.vote_distribution["A"]["percentage"] == 75.0
+        # The shared document is invalidated and the caller's overlay updated
+        assert f"prediction:doc:{prediction.id}" not in redis_client.data
+        assert redis_client.data[f"prediction:votes:{caller.id}"] == {str(prediction.id): b"A"}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_vote_is_rejected(self):
+        """Test that a conflicting insert reports the existing vote"""
+        prediction = make_prediction(make_user())
+        session = VoteSession(
+            SimpleNamespace(
+                symbol_code=prediction.symbol_code,
+                options=prediction.options,
+                status="active",
+                verify_time=prediction.verify_time,
+            ),
+            vote_rows({"A": 3}, voted=False),
+            [(uuid.uuid4(),)],
+        )
+        tick = Tick(symbol_code="XAUUSD", price=Decimal("2658.5"), timestamp=datetime.utcnow())
+
+        with patch("app.api.v1.predictions.tick_store.get_anchor", AsyncMock(return_value=tick)):
+            with pytest.raises(HTTPException) as exc:
+                await vote_on_prediction(
+                    prediction.id, VoteCreate(selected_option="A"), make_user(), session, None
+                )
+
+        assert exc.value.detail == "You have already voted on this prediction"
@@ -0,0 +1,66 @@
+"""Tests for the price history repository"""
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from app.repositories.quote_repository import QuoteRepository
+
+
+class FakeSession:
+    """Async session returning canned rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.calls.append((stmt, params))
+        result = MagicMock()
+        result.all.return_value = self.rows
+        return result
+
+    async def commit(self):
+        pass
+
+
+class TestQuoteRepository:
+    """Tests for QuoteRepository"""
+
+    @pytest.mark.asyncio
+    async def test_prices_at_respects_max_gap(self):
+        """Test that ticks too far before the requested time are ignored"""
+        at = datetime(2024, 1, 1, 12, 0)
+        later = at + timedelta(hours=1)
+        session = FakeSession([
+            (at, Decimal("2650.00"), at - timedelta(seconds=30)),
+            (later, Decimal("2651.00"), at - timedelta(seconds=30)),
+        ])
+        repository = QuoteRepository(lambda: session)
+
+        prices = await repository.prices_at("XAUUSD", [at, later, at], max_gap_seconds=600)
+
+        assert prices == [Decimal("2650.00"), None, Decimal("2650.00")]
+        assert len(session.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_add_many_uses_one_statement(self):
+        """Test that a run's ticks are stored with one INSERT"""
+        session = FakeSession([])
+        repository = QuoteRepository(lambda: session)
+
+        await repository.add_many([
+            {"symbol_code": "XAUUSD", "price": 2650.0, "timestamp": datetime.utcnow(), "is_stale": False},
+            {"symbol_code": "XAGUSD", "price": 31.2, "timestamp": datetime.utcnow()},
+        ])
+
+        assert len(session.calls) == 1
+        rows = session.calls[0][1]
+        assert [row["symbol_code"] for row in rows] == ["XAUUSD", "XAGUSD"]
+        assert "is_stale" not in rows[0]
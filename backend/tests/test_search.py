@@ -0,0 +1,148 @@
+"""Tests for full-text search over comments and news"""
+import pytest
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.search import search_comments, search_news
+from app.core.pagination import decode_rank_cursor, encode_rank_cursor
+from app.core.text_search import tokenize
+from app.models import Comment, User
+from app.models.news import news_search_vector
+
+
+def make_comment(content: str) -> Comment:
+    author = User(
+        id=uuid.uuid4(),
+        username="trader",
+        email="trader@example.com",
+        password_hash="x",
+        created_at=datetime.utcnow(),
+        is_active=True,
+    )
+    return Comment(
+        id=uuid.uuid4(),
+        user_id=author.id,
+        user=author,
+        symbol_code="XAUUSD",
+        content=content,
+        price_at_comment=2658.5,
+        likes_count=0,
+        replies_count=0,
+        created_at=datetime.utcnow(),
+        is_deleted=False,
+    )
+
+
+class SearchSession:
+    """Fake AsyncSession returning ranked rows and recording the SQL"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        result = MagicMock()
+        result.all.return_value = self.rows
+        return result
+
+
+class TestTokenize:
+    """Tests for search term segmentation"""
+
+    def test_cjk_runs_become_characters_and_bigrams(self):
+        """Test that documents index characters and bigrams, queries bigrams"""
+        assert tokenize("黄金价格") == ["黄", "金", "价", "格", "黄金", "金价", "价格"]
+        assert tokenize("黄金价格", query=True) == ["黄金", "金价", "价格"]
+        assert tokenize("金", query=True) == ["金"]
+
+    def test_words_are_lowercased_and_split_on_punctuation(self):
+        """Test that mixed text yields words and CJK terms in order"""
+        assert tokenize("XAU/USD 突破 2,650!", query=True) == ["xau", "usd", "突破", "2", "650"]
+        assert tokenize("?!") == []
+
+    def test_every_query_term_is_indexed(self):
+        """Test that a phrase query matches the document it came from"""
+        document = "今天黄金价格大涨, Gold rallied"
+        assert set(tokenize("黄金价格 gold", query=True)) <= set(tokenize(document))
+
+
+class TestRankCursor:
+    """Tests for relevance cursors"""
+
+    def test_round_trip_keeps_rank_exact(self):
+        """Test that the rank survives the cursor bit for bit"""
+        row_id = uuid.uuid4()
+        rank = 0.06079271435737610
+
+        assert decode_rank_cursor(encode_rank_cursor(rank, row_id)) == (rank, row_id)
+
+    def test_invalid_cursor(self):
+        """Test that garbage cursors are rejected"""
+        with pytest.raises(ValueError):
+            decode_rank_cursor("not-a-cursor")
+
+
+class TestSearchComments:
+    """Tests for GET /search/comments"""
+
+    @pytest.mark.asyncio
+    async def test_uses_index_match_and_ranked_keyset(self):
+        """Test that search matches the tsvector and pages by (rank, id)"""
+        comments = [make_comment(f"黄金 {i}") for i in range(3)]
+        rows = [
+            SimpleNamespace(Comment=c, id=c.id, rank=1.0 - i / 10)
+            for i, c in enumerate(comments)
+        ]
+        session = SearchSession(rows)
+
+        response = await search_comments(
+            q="黄金", symbol="XAUUSD", cursor=None, limit=2, db=session
+        )
+
+        sql = session.statements[0]
+        assert "comments.search_vector @@ plainto_tsquery" in sql
+        assert "LIKE" not in sql
+        assert "ORDER BY ts_rank_cd(" in sql
+        assert [c.id for c in response.comments] == [comments[0].id, comments[1].id]
+        assert response.comments[1].rank == 0.9
+        assert decode_rank_cursor(response.pagination["next_cursor"]) == (0.9, comments[1].id)
+
+    @pytest.mark.asyncio
+    async def test_query_without_terms_is_rejected(self):
+        """Test that punctuation-only queries never reach the database"""
+        session = SearchSession([])
+
+        with pytest.raises(HTTPException) as exc:
+            await search_comments(q="!!", symbol=None, cursor=None, limit=20, db=session)
+
+        assert exc.value.status_code == 400
+        assert session.statements == []
+
+
+class TestSearchNews:
+    """Tests for GET /search/news"""
+
+    @pytest.mark.asyncio
+    async def test_cursor_continues_after_last_rank(self):
+        """Test that a cursor restricts the page to lower (rank, id)"""
+        session = SearchSession([])
+        cursor = encode_rank_cursor(0.5, uuid.uuid4())
+
+        response = await search_news(q="gold", category="gold", cursor=cursor, limit=20, db=session)
+
+        assert "(ts_rank_cd(news.search_vector" in session.statements[0]
+        assert response.news == []
+        assert response.pagination["has_more"] is False
+
+    def test_title_weighs_most(self):
+        """Test that title, summary and content get weights A, B and D"""
+        sql = str(news_search_vector("t", "s", "c").compile(dialect=postgresql.dialect()))
+
+        assert sql.count("setweight(to_tsvector(") == 3
+        assert "'A'" in sql and "'B'" in sql and "'D'" in sql
@@ -0,0 +1,103 @@
+"""Tests for set-based prediction settlement"""
+import pytest
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from app.repositories.settlement_repository import SettlementRepository, SettlementResult
+from app.services.scoring import rank_title, streak_bonus
+
+
+class FakeSession:
+    """Async session recording statements and returning canned results"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.statements = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def begin(self):
+        return self
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return self.results.pop(0) if self.results else MagicMock()
+
+
+def claimed(found: bool):
+    result = MagicMock()
+    result.first.return_value = (uuid.uuid4(),) if found else None
+    return result
+
+
+class TestSettlementRepository:
+    """Tests for SettlementRepository"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("vote_count", [1, 50000])
+    async def test_statement_count_is_constant(self, vote_count):
+        """Test that settlement runs four statements whatever the vote count"""
+        marked = MagicMock()
+        marked.rowcount = vote_count
+        session = FakeSession([claimed(True), marked])
+        repository = SettlementRepository(lambda: session)
+
+        result = await repository.settle(uuid.uuid4(), Decimal("2680.00"), "A")
+
+        assert len(session.statements) == 4
+        assert result.votes_settled == vote_count
+        assert result.votes == []
+
+    @pytest.mark.asyncio
+    async def test_returns_votes_for_notifications(self):
+        """Test that votes are returned by the vote update itself"""
+        user_id = uuid.uuid4()
+        row = MagicMock()
+        row._mapping = {"user_id": user_id, "selected_option": "A", "is_correct": True}
+        marked = MagicMock()
+        marked.all.return_value = [row]
+        session = FakeSession([claimed(True), marked])
+        repository = SettlementRepository(lambda: session)
+
+        result = await repository.settle(uuid.uuid4(), Decimal("2680.00"), "A", return_votes=True)
+
+        assert len(session.statements) == 4
+        assert result.votes_settled == 1
+        assert result.votes == [{"user_id": user_id, "selected_option": "A", "is_correct": True}]
+
+    @pytest.mark.asyncio
+    async def test_already_settled_prediction_is_skipped(self):
+        """Test that a prediction that is no longer active is not settled twice"""
+        session = FakeSession([claimed(False)])
+        repository = SettlementRepository(lambda: session)
+
+        result = await repository.settle(uuid.uuid4(), Decimal("2680.00"), "A")
+
+        assert result is None
+        assert len(session.statements) == 1
+
+
+class TestScoring:
+    """Tests for scoring rules"""
+
+    def test_streak_bonus(self):
+        """Test streak bonuses from the PRD"""
+        assert streak_bonus(1) == 0
+        assert streak_bonus(2) == 5
+        assert streak_bonus(3) == 10
+        assert streak_bonus(7) == 10
+
+    def test_rank_title(self):
+        """Test rank title thresholds"""
+        assert rank_title(5, 100) == "预测新手"
+        assert rank_title(10, 40) == "预测爱好者"
+        assert rank_title(30, 60) == "预测达人"
+        assert rank_title(50, 70) == "预测专家"
+        assert rank_title(100, 75) == "预测大师"
+        assert rank_title(200, 80) == "预测宗师"
+        assert rank_title(200, 65) == "预测达人"
@@ -0,0 +1,114 @@
+"""Tests for sharded counters"""
+import pytest
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.jobs.counter_rollup import ROLLUP_OVERLAP, CounterRollupJob
+from app.services.sharded_counter import ShardedCounter
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis calls used by ShardedCounter"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def setex(self, key, ttl, value):
+                redis.data[key] = str(value).encode()
+
+            async def execute(self):
+                pass
+
+        return Pipeline()
+
+
+class TestShardedCounter:
+    """Tests for ShardedCounter"""
+
+    def test_increment_spreads_over_shards(self):
+        """Test that increments target a random shard with one upsert"""
+        counter = ShardedCounter("comment_likes", shards=8)
+        entity_id = uuid.uuid4()
+
+        shards = {counter.increment(entity_id).compile().params["shard"] for _ in range(200)}
+        sql = compile_sql(counter.increment(entity_id, -1))
+
+        assert shards <= set(range(8)) and len(shards) > 1
+        assert "ON CONFLICT (name, entity_id, shard) DO UPDATE" in sql
+        assert "counter_shards.value + excluded.value" in sql
+
+    @pytest.mark.asyncio
+    async def test_totals_are_cached(self):
+        """Test that summed shards are served from Redis until they expire"""
+        counter = ShardedCounter("comment_likes", shards=8)
+        liked, unliked = uuid.uuid4(), uuid.uuid4()
+        result = MagicMock()
+        result.all.return_value = [(liked, 42)]
+        db = AsyncMock()
+        db.execute.return_value = result
+        redis_client = FakeRedis()
+
+        first = await counter.totals(db, [liked, unliked], redis_client)
+        second = await counter.totals(db, [liked, unliked], redis_client)
+
+        assert first == second == {liked: 42, unliked: 0}
+        assert db.execute.await_count == 1
+
+        await counter.totals(db, [liked], redis_client, fresh=True)
+        assert db.execute.await_count == 2
+
+
+class TestCounterRollupJob:
+    """Tests for CounterRollupJob"""
+
+    def test_rollup_only_touches_changed_counters(self):
+        """Test that incremental runs filter on shard updates"""
+        job = CounterRollupJob()
+
+        full = compile_sql(job._participants_stmt(None))
+        incremental = compile_sql(job._likes_stmt(datetime.utcnow()))
+
+        assert full.startswith("UPDATE predictions SET participants_count=")
+        assert "updated_at >=" not in full
+        assert incremental.startswith("UPDATE comments SET likes_count=")
+        assert "counter_shards.entity_id IN (SELECT DISTINCT counter_shards.entity_id" in incremental
+        assert "counter_shards.updated_at >=" in incremental
+        assert "HAVING" not in incremental
+
+    @pytest.mark.asyncio
+    async def test_next_run_starts_from_the_database_clock(self):
+        """Test that the next run's cutoff is the database time minus the overlap"""
+        db_now = datetime(2024, 3, 1, 12, 0)
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        session.begin.return_value = session
+        session.scalar = AsyncMock(return_value=db_now)
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+
+        job = CounterRollupJob(session_factory=lambda: session)
+        await job.execute()
+
+        assert "timezone(" in compile_sql(session.scalar.await_args.args[0])
+        assert job._since == db_now - ROLLUP_OVERLAP
+        assert job.status_details() == {"rolled_up": 4}
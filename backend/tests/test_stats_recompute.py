@@ -0,0 +1,107 @@
+"""Tests for the user stats recomputation"""
+import random
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+from sqlalchemy.dialects import postgresql
+
+from app.jobs.stats_recompute import StatsRecomputeJob
+from app.services.scoring import SCORE_CORRECT, rank_title, streak_bonus
+from app.services.stats_recompute import StatsAccumulator, run_lengths
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def replay(votes):
+    """Per-user stats applying votes one at a time, as settlement does"""
+    stats = {}
+    for user_id, correct in votes:
+        s = stats.setdefault(user_id, {"p": 0, "c": 0, "cur": 0, "max": 0, "score": 0})
+        s["p"] += 1
+        if correct:
+            s["c"] += 1
+            s["cur"] += 1
+            s["score"] += SCORE_CORRECT + streak_bonus(s["cur"])
+        else:
+            s["cur"] = 0
+        s["max"] = max(s["max"], s["cur"])
+    return stats
+
+
+class TestRunLengths:
+    """Tests for run_lengths"""
+
+    def test_streaks_restart_per_user_and_after_misses(self):
+        """Test run lengths within and across users"""
+        correct = np.array([1, 1, 0, 1, 1, 1, 1])
+        starts = np.array([True, False, False, False, True, False, False])
+
+        assert run_lengths(correct, starts).tolist() == [1, 2, 0, 1, 1, 2, 3]
+
+    def test_carry_extends_first_run_only(self):
+        """Test that a carried streak only continues the unbroken prefix"""
+        correct = np.array([1, 1, 0, 1])
+        starts = np.array([True, False, False, False])
+
+        assert run_lengths(correct, starts, carry=4).tolist() == [5, 6, 0, 1]
+
+
+class TestStatsAccumulator:
+    """Tests for StatsAccumulator"""
+
+    def test_matches_incremental_settlement_across_chunks(self):
+        """Test that chunked results equal replaying votes one by one"""
+        rng = random.Random(7)
+        users = sorted(uuid.uuid4() for _ in range(12))
+        votes = [
+            (user_id, rng.random() < 0.7)
+            for user_id in users
+            for _ in range(rng.randint(1, 40))
+        ]
+
+        accumulator = StatsAccumulator()
+        rows = []
+        for start in range(0, len(votes), 17):
+            chunk = votes[start:start + 17]
+            rows += accumulator.add([v[0] for v in chunk], [v[1] for v in chunk])
+        rows += accumulator.finish()
+
+        expected = replay(votes)
+        assert [row["user_id"] for row in rows] == users
+        for row in rows:
+            e = expected[row["user_id"]]
+            accuracy = (Decimal(e["c"] * 100) / e["p"]).quantize(Decimal("0.01"))
+            assert (
+                row["total_participations"], row["correct_count"], row["current_streak"],
+                row["max_streak"], row["prediction_score"], row["accuracy_rate"],
+            ) == (e["p"], e["c"], e["cur"], e["max"], e["score"], accuracy)
+            assert row["rank_title"] == rank_title(e["p"], float(accuracy))
+
+
+class TestStatsRecomputeJob:
+    """Tests for StatsRecomputeJob"""
+
+    def test_votes_streamed_by_user_in_settlement_order(self):
+        """Test the streaming query"""
+        sql = compile_sql(StatsRecomputeJob()._votes_stmt())
+
+        assert "predictions.status = %(status_1)s" in sql
+        assert "ORDER BY votes.user_id, predictions.verify_time, predictions.id" in sql
+
+    def test_upsert_skips_rows_changed_during_run(self):
+        """Test that recently settled users are not overwritten"""
+        rows = [{
+            "user_id": uuid.uuid4(), "total_participations": 1, "correct_count": 1,
+            "accuracy_rate": Decimal("100"), "current_streak": 1, "max_streak": 1,
+            "prediction_score": 10, "rank_title": "预测新手",
+        }]
+
+        sql = compile_sql(StatsRecomputeJob()._upsert_stmt(rows, datetime.utcnow()))
+
+        assert "ON CONFLICT (user_id) DO UPDATE SET total_participations = excluded.total_participations" in sql
+        assert "total_predictions =" not in sql.split("DO UPDATE")[1]
+        assert "WHERE user_prediction_stats.updated_at <" in sql
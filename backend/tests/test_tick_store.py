@@ -0,0 +1,83 @@
+"""Tests for the latest-tick store"""
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.config import settings
+from app.services.tick_store import TickStore
+
+
+def make_calendar(open_markets=("LBMA", "FOREX", "CRYPTO")):
+    calendar = MagicMock()
+    calendar.is_open.side_effect = lambda market, at=None: market in open_markets
+    return calendar
+
+
+class TestTickStore:
+    """Tests for TickStore"""
+
+    @pytest.mark.asyncio
+    async def test_update_and_get_in_memory(self):
+        """Test that a fed process reads ticks from memory"""
+        store = TickStore(calendar=make_calendar())
+        redis_client = AsyncMock()
+
+        await store.update("XAUUSD", {"price": 2658.5}, redis_client, market="LBMA")
+        tick = await store.get("XAUUSD", redis_client)
+
+        assert tick.price == Decimal("2658.5")
+        assert tick.market == "LBMA"
+        assert redis_client.hset.called
+        redis_client.expire.assert_awaited_with("tick:XAUUSD", settings.TICK_TTL_SECONDS)
+        assert not redis_client.hgetall.called
+
+    @pytest.mark.asyncio
+    async def test_get_reads_redis_when_not_fed_locally(self):
+        """Test that API workers read ticks shared by the job worker"""
+        store = TickStore(calendar=make_calendar())
+        observed_at = datetime.utcnow()
+        redis_client = AsyncMock()
+        redis_client.hgetall.return_value = {
+            b"price": b"1.0845",
+            b"timestamp": observed_at.isoformat().encode(),
+            b"market": b"FOREX",
+        }
+
+        tick = await store.get("EURUSD", redis_client)
+
+        redis_client.hgetall.assert_awaited_with("tick:EURUSD")
+        assert tick.price == Decimal("1.0845")
+        assert tick.timestamp == observed_at
+        assert tick.market == "FOREX"
+
+    @pytest.mark.asyncio
+    async def test_anchor_rejects_stale_tick_while_open(self):
+        """Test that an old tick cannot anchor while the market trades"""
+        store = TickStore(calendar=make_calendar())
+        old = datetime.utcnow() - timedelta(seconds=settings.PRICE_ANCHOR_MAX_AGE_SECONDS + 5)
+
+        await store.update("XAUUSD", {"price": 2658.5, "timestamp": old}, market="LBMA")
+
+        assert await store.get_anchor("XAUUSD") is None
+
+    @pytest.mark.asyncio
+    async def test_anchor_accepts_closing_tick_while_closed(self):
+        """Test that the last tick stays valid while the market is closed"""
+        store = TickStore(calendar=make_calendar(open_markets=()))
+        old = datetime.utcnow() - timedelta(hours=6)
+
+        await store.update("XAUUSD", {"price": 2658.5, "timestamp": old}, market="LBMA")
+        tick = await store.get_anchor("XAUUSD")
+
+        assert tick is not None
+        assert tick.timestamp == old
+
+    @pytest.mark.asyncio
+    async def test_anchor_missing_symbol(self):
+        """Test that unknown symbols have no anchor"""
+        store = TickStore(calendar=make_calendar())
+        redis_client = AsyncMock()
+        redis_client.hgetall.return_value = {}
+
+        assert await store.get_anchor("XAUUSD", redis_client) is None
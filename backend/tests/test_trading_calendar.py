@@ -0,0 +1,61 @@
+"""Tests for the trading calendar"""
+from datetime import date, datetime
+
+from app.services.trading_calendar import TradingCalendar
+
+
+class TestTradingCalendar:
+    """Tests for TradingCalendar"""
+
+    def test_forex_closed_on_weekend(self):
+        """Test that FX is closed on Saturday and open mid-week"""
+        calendar = TradingCalendar()
+
+        assert calendar.is_open("FOREX", datetime(2026, 10, 17, 12, 0)) is False  # Saturday
+        assert calendar.is_open("FOREX", datetime(2026, 10, 14, 12, 0)) is True  # Wednesday
+
+    def test_forex_opens_sunday_evening_new_york(self):
+        """Test that FX opens at 17:00 New York time on Sunday"""
+        calendar = TradingCalendar()
+
+        # 17:00 EDT == 21:00 UTC
+        assert calendar.is_open("FOREX", datetime(2026, 10, 18, 20, 59)) is False
+        assert calendar.is_open("FOREX", datetime(2026, 10, 18, 21, 0)) is True
+
+    def test_metals_daily_break(self):
+        """Test the one-hour daily break for spot metals"""
+        calendar = TradingCalendar()
+
+        # 17:30 EDT == 21:30 UTC on a Monday
+        assert calendar.is_open("LBMA", datetime(2026, 10, 19, 21, 30)) is False
+        assert calendar.is_open("LBMA", datetime(2026, 10, 19, 22, 30)) is True
+
+    def test_sge_sessions(self):
+        """Test SGE day, lunch break and night sessions (UTC+8)"""
+        calendar = TradingCalendar()
+
+        assert calendar.is_open("SGE", datetime(2026, 10, 19, 2, 0)) is True  # 10:00 CST
+        assert calendar.is_open("SGE", datetime(2026, 10, 19, 4, 0)) is False  # 12:00 CST
+        assert calendar.is_open("SGE", datetime(2026, 10, 19, 17, 0)) is True  # 01:00 CST Tue
+
+    def test_crypto_and_unknown_markets_always_open(self):
+        """Test that 24/7 and unknown markets never close"""
+        calendar = TradingCalendar()
+        saturday = datetime(2026, 10, 17, 12, 0)
+
+        assert calendar.is_open("CRYPTO", saturday) is True
+        assert calendar.is_open("UNKNOWN", saturday) is True
+
+    def test_holidays(self):
+        """Test recurring and configured holidays"""
+        calendar = TradingCalendar(holidays={"SGE": [date(2026, 2, 17)]})
+
+        assert calendar.is_open("FOREX", datetime(2026, 12, 25, 12, 0)) is False
+        assert calendar.is_open("SGE", datetime(2026, 2, 17, 2, 0)) is False
+
+    def test_market_status(self):
+        """Test status strings used in quote responses"""
+        calendar = TradingCalendar()
+
+        assert calendar.market_status("FOREX", datetime(2026, 10, 14, 12, 0)) == "trading"
+        assert calendar.market_status("FOREX", datetime(2026, 10, 17, 12, 0)) == "closed"